@@ -2,3 +2,5 @@ from .event import EventViewSet
 from .category import CategoryViewSet
 from .calendar import CalendarViewSet
 from .layout import CalendarLayoutViewSet
+from .sync import SyncViewSet
+from .feed_token import FeedTokenViewSet
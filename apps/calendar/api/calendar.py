@@ -1,23 +1,29 @@
 from django.utils import timezone
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from ..models.calendar import Calendar
 from ..serializers.calendar import (
     CalendarCreateSerializer,
     CalendarUpdateSerializer,
-    CalendarResponseSerializer
+    CalendarResponseSerializer,
+    CalendarMonthQuerySerializer
 )
+from ..services.month_grid import VISIBILITY_ALL, VISIBILITY_PUBLISHED, get_month_grid
 from rest_framework.permissions import IsAuthenticated
+from .feed import IcsFeedMixin
 
-class CalendarViewSet(viewsets.ModelViewSet):
+class CalendarViewSet(IcsFeedMixin, viewsets.ModelViewSet):
     queryset = Calendar.objects.all()
     permission_classes = [IsAuthenticated] 
     lookup_field = 'ukid'
 
     def get_queryset(self): # type: ignore
         user = self.request.user
+        queryset = Calendar.objects.all()
         if  user.is_staff or user.is_superuser:
-            return Calendar.objects.all()
-        return Calendar.objects.filter(end_date__gte=timezone.now().date())
+            return queryset
+        return queryset.filter(end_date__gte=timezone.now().date())
     
     def get_serializer_class(self): # type: ignore
         if self.action == 'create':
@@ -26,4 +32,18 @@ class CalendarViewSet(viewsets.ModelViewSet):
             return CalendarUpdateSerializer
         return CalendarResponseSerializer
 
+    @action(detail=True, methods=['get'])
+    def month(self, request, ukid=None):
+        """The month grid (``?month=YYYY-MM``): each day with its event count,
+        up to a few event references and the overflow, plus the referenced
+        events in compact form. Served from cache until an event in the
+        month changes."""
+        params = CalendarMonthQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        month = params.validated_data.get('month') or timezone.now().date().replace(day=1)
+
+        user = request.user
+        visibility = VISIBILITY_ALL if user.is_staff or user.is_superuser else VISIBILITY_PUBLISHED
+        return Response(get_month_grid(self.get_object(), month, visibility))
+
     #TODO: Add calendar layout for managing how the calendar view shows the calendar and the events.
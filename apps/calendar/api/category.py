@@ -6,12 +6,13 @@ from ..serializers.category import (
     CategoryResponseSerializer
 )
 from rest_framework.permissions import IsAuthenticated
+from .feed import IcsFeedMixin
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(IcsFeedMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     permission_classes = [IsAuthenticated]
     lookup_field = 'ukid'
-    
+
     def get_serializer_class(self): # type: ignore
         if self.action == 'create':
             return CategoryCreateSerializer
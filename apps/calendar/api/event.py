@@ -1,61 +1,215 @@
-from rest_framework import viewsets
+from django.utils import timezone
+from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
-from django.db.models import Count
-from django.utils import timezone
-from datetime import timedelta
-from ..models.event import Event, EventStatus
+from ..models.event import Event, EventStatus, RecurrenceFrequency
+from ..pagination import KeysetCursorPagination
 from ..serializers.event import (
     EventCreateSerializer,
     EventUpdateSerializer,
-    EventResponseSerializer
+    EventResponseSerializer,
+    EventRangeQuerySerializer,
+    EventDayQuerySerializer,
+    EventFreeBusyQuerySerializer,
+    EventUpcomingQuerySerializer,
+    EventAnalyticsQuerySerializer,
+    EventSearchQuerySerializer,
+    EventImportSerializer,
+    EventTransitionSerializer,
+    EventCompactSerializer,
+    OccurrenceCompactSerializer,
+    ConflictSerializer
 )
-from rest_framework.permissions import IsAuthenticated
+from ..services.event_window import overlapping
+from ..services.recurrence import expand_window, recurring_in_window
+from ..services.analytics import get_analytics
+from ..services.event_import import import_events
+from ..services.conflicts import conflict_report
+from ..services.event_days import events_on
+from ..services.free_busy import get_free_busy
+from ..services.transitions import transition_events
+from ..services.upcoming import get_upcoming
+from ..services.search import search_events
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 
 class EventViewSet(viewsets.ModelViewSet):
     queryset = Event.objects.all()
     permission_classes = [IsAuthenticated]
     lookup_field = 'ukid'
-    filterset_fields = ['category', 'type', 'calendar', 'start_date', 'end_date']
+    pagination_class = KeysetCursorPagination
     
     def get_serializer_class(self): # type: ignore
         if self.action == 'create':
             return EventCreateSerializer
         elif self.action in ['update', 'partial_update']:
             return EventUpdateSerializer
+        elif self.action == 'bulk_import':
+            return EventImportSerializer
+        elif self.action == 'transition':
+            return EventTransitionSerializer
         return EventResponseSerializer
     
     def get_queryset(self): # type: ignore
         user = self.request.user
-        if not user.is_staff or user.is_superuser:
-            return Event.objects.all()
-        return Event.objects.filter(status=EventStatus.PUBLISHED)
+        queryset = Event.objects.select_related('category', 'calendar')
+        if user.is_staff or user.is_superuser:
+            return queryset
+        return queryset.filter(status=EventStatus.PUBLISHED)
+
+    def filter_range(self, filters):
+        """The visible events narrowed by validated ``EventRangeQuerySerializer`` filters."""
+        queryset = self.get_queryset()
+        if filters.get('calendar'):
+            queryset = queryset.filter(calendar__ukid=filters['calendar'])
+        if filters.get('category'):
+            queryset = queryset.filter(category__ukid=filters['category'])
+        if filters.get('status'):
+            queryset = queryset.filter(status__in=filters['status'])
+        return queryset
+
+    @action(detail=False, methods=['get'], url_path='range')
+    def in_range(self, request):
+        """Events overlapping ``?from=&to=``, optionally scoped by calendar,
+        category (ukids) and comma-separated status, in a compact shape.
+        Recurring events are expanded into their occurrences in the window."""
+        params = EventRangeQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        occurrences = expand_window(self.filter_range(filters), filters['from'], filters['to'])
+        return Response(OccurrenceCompactSerializer(occurrences, many=True).data)
+
+    @action(detail=False, methods=['get'])
+    def day(self, request):
+        """Events on ``?date=`` (default today), with the same optional
+        filters as the range endpoint, in a compact shape ordered by start
+        time. Served from the per-day table by equality on the day."""
+        params = EventDayQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+        day = filters.get('date') or timezone.localdate()
+
+        day_filters = {}
+        if filters.get('calendar'):
+            day_filters['calendar__ukid'] = filters['calendar']
+        if filters.get('category'):
+            day_filters['category__ukid'] = filters['category']
+        if filters.get('status'):
+            day_filters['status__in'] = filters['status']
+        if not (request.user.is_staff or request.user.is_superuser):
+            day_filters['status'] = EventStatus.PUBLISHED
+
+        occurrences = events_on(self.filter_range(filters), day, **day_filters)
+        return Response(OccurrenceCompactSerializer(occurrences, many=True).data)
+
+    @action(detail=False, methods=['get'])
+    def upcoming(self, request):
+        """The next ``?limit=`` published events (occurrences, for recurring
+        ones) yet to start, optionally within ``?calendar=`` and
+        ``?category=`` (ukids), in a compact shape. Cached briefly."""
+        params = EventUpcomingQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+        return Response(get_upcoming(data['limit'], data.get('calendar'), data.get('category')))
+
+    @action(detail=False, methods=['get'])
+    def conflicts(self, request):
+        """Clashes (same location or organizer, overlapping dates and times)
+        between the events in ``?from=&to=``, with the same optional filters
+        as the range endpoint."""
+        params = EventRangeQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        conflicts = conflict_report(self.filter_range(filters), filters['from'], filters['to'])
+        return Response(ConflictSerializer(conflicts, many=True).data)
+
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """Visible events matching every word of ``?q=`` as a prefix in their
+        title, description, organizer or location, best matches first."""
+        params = EventSearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        events = search_events(self.get_queryset(), data['q'], data['limit'])
+        return Response(EventCompactSerializer(events, many=True).data)
+
+    @action(detail=False, methods=['get'], url_path='free-busy')
+    def free_busy(self, request):
+        """Busy blocks and free slots of each ``?location=`` and
+        ``?organizer=`` (repeatable) over ``?from=&to=``, optionally within
+        ``?day_start=&day_end=`` working hours. Cancelled events never
+        block a slot."""
+        params = EventFreeBusyQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        user = request.user
+        return Response(get_free_busy(
+            data['resources'], data['from'], data['to'], data.get('day_start'), data.get('day_end'),
+            published_only=not (user.is_staff or user.is_superuser),
+        ))
 
     @action(detail=False, methods=['get'])
     def analytics(self, request):
-        total_events = Event.objects.count()
-        
-        # Upcoming events (next 30 days)
-        today = timezone.now().date()
-        thirty_days_later = today + timedelta(days=30)
-        upcoming_events = Event.objects.filter(
-            start_date__gte=today,
-            start_date__lte=thirty_days_later
-        ).count()
-
-        # Events by category
-        events_by_category = Event.objects.values('category__name').annotate(
-            count=Count('id')
-        ).order_by('-count')
-
-        # Events by status
-        events_by_status = Event.objects.values('status').annotate(
-            count=Count('id')
-        ).order_by('-count')
+        """Event counts overall, upcoming (30 days), by category and by status.
+        Optionally scoped with ``?from=&to=`` and ``?calendar=<ukid>``."""
+        params = EventAnalyticsQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+        return Response(get_analytics(filters.get('from'), filters.get('to'), filters.get('calendar')))
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser, FormParser],
+            permission_classes=[IsAuthenticated, IsAdminUser])
+    def bulk_import(self, request):
+        """Create events in bulk from a CSV or ICS upload. Valid rows are
+        created in one transaction; invalid rows are reported by row number.
+        Staff only."""
+        params = EventImportSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        try:
+            report = import_events(
+                data['file'], data['format'],
+                category=data.get('category'), calendar=data.get('calendar'),
+                user_id=request.user.id, dry_run=data['dry_run'],
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if report['created']:
+            return Response(report, status=status.HTTP_201_CREATED)
+        if report['errors']:
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report)
+
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, IsAdminUser])
+    def transition(self, request):
+        """Publish, postpone or cancel the events listed in ``events``
+        (ukids) and/or matching the calendar, category, status and
+        ``from``/``to`` filters, with one UPDATE. Returns the ukids changed;
+        events already in the target status are skipped, unless postponed
+        to another ``postponed_to``. Staff only."""
+        params = EventTransitionSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        queryset = self.filter_range(data)
+        if data.get('events'):
+            queryset = queryset.filter(ukid__in=data['events'])
+        if data.get('from'):
+            plain = overlapping(queryset.filter(recurrence_frequency=RecurrenceFrequency.NONE), data['from'], data['to'])
+            queryset = plain | recurring_in_window(queryset, data['from'], data['to'])
 
+        try:
+            events = transition_events(queryset, data['action'], request.user.id, data.get('postponed_to'))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response({
-            'total_events': total_events,
-            'upcoming_events': upcoming_events,
-            'events_by_category': events_by_category,
-            'events_by_status': events_by_status
+            'action': data['action'],
+            'updated': len(events),
+            'events': [str(event.ukid) for event in events],
         })
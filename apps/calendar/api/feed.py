@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.decorators import action
+from rest_framework.settings import api_settings
+from ..models.event import EventStatus
+from ..models.feed_token import FeedToken, hash_feed_secret
+from ..services.ics_feed import feed_validators, iter_feed
+
+FEED_TOKEN_PARAM = 'token'
+# How stale ``FeedToken.last_used_at`` may get before a poll rewrites it
+FEED_TOKEN_TOUCH_INTERVAL = timedelta(hours=1)
+
+
+class FeedTokenAuthentication(BaseAuthentication):
+    """
+    Authenticates feed polls by the ``?token=`` secret of a ``FeedToken``,
+    for calendar apps that subscribe to a URL and cannot send headers.
+    Only the ``feed`` actions accept it.
+    """
+    def authenticate(self, request):
+        secret = request.query_params.get(FEED_TOKEN_PARAM)
+        if not secret:
+            return None
+        token = FeedToken.objects.select_related('user').filter(key_hash=hash_feed_secret(secret)).first()
+        if token is None or not token.user.is_active:
+            raise exceptions.AuthenticationFailed('Invalid or revoked feed token.')
+
+        now = timezone.now()
+        if token.last_used_at is None or now - token.last_used_at > FEED_TOKEN_TOUCH_INTERVAL:
+            FeedToken.objects.filter(pk=token.pk).update(last_used_at=now)
+        return token.user, token
+
+
+class IcsFeedMixin:
+    """
+    Adds ``<ukid>/feed/``: an iCalendar subscription feed of the object's
+    events. Polls of an unchanged feed are answered with 304 from one
+    aggregate query. Besides the usual authentication, the feed accepts a
+    ``?token=`` feed secret (see ``FeedTokenViewSet``), so the URL can be
+    subscribed to directly.
+    """
+    def feed_name(self, obj):
+        return str(obj)
+
+    @action(detail=True, methods=['get'],
+            authentication_classes=[*api_settings.DEFAULT_AUTHENTICATION_CLASSES, FeedTokenAuthentication])
+    def feed(self, request, ukid=None):
+        obj = self.get_object()
+        user = request.user
+        events = obj.events.all()
+        variant = 'all'
+        if not (user.is_staff or user.is_superuser):
+            events = events.filter(status=EventStatus.PUBLISHED)
+            variant = EventStatus.PUBLISHED
+
+        etag, last_modified = feed_validators(events, obj, variant)
+        last_modified = int(last_modified.timestamp()) if last_modified else None
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = StreamingHttpResponse(iter_feed(events, self.feed_name(obj)),
+                                         content_type='text/calendar; charset=utf-8')
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        response['Content-Disposition'] = f'inline; filename="{obj.ukid}.ics"'
+        return response
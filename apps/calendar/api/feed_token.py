@@ -0,0 +1,26 @@
+from rest_framework import mixins, viewsets, permissions, status
+from rest_framework.response import Response
+from apps.calendar.models import FeedToken
+from apps.calendar.serializers.feed_token import FeedTokenSerializer
+
+class FeedTokenViewSet(mixins.ListModelMixin,
+                       mixins.CreateModelMixin,
+                       mixins.DestroyModelMixin,
+                       viewsets.GenericViewSet):
+    """
+    The user's ICS feed secrets. Creating one answers its ``secret`` once;
+    append it as ``?token=<secret>`` to a calendar's or category's
+    ``feed/`` URL to subscribe. Deleting a token revokes it.
+    """
+    serializer_class = FeedTokenSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    lookup_field = 'ukid'
+
+    def get_queryset(self):
+        return FeedToken.objects.filter(user=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        token, secret = FeedToken.issue(request.user, serializer.validated_data.get('name', ''))
+        return Response({**self.get_serializer(token).data, 'secret': secret}, status=status.HTTP_201_CREATED)
@@ -1,6 +1,10 @@
-from rest_framework import viewsets, permissions
+from django.utils.cache import get_conditional_response
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from apps.calendar.models import CalendarLayout
 from apps.calendar.serializers.layout import CalendarLayoutSerializer
+from apps.calendar.services.layouts import active_layout
 
 class CalendarLayoutViewSet(viewsets.ModelViewSet):
     serializer_class = CalendarLayoutSerializer
@@ -11,3 +15,24 @@ class CalendarLayoutViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+
+    @action(detail=False, methods=['get'])
+    def active(self, request):
+        """The user's active layout, served from cache with an ETag; answers
+        304 to a matching ``If-None-Match``."""
+        entry = active_layout(request.user.pk)
+        if entry is None:
+            return Response({"error": "No active layout"}, status=status.HTTP_404_NOT_FOUND)
+        not_modified = get_conditional_response(request, etag=entry['etag'])
+        if not_modified is not None:
+            return not_modified
+        response = Response(entry['layout'])
+        response['ETag'] = entry['etag']
+        return response
+
+    @action(detail=True, methods=['post'])
+    def activate(self, request, pk=None):
+        """Make this the user's active layout in one atomic swap."""
+        layout = self.get_object()
+        layout.activate()
+        return Response(self.get_serializer(layout).data)
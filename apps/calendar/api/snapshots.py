@@ -0,0 +1,34 @@
+import os
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from ..services.snapshots import SNAPSHOT_MAX_AGE, SNAPSHOT_ROOT, SNAPSHOT_STALE_SECONDS
+
+def snapshot_file(request, path):
+    """Serve a public snapshot (see ``services.snapshots``) with an ETag and
+    long cache headers, reading nothing but the file. Production setups
+    should let the web server serve ``CALENDAR_SNAPSHOT_ROOT`` directly with
+    the same headers; this covers deployments without one in front."""
+    if not SNAPSHOT_ROOT or not path.endswith('.json'):
+        raise Http404
+    try:
+        file = open(safe_join(SNAPSHOT_ROOT, path), 'rb')
+    except (SuspiciousFileOperation, OSError):
+        raise Http404
+
+    stat = os.fstat(file.fileno())
+    # Same shape as the ETags nginx derives from mtime and size
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    response = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if response is None:
+        response = FileResponse(file, content_type='application/json')
+        response['Last-Modified'] = http_date(stat.st_mtime)
+    else:
+        file.close()
+    response['ETag'] = etag
+    patch_cache_control(
+        response, public=True, max_age=SNAPSHOT_MAX_AGE, stale_while_revalidate=SNAPSHOT_STALE_SECONDS,
+    )
+    return response
@@ -0,0 +1,59 @@
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models.event import EventStatus
+from ..models.tombstone import SyncKind
+from ..serializers.sync import (
+    SyncQuerySerializer,
+    CalendarSyncSerializer,
+    CategorySyncSerializer,
+    EventSyncSerializer
+)
+from ..services.sync import SYNC_PAGE_SIZE, CursorExpired, read_changes
+
+SYNC_SERIALIZERS = {
+    SyncKind.CALENDARS: CalendarSyncSerializer,
+    SyncKind.CATEGORIES: CategorySyncSerializer,
+    SyncKind.EVENTS: EventSyncSerializer,
+}
+
+class SyncViewSet(viewsets.ViewSet):
+    """Change feed for clients keeping a local copy of calendars, categories
+    and events (see ``services.sync``)."""
+    permission_classes = [IsAuthenticated]
+
+    def get_visibility(self):
+        """What a non-staff user may see, matching the list endpoints."""
+        user = self.request.user
+        if user.is_staff or user.is_superuser:
+            return {}
+        return {
+            SyncKind.CALENDARS: Q(end_date__gte=timezone.now().date()),
+            SyncKind.EVENTS: Q(status=EventStatus.PUBLISHED),
+        }
+
+    def list(self, request):
+        """Records changed and ukids deleted since ``?cursor=``, with the
+        cursor to send next time. While ``has_more`` is true, call again
+        right away with the new cursor. A 410 means the cursor is too old:
+        drop the local store and start over without one."""
+        params = SyncQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = params.validated_data
+
+        try:
+            changes = read_changes(
+                data.get('cursor'), self.get_visibility(), data.get('page_size', SYNC_PAGE_SIZE),
+            )
+        except CursorExpired as e:
+            return Response({"error": str(e)}, status=status.HTTP_410_GONE)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = {
+            kind: SYNC_SERIALIZERS[kind](rows, many=True).data for kind, rows in changes['changed'].items()
+        }
+        response.update(deleted=changes['deleted'], cursor=changes['cursor'], has_more=changes['has_more'])
+        return Response(response)
@@ -9,5 +9,12 @@ class CalendarConfig(AppConfig):
         """Import signal handlers."""
         try:
             import apps.calendar.signals.event_remainder  
+            import apps.calendar.signals.recurrence
+            import apps.calendar.signals.cache_invalidation
+            import apps.calendar.signals.tombstones
+            import apps.calendar.signals.event_days
+            import apps.calendar.signals.layout_cache
+            import apps.calendar.signals.snapshots
+            import apps.calendar.signals.event_counts
         except ImportError:
             pass
\ No newline at end of file
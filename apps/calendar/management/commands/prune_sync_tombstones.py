@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.calendar.services.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = "Delete sync tombstones older than CALENDAR_SYNC_TOMBSTONE_DAYS."
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} tombstones"))
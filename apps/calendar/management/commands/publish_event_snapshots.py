@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.calendar.services.snapshots import SNAPSHOT_ROOT, publish_snapshots
+
+
+class Command(BaseCommand):
+    help = "Regenerate every public event snapshot (run daily, as the snapshots depend on the date)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--root', default=SNAPSHOT_ROOT,
+                            help="Directory to write to (default: CALENDAR_SNAPSHOT_ROOT)")
+
+    def handle(self, *args, **options):
+        if not options['root']:
+            raise CommandError("Set CALENDAR_SNAPSHOT_ROOT or pass --root.")
+        changed = publish_snapshots(root=options['root'])
+        self.stdout.write(self.style.SUCCESS(f"Updated {changed} snapshot files in {options['root']}"))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from apps.calendar.services.event_days import rebuild_event_days
+
+
+class Command(BaseCommand):
+    help = "Repopulate the per-day rows of non-recurring events from the events table."
+
+    def handle(self, *args, **options):
+        rows = rebuild_event_days()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {rows} event days"))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from apps.calendar.services.search import fts_available, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Repopulate the full-text search index of events from the events table."
+
+    def handle(self, *args, **options):
+        if not fts_available():
+            self.stdout.write("No FTS5 search index on this database; search uses the fallback.")
+            return
+        indexed = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} events"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from apps.calendar.services.event_counts import reconcile_event_counts
+
+
+class Command(BaseCommand):
+    help = "Recount the events of every calendar and category, correcting drifted counters."
+
+    def handle(self, *args, **options):
+        corrected = reconcile_event_counts()
+        summary = ', '.join(f"{count} {name}" for name, count in corrected.items())
+        self.stdout.write(self.style.SUCCESS(f"Corrected event counts of {summary}"))
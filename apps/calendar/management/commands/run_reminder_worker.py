@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from apps.calendar.models import Event
+from apps.calendar.services.reminders import REMINDER_BATCH_SIZE, run_worker, schedule_reminders
+
+
+class Command(BaseCommand):
+    help = "Deliver due event reminders through the configured reminder backend."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=REMINDER_BATCH_SIZE)
+        parser.add_argument('--poll-interval', type=float, default=30, help="Seconds to wait when nothing is due")
+        parser.add_argument('--once', action='store_true', help="Exit when no reminders are due")
+        parser.add_argument('--reschedule', action='store_true',
+                            help="Recompute the pending reminders of every event with reminders enabled first")
+
+    def handle(self, *args, **options):
+        if options['reschedule']:
+            events = Event.objects.filter(reminder_enabled=True)
+            schedule_reminders(events.iterator(chunk_size=500))
+            self.stdout.write(f"Rescheduled reminders of {events.count()} events")
+
+        handled = run_worker(
+            batch_size=options['batch_size'],
+            poll_interval=options['poll_interval'],
+            once=options['once'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Handled {handled} reminders"))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0003_calendarlayout"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["start_date", "end_date"], name="calendar_ev_start_d_3b5b16_idx"
+            ),
+        ),
+    ]
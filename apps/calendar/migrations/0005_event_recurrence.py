@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0004_event_start_date_end_date_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_byday",
+            field=models.JSONField(
+                blank=True, default=list, help_text='Weekday codes, e.g. ["MO", "WE"]'
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_count",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_end_date",
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_exdates",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="Excluded occurrence dates (YYYY-MM-DD)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_frequency",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("", "Does not repeat"),
+                    ("daily", "Daily"),
+                    ("weekly", "Weekly"),
+                    ("monthly", "Monthly"),
+                    ("yearly", "Yearly"),
+                ],
+                default="",
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_interval",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="recurrence_until",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["recurrence_frequency", "recurrence_end_date"],
+                name="calendar_ev_recurre_b25615_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:46
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0005_event_recurrence"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Reminder",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ukid",
+                    models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("created_by", models.IntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("updated_by", models.IntegerField(blank=True, null=True)),
+                (
+                    "event_start",
+                    models.DateTimeField(
+                        help_text="Start of the occurrence being reminded of"
+                    ),
+                ),
+                ("due_at", models.DateTimeField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("sent", "Sent"),
+                            ("failed", "Failed"),
+                            ("expired", "Expired"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                ("error", models.TextField(blank=True)),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reminders",
+                        to="calendar.event",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Reminder",
+                "verbose_name_plural": "Reminders",
+                "ordering": ["due_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "due_at"],
+                        name="calendar_re_status_775b46_idx",
+                    )
+                ],
+                "unique_together": {("event", "event_start")},
+            },
+        ),
+    ]
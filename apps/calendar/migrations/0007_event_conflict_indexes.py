@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0006_reminder"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["location", "start_date", "end_date"],
+                name="calendar_ev_locatio_4a0db7_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["organizer", "start_date", "end_date"],
+                name="calendar_ev_organiz_2f9d1c_idx",
+            ),
+        ),
+    ]
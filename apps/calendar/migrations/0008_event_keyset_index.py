@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0007_event_conflict_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["start_date", "start_time", "id"],
+                name="calendar_ev_start_d_37d5d2_idx",
+            ),
+        ),
+    ]
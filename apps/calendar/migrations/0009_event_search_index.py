@@ -0,0 +1,39 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+FTS_TABLE = "calendar_event_fts"
+
+
+def create_search_index(apps, schema_editor):
+    # FTS5 is SQLite only; other databases use the fallback in services.search
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    try:
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "title, description, organizer, location, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+    except OperationalError:
+        # SQLite built without FTS5
+        return
+    schema_editor.execute(
+        f"INSERT INTO {FTS_TABLE} (rowid, title, description, organizer, location) "
+        "SELECT id, title, description, organizer, location FROM calendar_event"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0008_event_keyset_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
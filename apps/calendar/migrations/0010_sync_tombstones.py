@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:56
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0009_event_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ukid",
+                    models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("created_by", models.IntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("updated_by", models.IntegerField(blank=True, null=True)),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("calendars", "Calendars"),
+                            ("categories", "Categories"),
+                            ("events", "Events"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "object_ukid",
+                    models.UUIDField(help_text="ukid of the deleted record"),
+                ),
+            ],
+            options={
+                "verbose_name": "Tombstone",
+                "verbose_name_plural": "Tombstones",
+                "ordering": ["updated_at", "id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="calendar",
+            index=models.Index(
+                fields=["updated_at", "id"], name="calendar_ca_updated_e6c624_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["updated_at", "id"], name="calendar_ca_updated_15bacf_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["updated_at", "id"], name="calendar_ev_updated_549b8d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(
+                fields=["updated_at", "id"], name="calendar_to_updated_57054b_idx"
+            ),
+        ),
+    ]
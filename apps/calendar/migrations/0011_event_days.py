@@ -0,0 +1,112 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:58
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_event_days(apps, schema_editor):
+    Event = apps.get_model("calendar", "Event")
+    EventDay = apps.get_model("calendar", "EventDay")
+    batch = []
+    events = Event.objects.filter(recurrence_frequency="", start_date__isnull=False)
+    for event in events.iterator(chunk_size=2000):
+        last = event.end_date or event.start_date
+        for offset in range((last - event.start_date).days + 1):
+            batch.append(
+                EventDay(
+                    event_id=event.pk,
+                    day=event.start_date + timedelta(days=offset),
+                    calendar_id=event.calendar_id,
+                    category_id=event.category_id,
+                    status=event.status,
+                )
+            )
+        if len(batch) >= 2000:
+            EventDay.objects.bulk_create(batch)
+            batch = []
+    EventDay.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0010_sync_tombstones"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventDay",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("draft", "Draft"),
+                            ("published", "Published"),
+                            ("postponed", "Postponed"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "calendar",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="calendar.calendar",
+                    ),
+                ),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="calendar.category",
+                    ),
+                ),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="days",
+                        to="calendar.event",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Event Day",
+                "verbose_name_plural": "Event Days",
+                "ordering": ["day"],
+                "indexes": [
+                    models.Index(
+                        fields=["day", "status"], name="calendar_ev_day_52d9ea_idx"
+                    ),
+                    models.Index(
+                        fields=["calendar", "day"],
+                        name="calendar_ev_calenda_558b65_idx",
+                    ),
+                    models.Index(
+                        fields=["category", "day"],
+                        name="calendar_ev_categor_6fe7f1_idx",
+                    ),
+                ],
+                "unique_together": {("event", "day")},
+            },
+        ),
+        migrations.RunPython(populate_event_days, migrations.RunPython.noop),
+    ]
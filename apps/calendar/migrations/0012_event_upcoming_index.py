@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0011_event_days"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["start_date", "start_time"],
+                name="calendar_event_upcoming_idx",
+            ),
+        ),
+    ]
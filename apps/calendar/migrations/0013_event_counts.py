@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:14
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_event_counts(apps, schema_editor):
+    Event = apps.get_model("calendar", "Event")
+    for model_name, relation in (("Calendar", "calendar"), ("Category", "category")):
+        model = apps.get_model("calendar", model_name)
+        counts = (
+            Event.objects.filter(**{relation: OuterRef("pk")})
+            .order_by()
+            .values(relation)
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        model.objects.update(event_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0012_event_upcoming_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="calendar",
+            name="event_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="event_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_event_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+FTS_TABLE = "calendar_event_fts"
+FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+
+
+def _recreate(schema_editor, content, populate):
+    # Only where 0009 created the table (SQLite with FTS5)
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    if FTS_TABLE not in schema_editor.connection.introspection.table_names():
+        return
+    schema_editor.execute(f"DROP TABLE {FTS_TABLE}")
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+        f"title, description, organizer, location, {content}{FTS_OPTIONS})"
+    )
+    schema_editor.execute(populate)
+
+
+def use_external_content(apps, schema_editor):
+    # Index only; the text is read from calendar_event
+    _recreate(
+        schema_editor,
+        "content = 'calendar_event', content_rowid = 'id', ",
+        f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('rebuild')",
+    )
+
+
+def use_own_content(apps, schema_editor):
+    _recreate(
+        schema_editor,
+        "",
+        f"INSERT INTO {FTS_TABLE} (rowid, title, description, organizer, location) "
+        "SELECT id, title, description, organizer, location FROM calendar_event",
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0014_feed_tokens"),
+    ]
+
+    operations = [
+        migrations.RunPython(use_external_content, use_own_content),
+    ]
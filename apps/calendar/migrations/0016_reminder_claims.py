@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("calendar", "0015_event_search_external_content"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reminder",
+            name="claim_token",
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="reminder",
+            name="claimed_until",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="reminder",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("sending", "Sending"),
+                    ("sent", "Sent"),
+                    ("failed", "Failed"),
+                    ("expired", "Expired"),
+                ],
+                default="pending",
+                max_length=10,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reminder",
+            index=models.Index(
+                fields=["claim_token"], name="calendar_re_claim_t_ddd30f_idx"
+            ),
+        ),
+    ]
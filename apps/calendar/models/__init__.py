@@ -2,3 +2,7 @@ from .calendar import Calendar
 from .category import Category
 from .event import Event
 from .layout import CalendarLayout
+from .reminder import Reminder, ReminderStatus
+from .tombstone import SyncKind, Tombstone
+from .event_day import EventDay
+from .feed_token import FeedToken
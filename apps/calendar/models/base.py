@@ -12,3 +12,17 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class EventCountedMixin:
+    """For models with an ``event_count`` column kept up to date by ``F()``
+    updates (``services.event_counts``): saving an existing row leaves the
+    column out, so a stale in-memory count never overwrites it."""
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'event_count'
+            ]
+        super().save(*args, **kwargs)
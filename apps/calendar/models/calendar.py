@@ -1,11 +1,12 @@
 from django.db import models
-from .base import BaseModel
+from .base import BaseModel, EventCountedMixin
 
-class Calendar(BaseModel):
+class Calendar(EventCountedMixin, BaseModel):
     """Model representing a calendar."""
     title = models.CharField(max_length=200)
     start_date = models.DateField()
     end_date = models.DateField()
+    event_count = models.IntegerField(default=0, editable=False)  # see services.event_counts
 
     def __str__(self) -> str: # what to return when we print an object of this class
         return self.title
@@ -14,3 +15,6 @@ class Calendar(BaseModel):
         verbose_name = "Calendar"
         verbose_name_plural = "Calendars"
         ordering = ['start_date']
+        indexes = [
+            models.Index(fields=['updated_at', 'id']),
+        ]
@@ -1,10 +1,11 @@
 from django.db import models
-from .base import BaseModel
+from .base import BaseModel, EventCountedMixin
 
-class Category(BaseModel):
+class Category(EventCountedMixin, BaseModel):
     name = models.CharField(max_length=100)
     color = models.CharField(max_length=7, blank=True, help_text="Hex color code")
     description = models.TextField(blank=True)
+    event_count = models.IntegerField(default=0, editable=False)  # see services.event_counts
 
     def __str__(self) -> str:
         return self.name
@@ -13,3 +14,6 @@ class Category(BaseModel):
         verbose_name = "Category"
         verbose_name_plural = "Categories"
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['updated_at', 'id']),
+        ]
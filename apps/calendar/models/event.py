@@ -1,6 +1,8 @@
-from django.db import models
+from datetime import datetime, time
+from dateutil import rrule
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
 from django.core.exceptions import ValidationError
-from django.utils.text import slugify
 from .base import BaseModel
 from .category import Category
 from .calendar import Calendar
@@ -21,6 +23,38 @@ class EventStatus(models.TextChoices):
     POSTPONED = 'postponed', 'Postponed'
     CANCELLED = 'cancelled', 'Cancelled'
 
+class RecurrenceFrequency(models.TextChoices):
+    """
+    Recurrence frequency choices (RRULE ``FREQ``).
+    """
+    NONE = '', 'Does not repeat'
+    DAILY = 'daily', 'Daily'
+    WEEKLY = 'weekly', 'Weekly'
+    MONTHLY = 'monthly', 'Monthly'
+    YEARLY = 'yearly', 'Yearly'
+
+RRULE_FREQUENCIES = {
+    RecurrenceFrequency.DAILY: rrule.DAILY,
+    RecurrenceFrequency.WEEKLY: rrule.WEEKLY,
+    RecurrenceFrequency.MONTHLY: rrule.MONTHLY,
+    RecurrenceFrequency.YEARLY: rrule.YEARLY,
+}
+
+RRULE_WEEKDAYS = {
+    'MO': rrule.MO, 'TU': rrule.TU, 'WE': rrule.WE, 'TH': rrule.TH,
+    'FR': rrule.FR, 'SA': rrule.SA, 'SU': rrule.SU,
+}
+
+# Fields that decide whether and when an event's reminder is due
+REMINDER_FIELDS = (
+    'status', 'start_date', 'start_time', 'reminder_enabled', 'remainder_time_before_event',
+    'recurrence_frequency', 'recurrence_interval', 'recurrence_byday',
+    'recurrence_until', 'recurrence_count', 'recurrence_exdates',
+)
+
+# Fields copied into or deciding the event's EventDay rows
+DAY_FIELDS = ('start_date', 'end_date', 'calendar_id', 'category_id', 'status', 'recurrence_frequency')
+
 class Event(BaseModel):
     """Model representing an event in a calendar."""
     category = models.ForeignKey(Category, on_delete=models.PROTECT, related_name='events')
@@ -51,6 +85,90 @@ class Event(BaseModel):
     postponed_to = models.DateField(null=True, blank=True)
     cancelled_at = models.DateTimeField(null=True, blank=True)
     cancelled_by = models.IntegerField(null=True, blank=True)  # Assuming user ID is an integer
+    # Recurrence (RRULE-style). start_date/end_date describe the first occurrence.
+    recurrence_frequency = models.CharField(max_length=10,
+                                            choices=RecurrenceFrequency.choices,
+                                            default=RecurrenceFrequency.NONE,
+                                            blank=True)
+    recurrence_interval = models.PositiveIntegerField(default=1)
+    recurrence_byday = models.JSONField(default=list, blank=True, help_text="Weekday codes, e.g. [\"MO\", \"WE\"]")
+    recurrence_until = models.DateField(null=True, blank=True)
+    recurrence_count = models.PositiveIntegerField(null=True, blank=True)
+    recurrence_exdates = models.JSONField(default=list, blank=True, help_text="Excluded occurrence dates (YYYY-MM-DD)")
+    recurrence_end_date = models.DateField(null=True, blank=True, editable=False) # end of the last occurrence; null when open-ended
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._reminder_state = instance.reminder_state()
+        instance._window_state = instance.window_state()
+        instance._day_state = instance.day_state()
+        instance._count_state = instance.count_state()
+        return instance
+
+    def window_state(self):
+        """Where the event sits: (calendar id, first day, last day, open-ended).
+        The last day covers every occurrence of a recurring event."""
+        values = self.__dict__
+        recurring = bool(values.get('recurrence_frequency'))
+        last = values.get('recurrence_end_date') if recurring else values.get('end_date') or values.get('start_date')
+        return (values.get('calendar_id'), values.get('start_date'), last,
+                recurring and values.get('recurrence_end_date') is None)
+
+    def reminder_state(self):
+        """Snapshot of the loaded reminder fields (deferred ones are not fetched)."""
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (self.__dict__.get(field) for field in REMINDER_FIELDS)
+        )
+
+    @property
+    def reminder_changed(self):
+        """Whether the reminder fields differ from when the event was loaded."""
+        return getattr(self, '_reminder_state', None) != self.reminder_state()
+
+    def day_state(self):
+        """Snapshot of the loaded ``DAY_FIELDS``."""
+        return tuple(self.__dict__.get(field) for field in DAY_FIELDS)
+
+    @property
+    def days_changed(self):
+        """Whether the event's EventDay rows are out of date with its fields."""
+        return getattr(self, '_day_state', None) != self.day_state()
+
+    def count_state(self):
+        """Where the event is counted: (calendar id, category id)."""
+        return (self.__dict__.get('calendar_id'), self.__dict__.get('category_id'))
+
+    @property
+    def is_recurring(self):
+        return bool(self.recurrence_frequency)
+
+    def recurrence_rule(self):
+        """The ``dateutil`` rule generating occurrence start dates, or None."""
+        if not self.is_recurring or not self.start_date:
+            return None
+        return rrule.rrule(
+            RRULE_FREQUENCIES[self.recurrence_frequency],
+            dtstart=datetime.combine(self.start_date, time.min),
+            interval=self.recurrence_interval or 1,
+            byweekday=[RRULE_WEEKDAYS[day] for day in self.recurrence_byday] or None,
+            until=datetime.combine(self.recurrence_until, time.min) if self.recurrence_until else None,
+            count=self.recurrence_count,
+        )
+
+    def compute_recurrence_end_date(self):
+        # Undated events have no occurrences to bound
+        if not (self.is_recurring and self.start_date and self.end_date):
+            return None
+        if not (self.recurrence_until or self.recurrence_count):
+            return None
+        last = None
+        for last in self.recurrence_rule():
+            pass
+        if last is None:
+            return self.end_date
+        return last.date() + (self.end_date - self.start_date)
 
     def clean(self):
         if self.start_time and self.end_time and self.end_time <= self.start_time:
@@ -69,16 +187,39 @@ class Event(BaseModel):
             if self.start_date != self.end_date:
                 raise ValidationError("Start date and end date must be the same for single day events.")
 
+        if self.is_recurring:
+            if self.recurrence_until and self.recurrence_count:
+                raise ValidationError("Recurrence can end on a date or after a count, not both.")
+            if self.recurrence_until and self.start_date and self.recurrence_until < self.start_date:
+                raise ValidationError("Recurrence end date must not be before the start date.")
+            if any(day not in RRULE_WEEKDAYS for day in self.recurrence_byday):
+                raise ValidationError("Recurrence weekdays must be two-letter codes (MO, TU, ...).")
+
+    SLUG_ATTEMPTS = 5
+
     def save(self, *args, **kwargs):
-        if not self.slug and self.title:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Event.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+        self.recurrence_end_date = self.compute_recurrence_end_date()
+        if self.slug or not self.title:
+            # One block with the pre_save/post_save receivers, so derived rows
+            # they drop (the search index row) come back if the write fails
+            with transaction.atomic():
+                return super().save(*args, **kwargs)
+
+        from ..services.slugs import allocate_slug
+        for attempt in range(self.SLUG_ATTEMPTS):
+            self.slug = allocate_slug(self.title)
+            try:
+                # Savepoint so a slug collision does not break an outer transaction
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                # Retry only when another create took the slug between allocation
+                # and insert; other violations, including ones raised by
+                # post_save receivers, propagate
+                taken = Event.objects.filter(slug=self.slug).exclude(pk=self.pk).exists()
+                self.slug = ''
+                if not taken or attempt == self.SLUG_ATTEMPTS - 1:
+                    raise
 
     def __str__(self) -> str:
        if self.type == EventType.SINGLE_DAY:
@@ -93,4 +234,13 @@ class Event(BaseModel):
         indexes = [
             models.Index(fields=['category', 'status']),
             models.Index(fields=['calendar', 'start_date']),
+            models.Index(fields=['start_date', 'end_date']),
+            models.Index(fields=['start_date', 'start_time', 'id']),
+            models.Index(fields=['recurrence_frequency', 'recurrence_end_date']),
+            models.Index(fields=['location', 'start_date', 'end_date']),
+            models.Index(fields=['organizer', 'start_date', 'end_date']),
+            models.Index(fields=['updated_at', 'id']),
+            # Upcoming published events: a partial index over published rows only
+            models.Index(fields=['start_date', 'start_time'], condition=Q(status=EventStatus.PUBLISHED),
+                         name='calendar_event_upcoming_idx'),
         ]
\ No newline at end of file
@@ -0,0 +1,30 @@
+from django.db import models
+from .calendar import Calendar
+from .category import Category
+from .event import Event, EventStatus
+
+class EventDay(models.Model):
+    """
+    One row per day a non-recurring event covers, with copies of the event's
+    calendar, category and status, so "what is on day X" is an equality
+    lookup. Derived from ``Event``; maintained by ``services.event_days``.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='days')
+    day = models.DateField()
+    calendar = models.ForeignKey(Calendar, on_delete=models.SET_NULL, related_name='+', null=True, blank=True)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='+')
+    status = models.CharField(max_length=20, choices=EventStatus.choices)
+
+    def __str__(self) -> str:
+        return f"{self.event_id} on {self.day}"
+
+    class Meta: # type: ignore
+        verbose_name = "Event Day"
+        verbose_name_plural = "Event Days"
+        ordering = ['day']
+        unique_together = [['event', 'day']]
+        indexes = [
+            models.Index(fields=['day', 'status']),
+            models.Index(fields=['calendar', 'day']),
+            models.Index(fields=['category', 'day']),
+        ]
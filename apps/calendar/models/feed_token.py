@@ -0,0 +1,37 @@
+import hashlib
+import secrets
+
+from django.conf import settings
+from django.db import models
+from .base import BaseModel
+
+
+def hash_feed_secret(secret):
+    """The stored form of a feed secret; the secret itself is never kept."""
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+class FeedToken(BaseModel):
+    """A per-user secret for calendar-app subscriptions to the ICS feeds,
+    which cannot send an ``Authorization`` header. Only its SHA-256 is
+    stored; deleting the token revokes every URL built from it."""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='feed_tokens')
+    name = models.CharField(max_length=100, blank=True)
+    key_hash = models.CharField(max_length=64, unique=True, editable=False)
+    last_used_at = models.DateTimeField(null=True, blank=True)
+
+    @classmethod
+    def issue(cls, user, name=''):
+        """Create a token for ``user``. Returns: (token, secret); the secret
+        is only available here."""
+        secret = secrets.token_urlsafe(32)
+        token = cls.objects.create(user=user, name=name, key_hash=hash_feed_secret(secret))
+        return token, secret
+
+    def __str__(self) -> str:
+        return f"Feed token {self.name or self.ukid} of {self.user}"
+
+    class Meta: # type: ignore
+        verbose_name = "Feed Token"
+        verbose_name_plural = "Feed Tokens"
+        ordering = ['-created_at']
@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
 from django.conf import settings
 from .base import BaseModel
 
@@ -9,11 +11,36 @@ class CalendarLayout(BaseModel):
     active = models.BooleanField(default=False)
     configuration = models.JSONField(default=dict, help_text="JSON configuration for the layout")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._was_active = instance.__dict__.get('active')
+        return instance
+
     def save(self, *args, **kwargs):
-        if self.active:
-            # Deactivate other layouts for this user
-            CalendarLayout.objects.filter(user=self.user, active=True).exclude(pk=self.pk).update(active=False)
-        super().save(*args, **kwargs)
+        # Saving the already active layout leaves the others alone
+        if not self.active or getattr(self, '_was_active', False):
+            super().save(*args, **kwargs)
+        else:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                self.activate()
+        self._was_active = self.active
+
+    def activate(self):
+        """Make this the user's only active layout with a single UPDATE over
+        the user's layouts, so concurrent activations cannot leave two on."""
+        now = timezone.now()
+        CalendarLayout.objects.filter(user_id=self.user_id).update(
+            active=Case(When(pk=self.pk, then=Value(True)), default=Value(False)),
+            updated_at=Case(When(Q(pk=self.pk) | Q(active=True), then=Value(now)), default=F('updated_at')),
+        )
+        self.active = True
+        self.updated_at = now
+        self._was_active = True
+        # The UPDATE sends no signals
+        from ..services.layouts import invalidate_active_layout
+        invalidate_active_layout(self.user_id)
 
     def __str__(self) -> str:
         return f"{self.name} ({self.user})"
@@ -0,0 +1,40 @@
+from django.db import models
+from .base import BaseModel
+from .event import Event
+
+class ReminderStatus(models.TextChoices):
+    """
+    Reminder delivery status choices.
+    """
+    PENDING = 'pending', 'Pending'
+    SENDING = 'sending', 'Sending'
+    SENT = 'sent', 'Sent'
+    FAILED = 'failed', 'Failed'
+    EXPIRED = 'expired', 'Expired'
+
+class Reminder(BaseModel):
+    """A reminder for one occurrence of an event, delivered by ``run_reminder_worker``."""
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='reminders')
+    event_start = models.DateTimeField(help_text="Start of the occurrence being reminded of")
+    due_at = models.DateTimeField()
+    status = models.CharField(max_length=10,
+                              choices=ReminderStatus.choices,
+                              default=ReminderStatus.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    claim_token = models.UUIDField(null=True, blank=True)
+    claimed_until = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"Reminder for {self.event.title} at {self.due_at}"
+
+    class Meta: # type: ignore
+        verbose_name = "Reminder"
+        verbose_name_plural = "Reminders"
+        ordering = ['due_at']
+        unique_together = [['event', 'event_start']]
+        indexes = [
+            models.Index(fields=['status', 'due_at']),
+            models.Index(fields=['claim_token']),
+        ]
@@ -0,0 +1,27 @@
+from django.db import models
+from .base import BaseModel
+
+class SyncKind(models.TextChoices):
+    """
+    Kinds of records served by the sync change feed.
+    """
+    CALENDARS = 'calendars', 'Calendars'
+    CATEGORIES = 'categories', 'Categories'
+    EVENTS = 'events', 'Events'
+
+class Tombstone(BaseModel):
+    """Marks a deleted calendar, category or event for the sync change feed;
+    ``updated_at`` is when it was deleted."""
+    kind = models.CharField(max_length=10, choices=SyncKind.choices)
+    object_ukid = models.UUIDField(help_text="ukid of the deleted record")
+
+    def __str__(self) -> str:
+        return f"Deleted {self.kind} {self.object_ukid}"
+
+    class Meta: # type: ignore
+        verbose_name = "Tombstone"
+        verbose_name_plural = "Tombstones"
+        ordering = ['updated_at', 'id']
+        indexes = [
+            models.Index(fields=['updated_at', 'id']),
+        ]
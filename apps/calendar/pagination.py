@@ -0,0 +1,144 @@
+import base64
+import json
+from collections import OrderedDict
+from datetime import date, time
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Cursor pagination on a composite, unique key, e.g. (start_date,
+    start_time, id). Pages are fetched with ``WHERE key > cursor ORDER BY key
+    LIMIT n`` against a matching index, so a deep page costs the same as the
+    first and no ``COUNT(*)`` is needed. Cursors are opaque and work in both
+    directions. Nullable key fields sort last.
+
+    Paging is opt-in: only requests passing ``cursor`` or ``page_size`` get
+    the ``{next, previous, results}`` envelope; others still get the bare
+    list, which existing clients expect.
+    """
+    cursor_query_param = 'cursor'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('start_date', 'start_time', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not any(param in request.query_params for param in (self.cursor_query_param, self.page_size_query_param)):
+            return None
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self._model_fields = {field: queryset.model._meta.get_field(field) for field in self.ordering}
+        position, reverse = self.decode_cursor(request)
+
+        if reverse:
+            order = [F(field).desc(nulls_first=True) for field in self.ordering]
+        else:
+            order = [F(field).asc(nulls_last=True) for field in self.ordering]
+        queryset = queryset.order_by(*order)
+        if position is not None:
+            queryset = queryset.filter(self._after(position, reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        # Going forward there is a previous page if we started from a cursor,
+        # and vice versa
+        self.has_next = has_more if not reverse else position is not None
+        self.has_previous = position is not None if not reverse else has_more
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def _after(self, position, reverse):
+        """Rows strictly after ``position`` in the traversal order."""
+        condition = Q(pk__in=[])
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            nullable = self._model_fields[field].null
+            if value is None:
+                greater = Q(**{f'{field}__isnull': False}) if reverse else Q(pk__in=[])
+                same = Q(**{f'{field}__isnull': True})
+            else:
+                greater = Q(**{f'{field}__lt' if reverse else f'{field}__gt': value})
+                if nullable and not reverse:
+                    greater |= Q(**{f'{field}__isnull': True})
+                same = Q(**{field: value})
+            condition |= equal & greater
+            equal &= same
+        return condition
+
+    def _key(self, instance):
+        return [getattr(instance, 'pk' if field == 'id' else field) for field in self.ordering]
+
+    def encode_cursor(self, position, reverse):
+        payload = {'k': [value.isoformat() if isinstance(value, (date, time)) else value for value in position]}
+        if reverse:
+            payload['r'] = 1
+        token = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, token.rstrip('='))
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            position = [
+                self._parse(field, value) for field, value in zip(self.ordering, payload['k'], strict=True)
+            ]
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, bool(payload.get('r'))
+
+    def _parse(self, field, value):
+        if value is None:
+            return None
+        return self._model_fields[field].to_python(value)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self._key(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self._key(self.page[0]), reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
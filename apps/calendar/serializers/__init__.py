@@ -1,7 +1,8 @@
 from .calendar import (
     CalendarCreateSerializer, 
     CalendarUpdateSerializer, 
-    CalendarResponseSerializer
+    CalendarResponseSerializer,
+    CalendarMonthQuerySerializer
 )
 from .category import (
     CategoryCreateSerializer, 
@@ -11,5 +12,22 @@ from .category import (
 from .event import (
     EventCreateSerializer, 
     EventUpdateSerializer, 
-    EventResponseSerializer
+    EventResponseSerializer,
+    EventRangeQuerySerializer,
+    EventDayQuerySerializer,
+    EventFreeBusyQuerySerializer,
+    EventUpcomingQuerySerializer,
+    EventAnalyticsQuerySerializer,
+    EventSearchQuerySerializer,
+    EventImportSerializer,
+    EventTransitionSerializer,
+    EventCompactSerializer,
+    OccurrenceCompactSerializer,
+    ConflictSerializer
+)
+from .sync import (
+    SyncQuerySerializer,
+    CalendarSyncSerializer,
+    CategorySyncSerializer,
+    EventSyncSerializer
 )
@@ -1,3 +1,4 @@
+from datetime import datetime
 from rest_framework import serializers
 from ..models.calendar import Calendar
 
@@ -36,12 +37,17 @@ class CalendarUpdateSerializer(serializers.ModelSerializer):
         return attrs
 
 class CalendarResponseSerializer(serializers.ModelSerializer):
-    event_count = serializers.SerializerMethodField()
-    
     class Meta:
         model = Calendar
         fields = ['ukid', 'title', 'start_date', 'end_date', 'event_count', 'created_at', 'updated_at']
-        read_only_fields = ['ukid', 'created_at', 'updated_at']
-    
-    def get_event_count(self, obj):
-        return obj.events.count()
+        read_only_fields = ['ukid', 'event_count', 'created_at', 'updated_at']
+
+class CalendarMonthQuerySerializer(serializers.Serializer):
+    """Query parameters of the month grid endpoint."""
+    month = serializers.CharField(required=False, help_text="YYYY-MM; defaults to the current month")
+
+    def validate_month(self, value):
+        try:
+            return datetime.strptime(value, '%Y-%m').date()
+        except ValueError:
+            raise serializers.ValidationError('Month must be given as YYYY-MM.')
@@ -31,12 +31,7 @@ class CategoryUpdateSerializer(serializers.ModelSerializer):
         return value
 
 class CategoryResponseSerializer(serializers.ModelSerializer):
-    event_count = serializers.SerializerMethodField()
-    
     class Meta:
         model = Category
         fields = ['ukid', 'name', 'color', 'description', 'event_count', 'created_at', 'updated_at']
-        read_only_fields = ['ukid', 'created_at', 'updated_at']
-    
-    def get_event_count(self, obj):
-        return obj.events.count()
\ No newline at end of file
+        read_only_fields = ['ukid', 'event_count', 'created_at', 'updated_at']
@@ -1,14 +1,88 @@
+import copy
 from rest_framework import serializers
 from django.utils import timezone
-from ..models.event import Event, EventType, EventStatus
+from ..models.event import Event, EventType, EventStatus, RecurrenceFrequency, RRULE_WEEKDAYS
 from ..models.category import Category
 from ..models.calendar import Calendar
 from .calendar import CalendarResponseSerializer
 from .category import CategoryResponseSerializer
 
+RECURRENCE_FIELDS = [
+    'recurrence_frequency', 'recurrence_interval', 'recurrence_byday',
+    'recurrence_until', 'recurrence_count', 'recurrence_exdates'
+]
+
+def recurrence_errors(attrs, instance=None):
+    """Validate the recurrence fields; normalises exception dates to ISO strings."""
+    def value(field, default=None):
+        return attrs.get(field, getattr(instance, field) if instance else default)
+
+    errors = {}
+    frequency = value('recurrence_frequency', RecurrenceFrequency.NONE)
+    until = value('recurrence_until')
+    count = value('recurrence_count')
+    start_date = value('start_date')
+
+    if 'recurrence_exdates' in attrs:
+        attrs['recurrence_exdates'] = sorted({day.isoformat() for day in attrs['recurrence_exdates']})
+
+    if not frequency:
+        if any(attrs.get(field) for field in ['recurrence_byday', 'recurrence_until', 'recurrence_count']):
+            errors['recurrence_frequency'] = 'Frequency is required for a recurrence rule.'
+        return errors
+
+    if until and count:
+        errors['recurrence_count'] = 'Recurrence can end on a date or after a count, not both.'
+    if until and start_date and until < start_date:
+        errors['recurrence_until'] = 'Recurrence end date must not be before the start date.'
+    if value('recurrence_byday') and frequency != RecurrenceFrequency.WEEKLY:
+        errors['recurrence_byday'] = 'Weekdays can only be given for weekly recurrence.'
+    return errors
+
+# Fields whose change can make an event clash with another
+CONFLICT_FIELDS = [
+    'location', 'organizer', 'type', 'start_date', 'end_date',
+    'start_time', 'end_time', 'status'
+] + RECURRENCE_FIELDS
+MAX_CONFLICT_MESSAGES = 5
+
+def _visible_to(event, user):
+    # Mirrors EventViewSet.get_queryset: non-staff users see published events only
+    return bool(user and (user.is_staff or user.is_superuser)) or event.status == EventStatus.PUBLISHED
+
+
+def _conflict_message(conflict, user):
+    other = conflict.first.event
+    message = f'{conflict.resource.capitalize()} "{conflict.value}" is already booked'
+    # Events the user cannot see are reported by their times only
+    if _visible_to(other, user):
+        message += f' by "{other.title}"'
+    return (f'{message} on {max(conflict.first.start_date, conflict.second.start_date)} '
+            f'({other.start_time:%H:%M}-{other.end_time:%H:%M}).')
+
+
+def conflict_errors(attrs, instance=None, user=None):
+    """Clashes of the event as it would be saved, one message per clash.
+    Events ``user`` cannot see are reported by their times only."""
+    from ..services.conflicts import find_conflicts
+
+    event = copy.copy(instance) if instance else Event()
+    for field, value in attrs.items():
+        setattr(event, field, value)
+    messages = [_conflict_message(conflict, user) for conflict in find_conflicts(event)]
+    if not messages:
+        return {}
+    if len(messages) > MAX_CONFLICT_MESSAGES:
+        extra = len(messages) - MAX_CONFLICT_MESSAGES
+        messages = messages[:MAX_CONFLICT_MESSAGES] + [f'... and {extra} more.']
+    return {'conflicts': messages + ['Pass allow_conflicts to save anyway.']}
+
 class EventCreateSerializer(serializers.ModelSerializer):
     category = serializers.SlugRelatedField(slug_field='ukid', queryset=Category.objects.all())
     calendar = serializers.SlugRelatedField(slug_field='ukid', queryset=Calendar.objects.all(), required=False, allow_null=True)
+    recurrence_byday = serializers.ListField(child=serializers.ChoiceField(choices=list(RRULE_WEEKDAYS)), required=False)
+    recurrence_exdates = serializers.ListField(child=serializers.DateField(), required=False)
+    allow_conflicts = serializers.BooleanField(write_only=True, default=False)
 
     class Meta:
         model = Event
@@ -17,8 +91,8 @@ class EventCreateSerializer(serializers.ModelSerializer):
             'location', 'type', 'start_date', 'end_date', 'start_time', 
             'end_time', 'event_duration', 'entry_form_required', 
             'registration_url', 'registration_limit', 'reminder_enabled', 
-            'remainder_time_before_event'
-        ]
+            'remainder_time_before_event', 'allow_conflicts'
+        ] + RECURRENCE_FIELDS
     
     def validate(self, attrs):
         errors = {}
@@ -53,15 +127,73 @@ class EventCreateSerializer(serializers.ModelSerializer):
         # Validate registration
         if attrs.get('entry_form_required') and not attrs.get('registration_url'):
             errors['registration_url'] = 'Registration URL is required when entry form is required.'
+
+        errors.update(recurrence_errors(attrs))
+
+        allow_conflicts = attrs.pop('allow_conflicts', False)
+        if not errors and not allow_conflicts and self.context.get('check_conflicts', True):
+            errors.update(conflict_errors(attrs, user=getattr(self.context.get('request'), 'user', None)))
         
         if errors:
             raise serializers.ValidationError(errors)
         
         return attrs
 
+class ImportReferenceField(serializers.Field):
+    """A category or calendar given by ukid or name, resolved from the
+    ``lookups`` the importer prepared up front instead of a query per row."""
+    default_error_messages = {
+        'does_not_exist': 'No {model} matches "{value}".',
+        'ambiguous': 'Several {model} records are named "{value}"; use the ukid.',
+    }
+
+    def __init__(self, lookup, **kwargs):
+        self.lookup = lookup
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        value = str(data).strip()
+        matches = self.context['lookups'][self.lookup].get(value, [])
+        if not matches:
+            self.fail('does_not_exist', model=self.lookup, value=value)
+        if len(matches) > 1:
+            self.fail('ambiguous', model=self.lookup, value=value)
+        return matches[0]
+
+    def to_representation(self, value):
+        return str(value.ukid)
+
+class EventImportRowSerializer(EventCreateSerializer):
+    """One row of a bulk import, validated like a single create."""
+    category = ImportReferenceField('category')
+    calendar = ImportReferenceField('calendar', required=False, allow_null=True)
+
+class EventImportSerializer(serializers.Serializer):
+    """Upload accepted by the bulk import endpoint."""
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=['csv', 'ics'], required=False,
+                                     help_text="Detected from the file name when omitted")
+    category = serializers.CharField(required=False, help_text="Category (ukid or name) for rows without one")
+    calendar = serializers.CharField(required=False, help_text="Calendar (ukid or title) for rows without one")
+    dry_run = serializers.BooleanField(default=False, help_text="Validate and report without creating events")
+
+    def validate(self, attrs):
+        if not attrs.get('format'):
+            name = attrs['file'].name.lower()
+            if name.endswith(('.ics', '.ical', '.ifb')):
+                attrs['format'] = 'ics'
+            elif name.endswith('.csv'):
+                attrs['format'] = 'csv'
+            else:
+                raise serializers.ValidationError({'format': 'Could not detect the file format; pass csv or ics.'})
+        return attrs
+
 class EventUpdateSerializer(serializers.ModelSerializer):
     category = serializers.SlugRelatedField(slug_field='ukid', queryset=Category.objects.all(), required=False)
     calendar = serializers.SlugRelatedField(slug_field='ukid', queryset=Calendar.objects.all(), required=False, allow_null=True)
+    recurrence_byday = serializers.ListField(child=serializers.ChoiceField(choices=list(RRULE_WEEKDAYS)), required=False)
+    recurrence_exdates = serializers.ListField(child=serializers.DateField(), required=False)
+    allow_conflicts = serializers.BooleanField(write_only=True, required=False)
 
     class Meta:
         model = Event
@@ -70,8 +202,9 @@ class EventUpdateSerializer(serializers.ModelSerializer):
             'location', 'type', 'start_date', 'end_date', 'start_time', 
             'end_time', 'event_duration', 'entry_form_required', 
             'registration_url', 'registration_limit', 'reminder_enabled', 
-            'remainder_time_before_event', 'status', 'postponed_to', 'updated_by'
-        ]
+            'remainder_time_before_event', 'status', 'postponed_to', 'updated_by',
+            'allow_conflicts'
+        ] + RECURRENCE_FIELDS
         extra_kwargs = {field: {'required': False} for field in fields}
     
     def validate(self, attrs):
@@ -96,6 +229,13 @@ class EventUpdateSerializer(serializers.ModelSerializer):
         elif event_type == EventType.SINGLE_DAY:
             if start_date and end_date and start_date != end_date:
                 errors['end_date'] = 'Start date and end date must be the same for single day events.'
+
+        errors.update(recurrence_errors(attrs, instance))
+
+        # Only edits that move the event or change its resources are checked
+        allow_conflicts = attrs.pop('allow_conflicts', False)
+        if not errors and not allow_conflicts and any(field in attrs for field in CONFLICT_FIELDS):
+            errors.update(conflict_errors(attrs, instance, getattr(self.context.get('request'), 'user', None)))
         
         if errors:
             raise serializers.ValidationError(errors)
@@ -137,8 +277,182 @@ class EventResponseSerializer(serializers.ModelSerializer):
             'remainder_time_before_event', 'status', 'status_display', 'published_at', 
             'published_by', 'postponed_to', 'cancelled_at', 'cancelled_by', 
             'created_at', 'updated_at'
-        ]
+        ] + RECURRENCE_FIELDS + ['recurrence_end_date']
         read_only_fields = [
             'ukid', 'slug', 'published_at', 'published_by', 'cancelled_at', 
-            'cancelled_by', 'created_at', 'updated_at'
-        ]
\ No newline at end of file
+            'cancelled_by', 'created_at', 'updated_at', 'recurrence_end_date'
+        ]
+
+def parse_statuses(value):
+    """Comma-separated statuses from a query parameter, validated."""
+    statuses = [status.strip() for status in value.split(',') if status.strip()]
+    invalid = [status for status in statuses if status not in EventStatus.values]
+    if invalid:
+        raise serializers.ValidationError(f"Invalid status: {', '.join(invalid)}.")
+    return statuses
+
+class EventRangeQuerySerializer(serializers.Serializer):
+    """Query parameters of the date-range window endpoint."""
+    MAX_RANGE_DAYS = 366
+
+    to = serializers.DateField()
+    calendar = serializers.UUIDField(required=False)
+    category = serializers.UUIDField(required=False)
+    status = serializers.CharField(required=False, help_text="Comma-separated statuses")
+
+    def get_fields(self):
+        # ``from`` is a Python keyword, so it cannot be declared as an attribute
+        fields = super().get_fields()
+        fields['from'] = serializers.DateField()
+        return fields
+
+    def validate_status(self, value):
+        return parse_statuses(value)
+
+    def validate(self, attrs):
+        if attrs['to'] < attrs['from']:
+            raise serializers.ValidationError({'to': 'End of the range must not be before its start.'})
+        if (attrs['to'] - attrs['from']).days > self.MAX_RANGE_DAYS:
+            raise serializers.ValidationError({'to': f'Range cannot exceed {self.MAX_RANGE_DAYS} days.'})
+        return attrs
+
+class EventDayQuerySerializer(serializers.Serializer):
+    """Query parameters of the day endpoint."""
+    date = serializers.DateField(required=False, help_text="Defaults to today")
+    calendar = serializers.UUIDField(required=False)
+    category = serializers.UUIDField(required=False)
+    status = serializers.CharField(required=False, help_text="Comma-separated statuses")
+
+    def validate_status(self, value):
+        return parse_statuses(value)
+
+class EventFreeBusyQuerySerializer(serializers.Serializer):
+    """Query parameters of the free/busy endpoint; ``location`` and
+    ``organizer`` may each be repeated."""
+    MAX_RANGE_DAYS = 31
+    MAX_RESOURCES = 20
+
+    location = serializers.ListField(child=serializers.CharField(max_length=255), required=False)
+    organizer = serializers.ListField(child=serializers.CharField(max_length=100), required=False)
+    to = serializers.DateField()
+    day_start = serializers.TimeField(required=False, help_text="Start of the working day for free slots")
+    day_end = serializers.TimeField(required=False, help_text="End of the working day for free slots")
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields['from'] = serializers.DateField()
+        return fields
+
+    def validate(self, attrs):
+        resources = [('location', value) for value in attrs.get('location', []) if value.strip()]
+        resources += [('organizer', value) for value in attrs.get('organizer', []) if value.strip()]
+        if not resources:
+            raise serializers.ValidationError('Give at least one location or organizer.')
+        if len(resources) > self.MAX_RESOURCES:
+            raise serializers.ValidationError(f'At most {self.MAX_RESOURCES} locations and organizers at once.')
+        if attrs['to'] < attrs['from']:
+            raise serializers.ValidationError({'to': 'End of the range must not be before its start.'})
+        if (attrs['to'] - attrs['from']).days > self.MAX_RANGE_DAYS:
+            raise serializers.ValidationError({'to': f'Range cannot exceed {self.MAX_RANGE_DAYS} days.'})
+        if attrs.get('day_start') and attrs.get('day_end') and attrs['day_end'] <= attrs['day_start']:
+            raise serializers.ValidationError({'day_end': 'End of the working day must be after its start.'})
+        attrs['resources'] = resources
+        return attrs
+
+class EventTransitionSerializer(serializers.Serializer):
+    """Bulk status change of the events listed by ukid or matching filters."""
+    MAX_RANGE_DAYS = 366
+
+    action = serializers.ChoiceField(choices=['publish', 'postpone', 'cancel'])
+    events = serializers.ListField(child=serializers.UUIDField(), required=False, max_length=5000)
+    calendar = serializers.UUIDField(required=False)
+    category = serializers.UUIDField(required=False)
+    status = serializers.CharField(required=False, help_text="Comma-separated current statuses")
+    to = serializers.DateField(required=False)
+    postponed_to = serializers.DateField(required=False)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields['from'] = serializers.DateField(required=False)
+        return fields
+
+    def validate_status(self, value):
+        return parse_statuses(value)
+
+    def validate(self, attrs):
+        # An empty request must not sweep every event
+        if not any(attrs.get(field) for field in ['events', 'calendar', 'category', 'status', 'from']):
+            raise serializers.ValidationError('Give the events or at least one filter.')
+        if bool(attrs.get('from')) != bool(attrs.get('to')):
+            raise serializers.ValidationError('Both from and to are required to filter by date.')
+        if attrs.get('from'):
+            if attrs['to'] < attrs['from']:
+                raise serializers.ValidationError({'to': 'End of the range must not be before its start.'})
+            if (attrs['to'] - attrs['from']).days > self.MAX_RANGE_DAYS:
+                raise serializers.ValidationError({'to': f'Range cannot exceed {self.MAX_RANGE_DAYS} days.'})
+        if attrs.get('postponed_to') and attrs['action'] != 'postpone':
+            raise serializers.ValidationError({'postponed_to': 'Only postponing takes a new date.'})
+        return attrs
+
+class EventUpcomingQuerySerializer(serializers.Serializer):
+    """Query parameters of the upcoming events endpoint."""
+    limit = serializers.IntegerField(required=False, default=10, min_value=1, max_value=50)
+    calendar = serializers.UUIDField(required=False)
+    category = serializers.UUIDField(required=False)
+
+class EventAnalyticsQuerySerializer(serializers.Serializer):
+    """Optional scoping of the analytics endpoint."""
+    to = serializers.DateField(required=False)
+    calendar = serializers.UUIDField(required=False)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields['from'] = serializers.DateField(required=False)
+        return fields
+
+    def validate(self, attrs):
+        if bool(attrs.get('from')) != bool(attrs.get('to')):
+            raise serializers.ValidationError('Both from and to are required to scope by date.')
+        if attrs.get('from') and attrs['to'] < attrs['from']:
+            raise serializers.ValidationError({'to': 'End of the range must not be before its start.'})
+        return attrs
+
+class EventSearchQuerySerializer(serializers.Serializer):
+    """Query parameters of the full-text search endpoint."""
+    q = serializers.CharField(max_length=200)
+    limit = serializers.IntegerField(required=False, default=50, min_value=1, max_value=200)
+
+class EventCompactSerializer(serializers.ModelSerializer):
+    """Slim event shape for calendar views; relations are referenced by ukid."""
+    category = serializers.UUIDField(source='category.ukid', read_only=True)
+    calendar = serializers.UUIDField(source='calendar.ukid', read_only=True, allow_null=True)
+    color = serializers.CharField(source='category.color', read_only=True)
+    recurring = serializers.BooleanField(source='is_recurring', read_only=True)
+
+    class Meta:
+        model = Event
+        fields = [
+            'ukid', 'title', 'slug', 'type', 'status', 'category', 'calendar', 'color',
+            'start_date', 'end_date', 'start_time', 'end_time', 'location', 'recurring'
+        ]
+        read_only_fields = fields
+
+class OccurrenceCompactSerializer(serializers.Serializer):
+    """Compact shape for an :class:`Occurrence`: the event with the occurrence's dates."""
+    def to_representation(self, instance):
+        data = EventCompactSerializer(instance.event, context=self.context).data
+        data['start_date'] = instance.start_date.isoformat()
+        data['end_date'] = instance.end_date.isoformat()
+        return data
+
+class ConflictSerializer(serializers.Serializer):
+    """A clash between two occurrences sharing a location or an organizer."""
+    def to_representation(self, instance):
+        first, second = instance.first, instance.second
+        return {
+            'resource': instance.resource,
+            'value': instance.value,
+            'from': max(first.start_date, second.start_date).isoformat(),
+            'to': min(first.end_date, second.end_date).isoformat(),
+            'events': OccurrenceCompactSerializer([first, second], many=True, context=self.context).data,
+        }
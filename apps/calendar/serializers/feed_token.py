@@ -0,0 +1,8 @@
+from rest_framework import serializers
+from apps.calendar.models import FeedToken
+
+class FeedTokenSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = FeedToken
+        fields = ['ukid', 'name', 'created_at', 'last_used_at']
+        read_only_fields = ['ukid', 'created_at', 'last_used_at']
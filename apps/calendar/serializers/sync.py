@@ -0,0 +1,25 @@
+from rest_framework import serializers
+from .calendar import CalendarResponseSerializer
+from .category import CategoryResponseSerializer
+from .event import EventResponseSerializer
+
+class SyncQuerySerializer(serializers.Serializer):
+    """Query parameters of the sync change feed."""
+    cursor = serializers.CharField(required=False, help_text="Cursor of the previous response; omit to start over")
+    page_size = serializers.IntegerField(required=False, min_value=1, max_value=1000)
+
+# Clients store each kind separately, so the feed leaves out event counts
+# (they change without their record being updated) and refers to related
+# records by ukid.
+
+class CalendarSyncSerializer(CalendarResponseSerializer):
+    class Meta(CalendarResponseSerializer.Meta):
+        fields = ['ukid', 'title', 'start_date', 'end_date', 'created_at', 'updated_at']
+
+class CategorySyncSerializer(CategoryResponseSerializer):
+    class Meta(CategoryResponseSerializer.Meta):
+        fields = ['ukid', 'name', 'color', 'description', 'created_at', 'updated_at']
+
+class EventSyncSerializer(EventResponseSerializer):
+    category = serializers.UUIDField(source='category.ukid', read_only=True)
+    calendar = serializers.UUIDField(source='calendar.ukid', read_only=True, allow_null=True)
@@ -0,0 +1,20 @@
+from .event_counts import adjust_event_counts, count_events, move_event_count, reconcile_event_counts
+from .event_window import overlapping
+from .recurrence import Occurrence, expand_window, occurrences, occurrence_cache
+from .cache import bump_cache_version, cache_version, cache_versions
+from .analytics import compute_analytics, get_analytics, invalidate_analytics
+from .free_busy import compute_free_busy, get_free_busy, invalidate_free_busy
+from .invalidation import events_changed
+from .slugs import allocate_slug, assign_slugs, base_slug
+from .event_import import import_events, iter_csv_rows, iter_ics_rows
+from .ics_feed import feed_validators, iter_feed, vevent
+from .reminders import claim_due, dispatch_due, next_reminder, schedule_reminders
+from .conflicts import Conflict, conflict_report, find_conflicts, sweep_conflicts
+from .month_grid import compute_month_grid, get_month_grid, invalidate_month_grids
+from .search import drop_from_search_index, rebuild_search_index, search_events, sync_search_index
+from .sync import prune_tombstones, read_changes
+from .event_days import event_days, events_on, rebuild_event_days, refresh_event_days
+from .transitions import TRANSITIONS, transition_events
+from .layouts import active_layout, invalidate_active_layout
+from .upcoming import compute_upcoming, get_upcoming, invalidate_upcoming
+from .snapshots import publish_snapshots, schedule_related_snapshots, schedule_snapshots, write_atomic
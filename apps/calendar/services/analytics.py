@@ -0,0 +1,80 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from ..models.event import Event, RecurrenceFrequency
+from .cache import bump_cache_version, cache_version
+from .event_window import overlapping
+
+ANALYTICS_NAMESPACE = 'analytics'
+ANALYTICS_TTL = getattr(settings, 'CALENDAR_ANALYTICS_TTL', 15 * 60)
+UPCOMING_DAYS = 30
+
+
+def compute_analytics(start=None, end=None, calendar=None):
+    """
+    Event analytics in one grouped query (two with a window, plain events
+    and recurring series apart): counts per (category, status), with the
+    upcoming count as a conditional aggregate. Totals and the two
+    breakdowns are folded from those rows.
+    """
+    today = timezone.now().date()
+    queryset = Event.objects.all()
+    if calendar:
+        queryset = queryset.filter(calendar__ukid=calendar)
+    parts = [queryset]
+    if start and end:
+        # Plain events through their day rows, recurring series by their stored dates
+        parts = [
+            overlapping(queryset.filter(recurrence_frequency=RecurrenceFrequency.NONE), start, end),
+            queryset.exclude(recurrence_frequency=RecurrenceFrequency.NONE).filter(
+                start_date__lte=end, end_date__gte=start,
+            ),
+        ]
+
+    by_category = Counter()
+    by_status = Counter()
+    total = upcoming = 0
+    for part in parts:
+        rows = part.order_by().values('category__name', 'status').annotate(
+            count=Count('id'),
+            upcoming=Count('id', filter=Q(
+                start_date__gte=today,
+                start_date__lte=today + timedelta(days=UPCOMING_DAYS),
+            )),
+        )
+        for row in rows:
+            total += row['count']
+            upcoming += row['upcoming']
+            by_category[row['category__name']] += row['count']
+            by_status[row['status']] += row['count']
+
+    return {
+        'total_events': total,
+        'upcoming_events': upcoming,
+        'events_by_category': [
+            {'category__name': name, 'count': count} for name, count in by_category.most_common()
+        ],
+        'events_by_status': [
+            {'status': status, 'count': count} for status, count in by_status.most_common()
+        ],
+    }
+
+
+def get_analytics(start=None, end=None, calendar=None):
+    """Cached :func:`compute_analytics`; entries roll over daily and on event writes."""
+    today = timezone.now().date()
+    key = f'calendar:analytics:{cache_version(ANALYTICS_NAMESPACE)}:{today}:{start}:{end}:{calendar}'
+    data = cache.get(key)
+    if data is None:
+        data = compute_analytics(start, end, calendar)
+        cache.set(key, data, ANALYTICS_TTL)
+    return data
+
+
+def invalidate_analytics():
+    bump_cache_version(ANALYTICS_NAMESPACE)
@@ -0,0 +1,45 @@
+"""
+Versioned cache namespaces for derived calendar data.
+
+Each namespace has a version token stored in the Django cache; readers
+include it in their keys and writers bump it, which invalidates every
+entry of the namespace at once without having to enumerate keys. Tokens
+are timestamps, so a version evicted from the cache can never be reissued
+and resurrect stale entries.
+
+Tokens only invalidate across processes when every process reads the same
+cache: the default LocMemCache is per process, so multi-process deployments
+point ``CACHES['default']`` at Redis (``REDIS_URL``, see settings). A
+database cache would defeat the purpose, costing queries on every read.
+"""
+import time
+from django.core.cache import cache
+
+
+def _version_key(namespace):
+    return f'calendar:{namespace}:version'
+
+
+def cache_version(namespace):
+    """Current version token of ``namespace``."""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(*namespaces):
+    """Invalidate every entry cached under ``namespaces``."""
+    cache.set_many({_version_key(namespace): time.time_ns() for namespace in namespaces}, None)
+
+
+def cache_versions(*namespaces):
+    """Current version tokens of ``namespaces``, in order, with one cache read."""
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for namespace, key in zip(namespaces, keys):
+        if key not in versions:
+            versions[key] = cache_version(namespace)
+    return [versions[key] for key in keys]
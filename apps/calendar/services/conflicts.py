@@ -0,0 +1,110 @@
+"""
+Clash detection between events sharing a location or an organizer.
+
+An event occupies ``start_time``-``end_time`` on every day from its start
+to its end date (each occurrence, for recurring events). Two events clash
+when they share a resource and both their date ranges and their daily time
+windows overlap. Cancelled events never clash.
+
+Checking one event asks the database only for events on the same resource
+whose dates and times overlap it (``(location|organizer, start_date,
+end_date)`` indexes), so the cost follows the number of real candidates.
+Reports over a window sort occurrences per resource and sweep them once,
+comparing each occurrence only with those still running on its start date.
+"""
+from collections import defaultdict, namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+
+from ..models.event import Event, EventStatus
+from .recurrence import expand_window, occurrences
+
+CONFLICT_RESOURCES = ('location', 'organizer')
+# How far ahead an open-ended recurring event is checked
+CONFLICT_HORIZON_DAYS = getattr(settings, 'CALENDAR_CONFLICT_HORIZON_DAYS', 366)
+
+Conflict = namedtuple('Conflict', ['resource', 'value', 'first', 'second'])
+
+
+def resource_key(value):
+    return (value or '').strip()
+
+
+def _times_overlap(first, second):
+    return first.start_time < second.end_time and second.start_time < first.end_time
+
+
+def sweep_conflicts(items):
+    """
+    Clashing pairs among ``items`` (Occurrences), one sorted sweep per resource.
+    Returns: list of Conflict, ordered by resource and date
+    """
+    by_resource = defaultdict(list)
+    for occurrence in items:
+        for resource in CONFLICT_RESOURCES:
+            key = resource_key(getattr(occurrence.event, resource))
+            if key:
+                by_resource[(resource, key)].append(occurrence)
+
+    conflicts = []
+    for (resource, _), group in sorted(by_resource.items()):
+        group.sort(key=lambda occurrence: (occurrence.start_date, occurrence.event.start_time))
+        running = []
+        for occurrence in group:
+            # Only occurrences still running on this start date can overlap it
+            running = [other for other in running if other.end_date >= occurrence.start_date]
+            for other in running:
+                if other.event.pk != occurrence.event.pk and _times_overlap(other.event, occurrence.event):
+                    conflicts.append(Conflict(resource, getattr(occurrence.event, resource).strip(), other, occurrence))
+            running.append(occurrence)
+    return conflicts
+
+
+def _window(event):
+    end = event.end_date or event.start_date
+    if event.is_recurring:
+        end = event.compute_recurrence_end_date() or event.start_date + timedelta(days=CONFLICT_HORIZON_DAYS)
+    return event.start_date, end
+
+
+def find_conflicts(event):
+    """
+    Existing events clashing with ``event``, which may be unsaved or carry
+    unsaved changes. Returns: list of Conflict with ``event`` as ``second``.
+    """
+    if event.status == EventStatus.CANCELLED or not (event.start_date and event.start_time and event.end_time):
+        return []
+    resources = Q()
+    for resource in CONFLICT_RESOURCES:
+        value = (getattr(event, resource) or '').strip()
+        if value:
+            resources |= Q(**{resource: value})
+    if not resources:
+        return []
+
+    start, end = _window(event)
+    candidates = Event.objects.filter(resources).exclude(status=EventStatus.CANCELLED).filter(
+        start_time__lt=event.end_time, end_time__gt=event.start_time,
+    ).select_related('category', 'calendar')
+    if event.pk:
+        candidates = candidates.exclude(pk=event.pk)
+
+    # Occurrences are cached by rule as well as by event, so unsaved rule
+    # changes are expanded afresh
+    mine = occurrences(event, start, end)
+    own = {id(occurrence) for occurrence in mine}
+    return [
+        conflict if id(conflict.second) in own else conflict._replace(first=conflict.second, second=conflict.first)
+        for conflict in sweep_conflicts(mine + expand_window(candidates, start, end))
+        if (id(conflict.first) in own) != (id(conflict.second) in own)
+    ]
+
+
+def conflict_report(queryset, start, end):
+    """All clashes between the occurrences of ``queryset`` in ``[start, end]``."""
+    queryset = queryset.exclude(status=EventStatus.CANCELLED).exclude(
+        location='', organizer='',
+    ).select_related('category', 'calendar')
+    return sweep_conflicts(expand_window(queryset, start, end))
@@ -0,0 +1,66 @@
+"""
+Event counts of calendars and categories.
+
+``Calendar.event_count`` and ``Category.event_count`` are maintained
+columns, so reading a count (nested in every event, or listing categories)
+is a column fetch rather than a COUNT. Event creates, deletes and moves
+between calendars or categories adjust them with ``F()`` updates in the
+writing transaction (``signals.event_counts``); bulk inserts call
+``count_events``. ``reconcile_event_counts`` recounts from the events table
+should they ever drift, e.g. after raw SQL writes.
+"""
+from collections import Counter
+
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from ..models.calendar import Calendar
+from ..models.category import Category
+from ..models.event import Event
+
+# (model, Event foreign key) of each counted relation
+COUNTED = ((Calendar, 'calendar'), (Category, 'category'))
+
+
+def adjust_event_counts(calendars=None, categories=None):
+    """Apply ``{id: delta}`` changes to the counts: one UPDATE per object
+    changed, in id order so concurrent writers lock rows alike."""
+    for model, deltas in ((Calendar, calendars or {}), (Category, categories or {})):
+        for pk in sorted(pk for pk, delta in deltas.items() if pk is not None and delta):
+            model.objects.filter(pk=pk).update(event_count=F('event_count') + deltas[pk])
+
+
+def count_events(events, delta=1):
+    """Add (or with ``delta=-1`` remove) ``events`` to their calendars' and categories' counts."""
+    calendars, categories = Counter(), Counter()
+    for event in events:
+        calendars[event.calendar_id] += delta
+        categories[event.category_id] += delta
+    adjust_event_counts(calendars, categories)
+
+
+def move_event_count(before, after):
+    """Move one event's count between ``count_state`` tuples, as loaded and as saved."""
+    if before == after:
+        return
+    calendars, categories = Counter(), Counter()
+    for (calendar_id, category_id), delta in ((before, -1), (after, 1)):
+        calendars[calendar_id] += delta
+        categories[category_id] += delta
+    adjust_event_counts(calendars, categories)
+
+
+def reconcile_event_counts():
+    """Recount every calendar and category from the events table.
+    Returns: dict of the number of rows corrected per model"""
+    corrected = {}
+    for model, relation in COUNTED:
+        actual = Coalesce(Subquery(
+            Event.objects.filter(**{relation: OuterRef('pk')}).order_by()
+            .values(relation).annotate(count=Count('id')).values('count')
+        ), Value(0))
+        drifted = model.objects.annotate(actual=actual).exclude(event_count=F('actual'))
+        corrected[model._meta.verbose_name_plural] = model.objects.filter(
+            pk__in=list(drifted.values_list('pk', flat=True))
+        ).update(event_count=actual)
+    return corrected
@@ -0,0 +1,95 @@
+"""
+Materialized per-day rows of events.
+
+``EventDay`` holds one row per day a non-recurring event covers, so a day,
+agenda or "today" view looks its events up by ``day`` equality (plus the
+copied calendar, category and status) instead of range predicates over
+``start_date``/``end_date``. Rows are rewritten only when one of the
+event's ``DAY_FIELDS`` changes (``signals.event_days``); bulk writers call
+``refresh_event_days`` and ``rebuild_event_days`` repopulates the table.
+
+Recurring series are not materialized, as they may be open-ended; they are
+expanded for the asked day as in ``services.recurrence``.
+"""
+from datetime import timedelta
+
+from django.db import connection, transaction
+
+from ..models.event import Event, RecurrenceFrequency
+from ..models.event_day import EventDay
+from .recurrence import Occurrence, occurrences, recurring_in_window
+
+REFRESH_CHUNK = 500
+INSERT_BATCH = 2000
+# Columns of the rows built by ``event_days``
+DAY_COLUMNS = ('event_id', 'day', 'calendar_id', 'category_id', 'status')
+
+
+def event_days(event):
+    """EventDay rows (``DAY_COLUMNS`` tuples) of ``event``; none for recurring or undated events."""
+    if event.is_recurring or not event.start_date:
+        return []
+    last = event.end_date or event.start_date
+    return [
+        (event.pk, event.start_date + timedelta(days=offset), event.calendar_id, event.category_id, event.status)
+        for offset in range((last - event.start_date).days + 1)
+    ]
+
+
+def _insert(rows):
+    # Plain executemany: these derived rows need none of bulk_create's model handling
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        EventDay._meta.db_table, ', '.join(DAY_COLUMNS), ', '.join(['%s'] * len(DAY_COLUMNS)),
+    )
+    with connection.cursor() as cursor:
+        for i in range(0, len(rows), INSERT_BATCH):
+            cursor.executemany(sql, rows[i:i + INSERT_BATCH])
+
+
+def refresh_event_days(events):
+    """Rewrite the EventDay rows of ``events``: two queries per 500 events."""
+    events = [event for event in events if event.pk]
+    with transaction.atomic():
+        for i in range(0, len(events), REFRESH_CHUNK):
+            chunk = events[i:i + REFRESH_CHUNK]
+            EventDay.objects.filter(event_id__in=[event.pk for event in chunk]).delete()
+            _insert([row for event in chunk for row in event_days(event)])
+    for event in events:
+        event._day_state = event.day_state()
+
+
+def rebuild_event_days():
+    """Repopulate EventDay from every event. Returns the number of rows."""
+    events = Event.objects.filter(recurrence_frequency=RecurrenceFrequency.NONE, start_date__isnull=False)
+    rows = 0
+    with transaction.atomic():
+        EventDay.objects.all().delete()
+        batch = []
+        for pk, start, end, calendar_id, category_id, status in events.values_list(
+                'id', 'start_date', 'end_date', 'calendar_id', 'category_id', 'status',
+        ).iterator(chunk_size=INSERT_BATCH):
+            batch.extend(
+                (pk, start + timedelta(days=offset), calendar_id, category_id, status)
+                for offset in range(((end or start) - start).days + 1)
+            )
+            if len(batch) >= INSERT_BATCH:
+                _insert(batch)
+                rows += len(batch)
+                batch = []
+        _insert(batch)
+    return rows + len(batch)
+
+
+def events_on(queryset, day, **day_filters):
+    """
+    Occurrences of the events of ``queryset`` on ``day``, sorted by start
+    time. ``day_filters`` are EventDay lookups (``status__in``,
+    ``calendar__ukid``, ...) narrowing the materialized rows through their
+    indexes; ``queryset`` should apply the same conditions for recurring series.
+    """
+    rows = EventDay.objects.filter(day=day, **day_filters).values('event_id')
+    result = [Occurrence(event, event.start_date, event.end_date) for event in queryset.filter(pk__in=rows)]
+    for event in recurring_in_window(queryset, day, day):
+        result.extend(occurrences(event, day, day))
+    result.sort(key=lambda occurrence: (occurrence.event.start_time, occurrence.event.pk))
+    return result
@@ -0,0 +1,341 @@
+"""
+Bulk import of events from CSV or ICS files.
+
+The upload is decoded and parsed line by line, every row is validated in a
+single pass with the rules of ``EventCreateSerializer``, and categories and
+calendars are resolved (by ukid or by name) with one query each. Valid rows
+get their slugs allocated as a batch and are written with chunked
+``bulk_create`` inside one transaction; invalid rows are reported back by
+row number.
+"""
+import codecs
+import csv
+import re
+import uuid
+from collections import defaultdict
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import serializers
+
+from ..models.calendar import Calendar
+from ..models.category import Category
+from ..models.event import Event, EventType
+from ..serializers.event import EventImportRowSerializer
+from .event_counts import count_events
+from .event_days import refresh_event_days
+from .ics_feed import ALL_DAY_END
+from .invalidation import events_changed
+from .reminders import schedule_reminders
+from .slugs import assign_slugs
+
+IMPORT_MAX_ROWS = getattr(settings, 'CALENDAR_IMPORT_MAX_ROWS', 5000)
+IMPORT_BATCH_SIZE = getattr(settings, 'CALENDAR_IMPORT_BATCH_SIZE', 500)
+
+LIST_FIELDS = ['recurrence_byday', 'recurrence_exdates']
+ICS_DURATION = re.compile(r'^P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+
+# CSV ---------------------------------------------------------------------
+
+def iter_csv_rows(lines):
+    """
+    Rows of a CSV export whose headers are the event field names
+    (title, category, start_date, start_time, ...).
+    Yields: (line number, data, parse error)
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        data = {
+            key.strip().lower(): value.strip()
+            for key, value in row.items()
+            if key and isinstance(value, str) and value.strip()
+        }
+        if not data:
+            continue
+        for field in LIST_FIELDS:
+            if field in data:
+                data[field] = [item for item in re.split(r'[\s,;]+', data[field]) if item]
+        if 'recurrence_byday' in data:
+            data['recurrence_byday'] = [day.upper() for day in data['recurrence_byday']]
+        yield reader.line_num, data, None
+
+# ICS ---------------------------------------------------------------------
+
+def _unfold(lines):
+    """Join RFC 5545 folded lines. Yields: (line number, logical line)"""
+    current, start = None, 0
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield start, current
+        current, start = line, number
+    if current:
+        yield start, current
+
+
+def _split_property(line):
+    """``NAME;PARAM=x:value`` -> (NAME, {PARAM: x}, value); colons inside quotes are kept."""
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ':' and not quoted:
+            head, value = line[:index], line[index + 1:]
+            break
+    else:
+        head, value = line, ''
+    name, *params = head.split(';')
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition('=')
+        parameters[key.upper()] = param_value.strip('"')
+    return name.upper(), parameters, value
+
+
+def _unescape(value):
+    return re.sub(r'\\([\\;,nN])', lambda m: '\n' if m.group(1) in 'nN' else m.group(1), value)
+
+
+def _ics_moment(value, params):
+    """A date for all-day values, otherwise a datetime in the current time zone
+    (floating times are kept as they are)."""
+    value = value.strip()
+    try:
+        if params.get('VALUE') == 'DATE' or len(value) == 8:
+            return datetime.strptime(value, '%Y%m%d').date()
+        moment = datetime.strptime(value.rstrip('Zz'), '%Y%m%dT%H%M%S')
+    except ValueError:
+        raise ValueError(f'Invalid date or time "{value}".')
+    if value[-1:] in 'Zz':
+        moment = moment.replace(tzinfo=dt_timezone.utc)
+    elif params.get('TZID'):
+        try:
+            moment = moment.replace(tzinfo=ZoneInfo(params['TZID']))
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown time zone \"{params['TZID']}\".")
+    if timezone.is_aware(moment):
+        moment = timezone.localtime(moment).replace(tzinfo=None)
+    return moment
+
+
+def _ics_duration(value):
+    match = ICS_DURATION.match(value.strip().lstrip('+'))
+    if not match:
+        raise ValueError(f'Invalid duration {value}.')
+    weeks, days, hours, minutes, seconds = (int(part or 0) for part in match.groups())
+    return timedelta(weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds)
+
+
+def _ics_recurrence(value):
+    """Map an RRULE onto the event's recurrence fields."""
+    rule = dict(part.partition('=')[::2] for part in value.upper().split(';') if part)
+    data = {'recurrence_frequency': rule.get('FREQ', '').lower()}
+    if rule.get('INTERVAL'):
+        data['recurrence_interval'] = rule['INTERVAL']
+    if rule.get('BYDAY'):
+        data['recurrence_byday'] = rule['BYDAY'].split(',')
+    if rule.get('COUNT'):
+        data['recurrence_count'] = rule['COUNT']
+    if rule.get('UNTIL'):
+        until = _ics_moment(rule['UNTIL'], {})
+        data['recurrence_until'] = until if not isinstance(until, datetime) else until.date()
+    return data
+
+
+def _vevent_row(properties):
+    """Turn the properties of one VEVENT into event field data."""
+    data, exdates = {}, []
+    start = end = duration = None
+    for name, params, value in properties:
+        if name == 'SUMMARY':
+            data['title'] = _unescape(value).strip()
+        elif name == 'DESCRIPTION':
+            data['description'] = _unescape(value).strip()
+        elif name == 'LOCATION':
+            data['location'] = _unescape(value).strip()
+        elif name == 'ORGANIZER':
+            data['organizer'] = params.get('CN') or re.sub(r'^mailto:', '', value, flags=re.I)
+        elif name == 'CATEGORIES':
+            categories = [item.strip() for item in _unescape(value).split(',') if item.strip()]
+            if categories:
+                data['category'] = categories[0]
+        elif name == 'DTSTART':
+            start = _ics_moment(value, params)
+        elif name == 'DTEND':
+            end = _ics_moment(value, params)
+        elif name == 'DURATION':
+            duration = _ics_duration(value)
+        elif name == 'RRULE':
+            data.update(_ics_recurrence(value))
+        elif name == 'EXDATE':
+            for item in value.split(','):
+                moment = _ics_moment(item, params)
+                exdates.append(moment.date() if isinstance(moment, datetime) else moment)
+
+    if start is None:
+        raise ValueError('Event has no DTSTART.')
+    if end is None and duration is not None:
+        end = start + duration
+    if exdates:
+        data['recurrence_exdates'] = exdates
+
+    if isinstance(start, datetime):
+        end = end if isinstance(end, datetime) else start
+        data.update(start_date=start.date(), start_time=start.time(),
+                    end_date=end.date(), end_time=end.time())
+    else:
+        # All-day: DTEND is exclusive, so the event ends the day before
+        last_day = end - timedelta(days=1) if end and end > start else start
+        if isinstance(last_day, datetime):
+            last_day = last_day.date()
+        data.update(start_date=start, start_time=time.min, end_date=last_day, end_time=ALL_DAY_END)
+    return data
+
+
+def iter_ics_rows(lines):
+    """
+    VEVENTs of an iCalendar file, numbered by their ``BEGIN:VEVENT`` line.
+    Yields: (line number, data, parse error)
+    """
+    properties, start = None, 0
+    for number, line in _unfold(lines):
+        name, params, value = _split_property(line)
+        if name == 'BEGIN' and value.upper() == 'VEVENT':
+            properties, start = [], number
+        elif name == 'END' and value.upper() == 'VEVENT' and properties is not None:
+            try:
+                yield start, _vevent_row(properties), None
+            except ValueError as e:
+                yield start, None, str(e)
+            properties = None
+        elif properties is not None:
+            properties.append((name, params, value))
+
+# Import ------------------------------------------------------------------
+
+def resolve_references(model, name_field, references):
+    """
+    Map each reference (a ukid or a name) to the matching instances in one
+    query. Names that match several rows map to all of them so the caller
+    can report the ambiguity.
+    """
+    resolved = {reference: [] for reference in references}
+    ukids, names = {}, set()
+    for reference in references:
+        try:
+            ukids[reference] = uuid.UUID(reference)
+        except ValueError:
+            names.add(reference)
+    if not references:
+        return resolved
+
+    by_ukid, by_name = {}, defaultdict(list)
+    for instance in model.objects.filter(Q(ukid__in=ukids.values()) | Q(**{f'{name_field}__in': names})):
+        by_ukid[instance.ukid] = instance
+        by_name[getattr(instance, name_field)].append(instance)
+    for reference in references:
+        if reference in ukids:
+            resolved[reference] = [by_ukid[ukids[reference]]] if ukids[reference] in by_ukid else []
+        else:
+            resolved[reference] = by_name.get(reference, [])
+    return resolved
+
+
+def _bulk_create(events):
+    """Insert ``events`` in chunks in one transaction, re-allocating slugs
+    if a concurrent write took one of them."""
+    for attempt in range(Event.SLUG_ATTEMPTS):
+        assign_slugs(events)
+        try:
+            with transaction.atomic():
+                Event.objects.bulk_create(events, batch_size=IMPORT_BATCH_SIZE)
+            return
+        except IntegrityError:
+            for event in events:
+                event.pk = None
+                event.slug = ''
+            if attempt == Event.SLUG_ATTEMPTS - 1:
+                raise
+
+
+def import_events(file, file_format, category=None, calendar=None, user_id=None, dry_run=False):
+    """
+    Import events from an uploaded CSV or ICS file.
+    category/calendar: defaults (ukid or name) for rows that do not name one
+    dry_run: validate and report without writing
+    Returns: dict with rows, created and errors (``[{row, errors}]``)
+    Raises: ValueError for unreadable files or files over the row limit
+    """
+    parse = iter_ics_rows if file_format == 'ics' else iter_csv_rows
+    rows, errors = [], []
+    unparsed = 0
+    try:
+        for number, data, error in parse(codecs.iterdecode(file, 'utf-8-sig')):
+            if len(rows) + unparsed >= IMPORT_MAX_ROWS:
+                raise ValueError(f'Imports are limited to {IMPORT_MAX_ROWS} events per file.')
+            if error:
+                unparsed += 1
+                errors.append({'row': number, 'errors': {'non_field_errors': [error]}})
+                continue
+            if category and not data.get('category'):
+                data['category'] = category
+            if calendar and not data.get('calendar'):
+                data['calendar'] = calendar
+            if data.get('start_date') and not data.get('end_date'):
+                data['end_date'] = data['start_date']
+            rows.append((number, data))
+    except UnicodeDecodeError:
+        raise ValueError('File must be UTF-8 encoded.')
+    except csv.Error as e:
+        raise ValueError(f'Invalid CSV: {e}')
+
+    lookups = {
+        'category': resolve_references(Category, 'name', {str(d['category']) for _, d in rows if d.get('category')}),
+        'calendar': resolve_references(Calendar, 'title', {str(d['calendar']) for _, d in rows if d.get('calendar')}),
+    }
+    # Clashes are left to the conflict report rather than checked row by row
+    validator = EventImportRowSerializer(context={'lookups': lookups, 'check_conflicts': False})
+
+    events = []
+    for number, data in rows:
+        data.setdefault('type', _infer_type(data))
+        try:
+            attrs = validator.run_validation(data)
+        except serializers.ValidationError as e:
+            errors.append({'row': number, 'errors': e.detail})
+            continue
+        event = Event(**attrs, created_by=user_id, updated_by=user_id)
+        # bulk_create skips save(), which normally derives this
+        event.recurrence_end_date = event.compute_recurrence_end_date()
+        events.append(event)
+
+    if events and not dry_run:
+        with transaction.atomic():
+            _bulk_create(events)
+            # bulk_create sends no post_save, so derived rows are written here in one go
+            refresh_event_days(events)
+            count_events(events)
+        schedule_reminders(events)
+        events_changed(events)
+
+    errors.sort(key=lambda error: error['row'])
+    return {
+        'rows': len(rows) + unparsed,
+        'valid': len(events),
+        'created': 0 if dry_run else len(events),
+        'errors': errors,
+    }
+
+
+def _infer_type(data):
+    """Single or multi-day from the dates when a row does not say."""
+    start, end = data.get('start_date'), data.get('end_date')
+    return EventType.MULTI_DAY if start and end and str(start) != str(end) else EventType.SINGLE_DAY
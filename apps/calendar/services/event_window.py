@@ -0,0 +1,15 @@
+from ..models.event_day import EventDay
+
+
+def overlapping(queryset, start, end):
+    """
+    Narrow a queryset of plain (non-recurring) events to those overlapping
+    ``[start, end]``.
+
+    Multi-day events that begin before the window or end after it are
+    included. Events are found through their ``EventDay`` rows, a range on
+    ``day`` bounded at both ends, so the cost follows the window rather than
+    the history before it, which ``start_date <= end`` alone would scan.
+    Recurring series have no day rows; see ``recurrence.recurring_in_window``.
+    """
+    return queryset.filter(pk__in=EventDay.objects.filter(day__gte=start, day__lte=end).order_by().values('event_id'))
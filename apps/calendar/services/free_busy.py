@@ -0,0 +1,164 @@
+"""
+Free/busy of locations and organizers over a window.
+
+The events using any of the asked resources are fetched in one query
+(plain events overlapping the window and recurring series that may reach
+it). Every occurrence occupies ``start_time``-``end_time`` on each of its
+days, as in ``services.conflicts``. Per resource the intervals are sorted
+and merged in one linear sweep into busy blocks; the gaps between them,
+optionally limited to working hours, are the free slots.
+
+Results are cached per (resources, window, hours, visibility) under a
+versioned namespace that ``events_changed`` bumps on any event write.
+"""
+import hashlib
+import json
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models.event import Event, EventStatus, RecurrenceFrequency
+from .cache import bump_cache_version, cache_version
+from .conflicts import CONFLICT_RESOURCES, resource_key
+from .recurrence import occurrences
+
+FREE_BUSY_NAMESPACE = 'free_busy'
+FREE_BUSY_TTL = getattr(settings, 'CALENDAR_FREE_BUSY_TTL', 10 * 60)
+
+
+FREE_BUSY_FIELDS = (
+    'id', 'ukid', 'location', 'organizer', 'start_date', 'end_date', 'start_time', 'end_time',
+    'recurrence_frequency', 'recurrence_interval', 'recurrence_byday', 'recurrence_until',
+    'recurrence_count', 'recurrence_exdates',
+)
+
+
+def _iso(moment):
+    # Intervals are merged in naive wall time and made aware for the response
+    return timezone.make_aware(moment).isoformat()
+
+
+def merge_intervals(intervals):
+    """
+    Merge ``(start, end, event ukid)`` intervals into busy blocks.
+    Returns: list of (start, end, [event ukids]) in order, blocks not touching
+    """
+    blocks = []
+    for start, end, ukid in sorted(intervals, key=lambda interval: interval[:2]):
+        if blocks and start <= blocks[-1][1]:
+            block = blocks[-1]
+            block[1] = max(block[1], end)
+            if ukid not in block[2]:
+                block[2].append(ukid)
+        else:
+            blocks.append([start, end, [ukid]])
+    return [tuple(block) for block in blocks]
+
+
+def free_gaps(blocks, start, end, day_start=None, day_end=None):
+    """
+    Free slots of ``[start, end]`` (dates) around ``blocks``, each day cut
+    to ``day_start``-``day_end`` when given. Returns: list of (start, end)
+    """
+    gaps = []
+    day = start
+    blocks = iter(blocks)
+    block = next(blocks, None)
+    while day <= end:
+        opens = datetime.combine(day, day_start or time.min)
+        closes = datetime.combine(day, day_end) if day_end else datetime.combine(day + timedelta(days=1), time.min)
+        cursor = opens
+        while block and block[0] < closes:
+            if block[1] > cursor:
+                if block[0] > cursor:
+                    gaps.append((cursor, block[0]))
+                cursor = block[1]
+            if block[1] > closes:
+                break
+            block = next(blocks, None)
+        if cursor < closes:
+            gaps.append((cursor, closes))
+        day += timedelta(days=1)
+    return gaps
+
+
+def compute_free_busy(resources, start, end, day_start=None, day_end=None, published_only=False):
+    """
+    Busy blocks and free slots of each resource in ``[start, end]``.
+
+    resources: list of (resource, value) with resource in CONFLICT_RESOURCES
+    Returns: dict with from, to and resources (resource, value, busy blocks
+             with their events, free slots)
+    """
+    resources = list(dict.fromkeys((resource, resource_key(value)) for resource, value in resources))
+    wanted = Q()
+    for resource in CONFLICT_RESOURCES:
+        values = {value for kind, value in resources if kind == resource and value}
+        if values:
+            wanted |= Q(**{f'{resource}__in': values})
+
+    intervals = {key: [] for key in resources}
+    if wanted:
+        queryset = Event.objects.filter(wanted).exclude(status=EventStatus.CANCELLED).filter(
+            Q(recurrence_frequency=RecurrenceFrequency.NONE, start_date__lte=end, end_date__gte=start)
+            | (~Q(recurrence_frequency=RecurrenceFrequency.NONE) & Q(start_date__lte=end)
+               & (Q(recurrence_end_date__isnull=True) | Q(recurrence_end_date__gte=start)))
+        )
+        if published_only:
+            queryset = queryset.filter(status=EventStatus.PUBLISHED)
+
+        for row in queryset.values(*FREE_BUSY_FIELDS):
+            keys = [key for key in ((resource, resource_key(row[resource]))
+                                    for resource in CONFLICT_RESOURCES) if key in intervals]
+            if row['recurrence_frequency']:
+                event = Event(**row)
+                spans = [(occurrence.start_date, occurrence.end_date) for occurrence in occurrences(event, start, end)]
+            else:
+                spans = [(row['start_date'], row['end_date'])]
+            ukid = str(row['ukid'])
+            for first, last in spans:
+                day = max(first, start)
+                while day <= min(last, end):
+                    interval = (datetime.combine(day, row['start_time']), datetime.combine(day, row['end_time']))
+                    for key in keys:
+                        intervals[key].append(interval + (ukid,))
+                    day += timedelta(days=1)
+
+    result = []
+    for resource, value in resources:
+        blocks = merge_intervals(intervals[(resource, value)])
+        result.append({
+            'resource': resource,
+            'value': value,
+            'busy': [
+                {'start': _iso(block_start), 'end': _iso(block_end), 'events': ukids}
+                for block_start, block_end, ukids in blocks
+            ],
+            'free': [
+                {'start': _iso(gap_start), 'end': _iso(gap_end)}
+                for gap_start, gap_end in free_gaps(blocks, start, end, day_start, day_end)
+            ],
+        })
+    return {'from': start.isoformat(), 'to': end.isoformat(), 'resources': result}
+
+
+def get_free_busy(resources, start, end, day_start=None, day_end=None, published_only=False):
+    """Cached :func:`compute_free_busy`."""
+    request = json.dumps([
+        list(resources), start.isoformat(), end.isoformat(),
+        day_start and day_start.isoformat(), day_end and day_end.isoformat(), published_only,
+    ])
+    digest = hashlib.sha1(request.encode()).hexdigest()
+    key = f'calendar:{FREE_BUSY_NAMESPACE}:{digest}:{cache_version(FREE_BUSY_NAMESPACE)}'
+    result = cache.get(key)
+    if result is None:
+        result = compute_free_busy(resources, start, end, day_start, day_end, published_only)
+        cache.set(key, result, FREE_BUSY_TTL)
+    return result
+
+
+def invalidate_free_busy():
+    bump_cache_version(FREE_BUSY_NAMESPACE)
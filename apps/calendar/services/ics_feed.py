@@ -0,0 +1,154 @@
+"""
+iCalendar (RFC 5545) feeds of events for external calendar apps.
+
+Feeds are polled every few minutes, so the validators (ETag and
+Last-Modified) come from a single aggregate over the feed's events and an
+unchanged feed is answered with 304 before any event is loaded. Changed
+feeds are streamed one VEVENT at a time from ``.iterator()``.
+"""
+import hashlib
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from ..models.event import EventStatus
+
+PRODID = '-//EMIS//Academic Calendar//EN'
+UID_DOMAIN = 'emis'
+FEED_CHUNK_SIZE = 500
+ALL_DAY_END = time(23, 59, 59)
+
+ICS_STATUS = {
+    EventStatus.DRAFT: 'TENTATIVE',
+    EventStatus.PUBLISHED: 'CONFIRMED',
+    EventStatus.POSTPONED: 'TENTATIVE',
+    EventStatus.CANCELLED: 'CANCELLED',
+}
+
+
+def feed_validators(events, scope, variant=''):
+    """
+    ETag and Last-Modified for a feed, from one aggregate query.
+    events: the feed's event queryset (already filtered for visibility)
+    scope: the calendar or category the feed belongs to; its own edits
+           (e.g. a rename, which changes the feed name) count as changes
+    variant: distinguishes differently filtered feeds of the same scope
+    Returns: (etag, last_modified)
+    """
+    state = events.order_by().aggregate(
+        count=Count('id'),
+        last_event=Max('updated_at'),
+        last_category=Max('category__updated_at'),
+    )
+    moments = [moment for moment in (state['last_event'], state['last_category'], scope.updated_at) if moment]
+    last_modified = max(moments) if moments else None
+    # The count catches deletions, which leave max(updated_at) unchanged
+    key = '|'.join(str(part) for part in (
+        scope.ukid, scope.updated_at.isoformat(), state['count'],
+        state['last_event'], state['last_category'], variant,
+    ))
+    return f'"{hashlib.md5(key.encode()).hexdigest()}"', last_modified
+
+
+def _escape(value):
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _fold(line):
+    """Fold a content line at 75 octets, without splitting a UTF-8 character."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start, limit = end, 74
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _utc(day, moment):
+    """A local date and time as an iCalendar UTC date-time."""
+    aware = timezone.make_aware(datetime.combine(day, moment))
+    return aware.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _recurrence_lines(event, all_day):
+    if not event.is_recurring:
+        return []
+    rule = [f'FREQ={event.recurrence_frequency.upper()}']
+    if event.recurrence_interval and event.recurrence_interval > 1:
+        rule.append(f'INTERVAL={event.recurrence_interval}')
+    if event.recurrence_byday:
+        rule.append(f"BYDAY={','.join(event.recurrence_byday)}")
+    if event.recurrence_count:
+        rule.append(f'COUNT={event.recurrence_count}')
+    elif event.recurrence_until:
+        # UNTIL has to have the same value type as DTSTART
+        rule.append('UNTIL=' + (event.recurrence_until.strftime('%Y%m%d') if all_day
+                                else _utc(event.recurrence_until, event.start_time)))
+    lines = ['RRULE:' + ';'.join(rule)]
+    for day in event.recurrence_exdates:
+        day = datetime.strptime(day, '%Y-%m-%d').date()
+        lines.append(f"EXDATE;VALUE=DATE:{day.strftime('%Y%m%d')}" if all_day
+                     else f'EXDATE:{_utc(day, event.start_time)}')
+    return lines
+
+
+def vevent(event):
+    """One VEVENT block for ``event`` (with ``category`` selected)."""
+    all_day = event.start_time == time.min and event.end_time == ALL_DAY_END
+    end_date = event.end_date or event.start_date
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{event.ukid}@{UID_DOMAIN}',
+        f"DTSTAMP:{event.updated_at.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')}",
+        f"LAST-MODIFIED:{event.updated_at.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')}",
+    ]
+    if all_day:
+        # DTEND of an all-day event is exclusive
+        lines += [
+            f"DTSTART;VALUE=DATE:{event.start_date.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(end_date + timedelta(days=1)).strftime('%Y%m%d')}",
+        ]
+    else:
+        lines += [
+            f'DTSTART:{_utc(event.start_date, event.start_time)}',
+            f'DTEND:{_utc(end_date, event.end_time)}',
+        ]
+    lines.append(f'SUMMARY:{_escape(event.title)}')
+    if event.description:
+        lines.append(f'DESCRIPTION:{_escape(event.description)}')
+    if event.location:
+        lines.append(f'LOCATION:{_escape(event.location)}')
+    if event.registration_url:
+        lines.append(f'URL:{event.registration_url}')
+    lines.append(f'CATEGORIES:{_escape(event.category.name)}')
+    lines.append(f'STATUS:{ICS_STATUS.get(event.status, "CONFIRMED")}')
+    lines += _recurrence_lines(event, all_day)
+    lines.append('END:VEVENT')
+    return ''.join(_fold(line) for line in lines)
+
+
+def iter_feed(events, name):
+    """
+    Stream an iCalendar document for ``events``.
+    Yields: text chunks (the header, one VEVENT per event, the footer)
+    """
+    yield ''.join(_fold(line) for line in [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{_escape(name)}',
+    ])
+    queryset = events.select_related('category').order_by('start_date', 'start_time', 'id')
+    for event in queryset.iterator(chunk_size=FEED_CHUNK_SIZE):
+        if event.start_date:
+            yield vevent(event)
+    yield 'END:VCALENDAR\r\n'
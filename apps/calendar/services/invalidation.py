@@ -0,0 +1,27 @@
+from .analytics import invalidate_analytics
+from .free_busy import invalidate_free_busy
+from .month_grid import invalidate_month_grids
+from .search import sync_search_index
+from .snapshots import schedule_snapshots
+from .upcoming import invalidate_upcoming
+
+
+def events_changed(events=None, snapshots=True):
+    """
+    Refresh caches derived from events after writes that bypass model
+    signals (``bulk_create``, ``QuerySet.update``/``delete``). Pass the
+    affected events when known so only the month grids they touch are
+    dropped (and their search index rows refreshed); without them every
+    grid is dropped and the search index is left to
+    ``rebuild_event_search_index``. Public snapshots are republished after
+    commit, for the events' calendars and categories or all of them, unless
+    ``snapshots`` is False because the caller republishes them itself.
+    """
+    invalidate_analytics()
+    invalidate_free_busy()
+    invalidate_month_grids(events)
+    invalidate_upcoming()
+    if snapshots:
+        schedule_snapshots(events)
+    if events is not None:
+        sync_search_index(event.pk for event in events if event.pk)
@@ -0,0 +1,46 @@
+"""
+Active calendar layout per user, cached.
+
+Every calendar screen asks for the user's active layout, so it is kept in
+the cache under a per-user key along with its ETag, and served without a
+query until one of the user's layouts is saved, deleted or activated
+(``signals.layout_cache``, ``CalendarLayout.activate``).
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..models.layout import CalendarLayout
+from ..serializers.layout import CalendarLayoutSerializer
+
+LAYOUT_CACHE_TTL = getattr(settings, 'CALENDAR_LAYOUT_CACHE_TTL', 24 * 60 * 60)
+
+
+def _key(user_id):
+    return f'calendar:layout:active:{user_id}'
+
+
+def active_layout(user_id):
+    """
+    The user's active layout, cached.
+    Returns: dict with ``layout`` (serialized) and ``etag``, or None
+    """
+    entry = cache.get(_key(user_id))
+    if entry is None:
+        layout = CalendarLayout.objects.filter(user_id=user_id, active=True).order_by('-updated_at').first()
+        entry = {}
+        if layout:
+            version = f'{layout.pk}:{layout.updated_at.isoformat()}'
+            entry = {
+                'layout': CalendarLayoutSerializer(layout).data,
+                'etag': '"{}"'.format(hashlib.sha1(version.encode()).hexdigest()),
+            }
+        cache.set(_key(user_id), entry, LAYOUT_CACHE_TTL)
+    return entry or None
+
+
+def invalidate_active_layout(user_id):
+    """Drop the cached layout of ``user_id`` once the current transaction commits."""
+    transaction.on_commit(lambda: cache.delete(_key(user_id)))
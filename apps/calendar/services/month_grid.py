@@ -0,0 +1,122 @@
+"""
+Month grids of a calendar: every day of a month mapped to the events on it.
+
+Grids are cached per (calendar, month, visibility). Keys carry three
+version tokens (all grids, the calendar, the month of the calendar), so a
+change to an event only drops the grids of the months it touches, before
+and after the change. Open-ended recurring events, or changes whose events
+are unknown, fall back to the wider namespaces.
+"""
+import calendar as calendar_module
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..models.event import EventStatus
+from ..serializers.event import EventCompactSerializer
+from .cache import bump_cache_version, cache_versions
+from .recurrence import expand_window
+
+GRID_NAMESPACE = 'month_grid'
+GRID_TTL = getattr(settings, 'CALENDAR_MONTH_GRID_TTL', 24 * 60 * 60)
+GRID_EVENTS_PER_DAY = getattr(settings, 'CALENDAR_MONTH_GRID_EVENTS_PER_DAY', 4)
+# Changes spanning more months than this drop the whole calendar's grids
+GRID_MAX_MONTHS = 24
+
+VISIBILITY_ALL = 'all'
+VISIBILITY_PUBLISHED = 'published'
+
+
+def _calendar_namespace(calendar_id):
+    return f'{GRID_NAMESPACE}:{calendar_id}'
+
+
+def _month_namespace(calendar_id, month):
+    return f'{GRID_NAMESPACE}:{calendar_id}:{month:%Y-%m}'
+
+
+def _months(start, end):
+    month = start.replace(day=1)
+    while month <= end:
+        yield month
+        month = (month + timedelta(days=32)).replace(day=1)
+
+
+def compute_month_grid(calendar, month, visibility=VISIBILITY_PUBLISHED):
+    """
+    The grid of ``month`` (its first day) for ``calendar``.
+    Returns: dict with days (date, count, events as ukids up to
+             GRID_EVENTS_PER_DAY, overflow) and events (compact, by ukid)
+    """
+    last = month.replace(day=calendar_module.monthrange(month.year, month.month)[1])
+    queryset = calendar.events.select_related('category', 'calendar')
+    if visibility == VISIBILITY_PUBLISHED:
+        queryset = queryset.filter(status=EventStatus.PUBLISHED)
+
+    days = {month + timedelta(days=offset): [] for offset in range(last.day)}
+    events = {}
+    for occurrence in expand_window(queryset, month, last):
+        ukid = str(occurrence.event.ukid)
+        if ukid not in events:
+            events[ukid] = EventCompactSerializer(occurrence.event).data
+        day = max(occurrence.start_date, month)
+        while day <= min(occurrence.end_date, last):
+            days[day].append(ukid)
+            day += timedelta(days=1)
+
+    return {
+        'calendar': str(calendar.ukid),
+        'month': f'{month:%Y-%m}',
+        'days': [
+            {
+                'date': day.isoformat(),
+                'count': len(refs),
+                'events': refs[:GRID_EVENTS_PER_DAY],
+                'overflow': max(len(refs) - GRID_EVENTS_PER_DAY, 0),
+            }
+            for day, refs in days.items()
+        ],
+        'events': events,
+    }
+
+
+def get_month_grid(calendar, month, visibility=VISIBILITY_PUBLISHED):
+    """Cached :func:`compute_month_grid`."""
+    versions = cache_versions(
+        GRID_NAMESPACE, _calendar_namespace(calendar.pk), _month_namespace(calendar.pk, month)
+    )
+    key = f"calendar:{GRID_NAMESPACE}:{calendar.pk}:{month:%Y-%m}:{visibility}:{':'.join(map(str, versions))}"
+    grid = cache.get(key)
+    if grid is None:
+        grid = compute_month_grid(calendar, month, visibility)
+        cache.set(key, grid, GRID_TTL)
+    return grid
+
+
+def _grid_namespaces(calendar_id, start, last, open_ended):
+    if calendar_id is None or start is None:
+        return []
+    if open_ended or last is None:
+        return [_calendar_namespace(calendar_id)]
+    months = list(_months(start, last))
+    if len(months) > GRID_MAX_MONTHS:
+        return [_calendar_namespace(calendar_id)]
+    return [_month_namespace(calendar_id, month) for month in months]
+
+
+def invalidate_month_grids(events=None):
+    """
+    Drop the grids of the months ``events`` touch, as loaded and as they are
+    now. Without events, every grid is dropped.
+    """
+    if events is None:
+        bump_cache_version(GRID_NAMESPACE)
+        return
+    namespaces = set()
+    for event in events:
+        for state in (getattr(event, '_window_state', None), event.window_state()):
+            if state:
+                namespaces.update(_grid_namespaces(*state))
+    if namespaces:
+        bump_cache_version(*namespaces)
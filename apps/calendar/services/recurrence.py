@@ -0,0 +1,131 @@
+"""
+Lazy expansion of recurring events.
+
+A recurring event is stored once, as a series. Occurrences are generated
+only for the window being asked about and kept in a small in-process LRU
+keyed by the event, its rule and the window. Saving or deleting an event
+drops its entries (see ``signals.recurrence``); the rule itself is part of
+the key as well, so another process's edit can never serve stale dates.
+"""
+import threading
+from collections import OrderedDict, namedtuple
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+
+from ..models.event import RecurrenceFrequency
+from .event_window import overlapping
+
+Occurrence = namedtuple('Occurrence', ['event', 'start_date', 'end_date'])
+
+OCCURRENCE_CACHE_SIZE = getattr(settings, 'CALENDAR_OCCURRENCE_CACHE_SIZE', 2048)
+
+
+class OccurrenceCache:
+    """Thread-safe LRU of expanded occurrence dates, invalidated per event."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._keys_by_event = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._keys_by_event.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.maxsize:
+                old_key, _ = self._entries.popitem(last=False)
+                self._forget(old_key)
+
+    def invalidate(self, event_id):
+        with self._lock:
+            for key in self._keys_by_event.pop(event_id, ()):
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_event.clear()
+
+    def _forget(self, key):
+        keys = self._keys_by_event.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_event[key[0]]
+
+
+occurrence_cache = OccurrenceCache(OCCURRENCE_CACHE_SIZE)
+
+
+def _rule_signature(event):
+    return (
+        event.start_date, event.end_date, event.recurrence_frequency,
+        event.recurrence_interval, tuple(event.recurrence_byday),
+        event.recurrence_until, event.recurrence_count,
+        tuple(event.recurrence_exdates),
+    )
+
+
+def occurrence_dates(event, start, end):
+    """Start dates of the occurrences of ``event`` overlapping ``[start, end]``."""
+    if not (event.is_recurring and event.start_date and event.end_date):
+        return ()
+    key = (event.pk, _rule_signature(event), start, end)
+    dates = occurrence_cache.get(key)
+    if dates is None:
+        span = event.end_date - event.start_date
+        excluded = {date.fromisoformat(day) for day in event.recurrence_exdates}
+        rule = event.recurrence_rule()
+        dates = tuple(
+            day.date() for day in rule.between(
+                datetime.combine(start - span, time.min),
+                datetime.combine(end, time.min),
+                inc=True,
+            )
+            if day.date() not in excluded
+        )
+        occurrence_cache.set(key, dates)
+    return dates
+
+
+def occurrences(event, start, end):
+    """Occurrences of ``event`` overlapping ``[start, end]``; a plain event yields itself."""
+    if not event.is_recurring:
+        return [Occurrence(event, event.start_date, event.end_date)]
+    if not (event.start_date and event.end_date):
+        return []
+    span = event.end_date - event.start_date
+    return [Occurrence(event, day, day + span) for day in occurrence_dates(event, start, end)]
+
+
+def recurring_in_window(queryset, start, end):
+    """Recurring series of ``queryset`` that may have occurrences in the window."""
+    return queryset.exclude(recurrence_frequency=RecurrenceFrequency.NONE).filter(
+        Q(recurrence_end_date__isnull=True) | Q(recurrence_end_date__gte=start),
+        start_date__lte=end,
+    )
+
+
+def expand_window(queryset, start, end):
+    """
+    Every occurrence of the events of ``queryset`` overlapping the window:
+    plain events as stored, recurring series expanded lazily. Sorted by
+    start date and time.
+    """
+    plain = overlapping(queryset.filter(recurrence_frequency=RecurrenceFrequency.NONE), start, end)
+    result = [Occurrence(event, event.start_date, event.end_date) for event in plain]
+    for event in recurring_in_window(queryset, start, end):
+        result.extend(occurrences(event, start, end))
+    result.sort(key=lambda occurrence: (occurrence.start_date, occurrence.event.start_time, occurrence.event.pk))
+    return result
@@ -0,0 +1,269 @@
+"""
+Event reminders.
+
+Each published event with reminders enabled has at most one pending
+``Reminder``: the one for its next occurrence. It is upserted when the
+event's timing or reminder fields change (see ``signals.event_remainder``)
+and by bulk writers via ``schedule_reminders``. ``run_reminder_worker``
+polls the ``(status, due_at)`` index for due reminders, hands them to the
+configured backend and, for recurring events, schedules the next one.
+Each batch is claimed with a token before it is sent, so concurrent
+workers (on any database, SQLite included) never deliver the same reminder.
+"""
+import logging
+import sys
+import time as clock
+import uuid
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Q, Subquery
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from ..models.event import EventStatus
+from ..models.reminder import Reminder, ReminderStatus
+
+logger = logging.getLogger(__name__)
+
+REMINDER_BACKEND = getattr(settings, 'CALENDAR_REMINDER_BACKEND',
+                           'apps.calendar.services.reminders.ConsoleReminderBackend')
+REMINDER_BATCH_SIZE = getattr(settings, 'CALENDAR_REMINDER_BATCH_SIZE', 100)
+REMINDER_MAX_ATTEMPTS = getattr(settings, 'CALENDAR_REMINDER_MAX_ATTEMPTS', 3)
+REMINDER_RECIPIENTS = getattr(settings, 'CALENDAR_REMINDER_RECIPIENTS', [])
+# How long a worker may hold a claimed batch before others may retry it
+REMINDER_CLAIM_SECONDS = getattr(settings, 'CALENDAR_REMINDER_CLAIM_SECONDS', 5 * 60)
+SCHEDULE_CHUNK = 500
+
+
+def next_reminder(event, now=None):
+    """
+    The next reminder of ``event`` still due after ``now``.
+    Returns: (occurrence start, due time) or None when no reminder applies
+    """
+    now = now or timezone.now()
+    lead = event.remainder_time_before_event
+    if (event.status != EventStatus.PUBLISHED or not event.reminder_enabled or not lead
+            or not event.start_date or not event.start_time):
+        return None
+
+    if not event.is_recurring:
+        start = timezone.make_aware(datetime.combine(event.start_date, event.start_time))
+        return (start, start - lead) if start - lead > now else None
+
+    # Occurrences starting before now + lead are already past their reminder
+    earliest = timezone.localtime(now + lead).date()
+    excluded = {date.fromisoformat(day) for day in event.recurrence_exdates}
+    for day in event.recurrence_rule().xafter(datetime.combine(earliest, time.min), inc=True):
+        if day.date() in excluded:
+            continue
+        start = timezone.make_aware(datetime.combine(day.date(), event.start_time))
+        if start - lead > now:
+            return start, start - lead
+    return None
+
+
+def schedule_reminders(events, now=None):
+    """
+    Bring the pending reminders of ``events`` in line with their current
+    fields. Idempotent: an occurrence that already has a reminder (sent or
+    not) never gets a second one. A handful of queries per 500 events.
+    """
+    now = now or timezone.now()
+    events = [event for event in events if event.pk]
+    for i in range(0, len(events), SCHEDULE_CHUNK):
+        _schedule_chunk(events[i:i + SCHEDULE_CHUNK], now)
+
+
+def _schedule_chunk(events, now):
+    wanted = {}
+    for event in events:
+        reminder = next_reminder(event, now)
+        if reminder:
+            wanted[event.pk] = reminder
+
+    existing = Reminder.objects.filter(event_id__in=[event.pk for event in events]).filter(
+        Q(status=ReminderStatus.PENDING) | Q(event_start__in={start for start, _ in wanted.values()})
+    ).only('id', 'event_id', 'event_start', 'due_at', 'status')
+
+    stale, changed, present = [], [], set()
+    for reminder in existing:
+        start, due_at = wanted.get(reminder.event_id, (None, None))
+        if reminder.event_start == start:
+            present.add(reminder.event_id)
+            if reminder.status == ReminderStatus.PENDING and reminder.due_at != due_at:
+                reminder.due_at = due_at
+                reminder.updated_at = now
+                changed.append(reminder)
+        elif reminder.status == ReminderStatus.PENDING:
+            stale.append(reminder.pk)
+
+    if stale:
+        Reminder.objects.filter(pk__in=stale, status=ReminderStatus.PENDING).delete()
+    if changed:
+        Reminder.objects.bulk_update(changed, ['due_at', 'updated_at'])
+    missing = [
+        Reminder(event_id=event_id, event_start=start, due_at=due_at)
+        for event_id, (start, due_at) in wanted.items() if event_id not in present
+    ]
+    if missing:
+        # A concurrent scheduler may have created the same occurrence's reminder
+        Reminder.objects.bulk_create(missing, ignore_conflicts=True)
+
+# Delivery ----------------------------------------------------------------
+
+class BaseReminderBackend:
+    """Delivers reminders. ``send`` returns ``{reminder pk: error}`` for failures."""
+
+    def send(self, reminders):
+        raise NotImplementedError
+
+
+class ConsoleReminderBackend(BaseReminderBackend):
+    """Writes reminders to stdout; for development."""
+    stream = sys.stdout
+
+    def send(self, reminders):
+        for reminder in reminders:
+            event = reminder.event
+            self.stream.write(f"Reminder: '{event.title}' starts at "
+                              f"{timezone.localtime(reminder.event_start):%Y-%m-%d %H:%M}\n")
+        self.stream.flush()
+        return {}
+
+
+class EmailReminderBackend(BaseReminderBackend):
+    """
+    Emails each reminder to the event's creator and ``CALENDAR_REMINDER_RECIPIENTS``
+    through Django's email backend (set ``EMAIL_BACKEND`` to the file or
+    console backend locally).
+    """
+
+    def send(self, reminders):
+        creator_ids = {reminder.event.created_by for reminder in reminders if reminder.event.created_by}
+        emails = dict(
+            get_user_model().objects.filter(pk__in=creator_ids).exclude(email='').values_list('pk', 'email')
+        )
+        failures = {}
+        with get_connection() as mail:
+            for reminder in reminders:
+                event = reminder.event
+                recipients = list(REMINDER_RECIPIENTS)
+                if event.created_by in emails:
+                    recipients.append(emails[event.created_by])
+                if not recipients:
+                    failures[reminder.pk] = 'No recipients'
+                    continue
+                starts = timezone.localtime(reminder.event_start)
+                body = f"{event.title} starts at {starts:%Y-%m-%d %H:%M}."
+                if event.location:
+                    body += f"\nLocation: {event.location}"
+                try:
+                    EmailMessage(f"Reminder: {event.title}", body, to=recipients, connection=mail).send()
+                except Exception as e:
+                    failures[reminder.pk] = str(e)
+        return failures
+
+
+def get_backend():
+    return import_string(REMINDER_BACKEND)()
+
+
+def _claimable(now):
+    # Due reminders, and those whose claim outlived a crashed worker
+    return (Q(status=ReminderStatus.PENDING, due_at__lte=now)
+            | Q(status=ReminderStatus.SENDING, claimed_until__lt=now))
+
+
+def claim_due(batch_size=REMINDER_BATCH_SIZE, now=None, claim_seconds=REMINDER_CLAIM_SECONDS):
+    """
+    Claim up to ``batch_size`` due reminders with a single conditional
+    UPDATE stamped with a fresh token, so two workers can never both move a
+    row to SENDING. Returns the claimed reminders (with their event).
+    """
+    now = now or timezone.now()
+    token = uuid.uuid4()
+    due = Reminder.objects.filter(_claimable(now)).order_by('due_at').values('pk')[:batch_size]
+    claimed = Reminder.objects.filter(pk__in=Subquery(due)).filter(_claimable(now)).update(
+        status=ReminderStatus.SENDING, claim_token=token,
+        claimed_until=now + timedelta(seconds=claim_seconds), updated_at=now,
+    )
+    if not claimed:
+        return []
+    return list(Reminder.objects.filter(claim_token=token).select_related('event').order_by('due_at'))
+
+
+def dispatch_due(backend=None, batch_size=REMINDER_BATCH_SIZE, now=None):
+    """
+    Deliver one batch of due reminders. The batch is claimed first (see
+    ``claim_due``) and handed to the backend outside any transaction; the
+    outcome is then written only to rows still carrying this claim.
+    Returns the number of reminders handled.
+    """
+    backend = backend or get_backend()
+    now = now or timezone.now()
+    reminders = claim_due(batch_size, now)
+    if not reminders:
+        return 0
+
+    # An occurrence that has already started is not worth reminding of
+    expired = [reminder for reminder in reminders if reminder.event_start <= now]
+    deliver = [reminder for reminder in reminders if reminder.event_start > now]
+    try:
+        failures = backend.send(deliver) if deliver else {}
+    except Exception as e:
+        logger.exception("Reminder backend failed")
+        failures = {reminder.pk: str(e) for reminder in deliver}
+
+    for reminder in expired:
+        reminder.status = ReminderStatus.EXPIRED
+    for reminder in deliver:
+        reminder.attempts += 1
+        if reminder.pk in failures:
+            reminder.error = failures[reminder.pk]
+            reminder.status = (ReminderStatus.FAILED if reminder.attempts >= REMINDER_MAX_ATTEMPTS
+                               else ReminderStatus.PENDING)
+        else:
+            reminder.status = ReminderStatus.SENT
+            reminder.sent_at = now
+            reminder.error = ''
+
+    with transaction.atomic():
+        token = reminders[0].claim_token
+        # One UPDATE per outcome; rows are grouped by what they are set to
+        outcomes = {}
+        for reminder in reminders:
+            key = (reminder.status, reminder.attempts, reminder.sent_at, reminder.error)
+            outcomes.setdefault(key, []).append(reminder.pk)
+        for (status, attempts, sent_at, error), ids in outcomes.items():
+            Reminder.objects.filter(pk__in=ids, claim_token=token, status=ReminderStatus.SENDING).update(
+                status=status, attempts=attempts, sent_at=sent_at, error=error,
+                claim_token=None, claimed_until=None, updated_at=now,
+            )
+
+    # Recurring events move on to their next occurrence
+    done = [reminder for reminder in reminders if reminder.status != ReminderStatus.PENDING]
+    schedule_reminders({reminder.event_id: reminder.event for reminder in done
+                        if reminder.event.is_recurring}.values(), now)
+    return len(reminders)
+
+
+def run_worker(backend=None, batch_size=REMINDER_BATCH_SIZE, poll_interval=30, once=False):
+    """
+    Deliver due reminders until interrupted (or, with ``once``, until none
+    are due). Returns the number of reminders handled.
+    """
+    backend = backend or get_backend()
+    handled = 0
+    while True:
+        count = dispatch_due(backend, batch_size)
+        handled += count
+        if count:
+            logger.info("Handled %d reminders", count)
+            continue
+        if once:
+            return handled
+        clock.sleep(poll_interval)
@@ -0,0 +1,149 @@
+"""
+Full-text search over events.
+
+On SQLite the ``calendar_event_fts`` FTS5 table indexes title, description,
+organizer and location, keyed by the event id. It is an external-content
+table (migration ``0015``): it holds the index only and reads the text from
+``calendar_event``, so event text is not stored twice. FTS5 removes a row's
+terms by re-reading its text, which must therefore still be the indexed
+text: ``drop_from_search_index`` runs before an event is changed or deleted
+(the ``pre_save``/``pre_delete`` signals), and ``sync_search_index``
+indexes it again after the write, through ``events_changed``. Both skip
+rows already dropped or indexed, so repeated calls are harmless; bulk
+writes that change indexed columns must call the pair themselves.
+``rebuild_event_search_index`` repopulates the index from scratch. Queries
+match every word as a prefix and are ranked with bm25, title hits weighing
+the most.
+
+Other databases fall back to PostgreSQL full-text search, or to
+``icontains`` filters elsewhere.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from ..models.event import Event
+
+FTS_TABLE = 'calendar_event_fts'
+# FTS5 shadow table holding one row per indexed event
+FTS_DOCSIZE_TABLE = f'{FTS_TABLE}_docsize'
+FTS_COLUMNS = ('title', 'description', 'organizer', 'location')
+# bm25 weights, in FTS_COLUMNS order
+FTS_WEIGHTS = (10.0, 1.0, 3.0, 3.0)
+SEARCH_MAX_TERMS = 10
+SYNC_CHUNK = 500
+
+_fts_available = None
+
+
+def fts_available():
+    """Whether the FTS5 table exists (SQLite builds without FTS5 skip it)."""
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = connection.vendor == 'sqlite' and FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+def search_terms(text):
+    return re.findall(r'\w+', text.lower())[:SEARCH_MAX_TERMS]
+
+
+def _match_expression(terms):
+    # Quoted so FTS5 operators in user input are taken literally
+    return ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+
+
+def _chunks(event_ids):
+    event_ids = list(event_ids)
+    for i in range(0, len(event_ids), SYNC_CHUNK):
+        chunk = event_ids[i:i + SYNC_CHUNK]
+        yield chunk, ', '.join(['%s'] * len(chunk))
+
+
+def drop_from_search_index(event_ids):
+    """Remove ``event_ids`` from the index; call before their text changes
+    or they are deleted. Ids not indexed are skipped."""
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        for chunk, placeholders in _chunks(event_ids):
+            cursor.execute(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid IN '
+                f'(SELECT id FROM {FTS_DOCSIZE_TABLE} WHERE id IN ({placeholders}))',
+                chunk,
+            )
+
+
+def sync_search_index(event_ids):
+    """Index those of ``event_ids`` that exist and are not indexed: new
+    events and ones dropped by ``drop_from_search_index``."""
+    if not fts_available():
+        return
+    columns = ', '.join(FTS_COLUMNS)
+    with connection.cursor() as cursor:
+        for chunk, placeholders in _chunks(event_ids):
+            cursor.execute(
+                f'INSERT INTO {FTS_TABLE} (rowid, {columns}) '
+                f'SELECT id, {columns} FROM {Event._meta.db_table} WHERE id IN ({placeholders}) '
+                f'AND id NOT IN (SELECT id FROM {FTS_DOCSIZE_TABLE})',
+                chunk,
+            )
+
+
+def rebuild_search_index():
+    """Repopulate the index from every event. Returns the number indexed."""
+    if not fts_available():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('rebuild')")
+        cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+        cursor.execute(f'SELECT COUNT(*) FROM {FTS_DOCSIZE_TABLE}')
+        return cursor.fetchone()[0]
+
+
+def search_events(queryset, text, limit=50):
+    """
+    Events of ``queryset`` matching every word of ``text`` (as prefixes),
+    best matches first. Returns: list of at most ``limit`` events
+    """
+    terms = search_terms(text)
+    if not terms:
+        return []
+
+    if fts_available():
+        weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+        # Matches are restricted to ``queryset`` before ranking and the limit,
+        # so visible events are never crowded out by ones the caller cannot see
+        visible, visible_params = queryset.order_by().values('pk').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid IN ({visible}) '
+                f'ORDER BY bm25({FTS_TABLE}, {weights}) LIMIT %s',
+                [_match_expression(terms), *visible_params, limit],
+            )
+            ranked = [row[0] for row in cursor.fetchall()]
+        position = {event_id: index for index, event_id in enumerate(ranked)}
+        events = list(queryset.filter(pk__in=ranked))
+        events.sort(key=lambda event: position[event.pk])
+        return events
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+        vector = (
+            SearchVector('title', weight='A')
+            + SearchVector('organizer', 'location', weight='B')
+            + SearchVector('description', weight='C')
+        )
+        query = SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw')
+        return list(
+            queryset.annotate(document=vector).filter(document=query)
+            .annotate(rank=SearchRank(vector, query)).order_by('-rank', 'start_date')[:limit]
+        )
+
+    condition = Q()
+    for term in terms:
+        condition &= Q(title__icontains=term) | Q(description__icontains=term) | \
+            Q(organizer__icontains=term) | Q(location__icontains=term)
+    return list(queryset.filter(condition).order_by('start_date', 'start_time')[:limit])
@@ -0,0 +1,230 @@
+"""
+Static JSON snapshots of published events, for anonymous traffic.
+
+Public pages and kiosks read the same few documents: each public calendar's
+and each category's upcoming events and this month's events, counting only
+published events outside ended calendars. They are
+written under ``CALENDAR_SNAPSHOT_ROOT`` so the web server can hand them out
+straight from disk, with long cache headers and ETags, without reaching
+Django or the database::
+
+    index.json                      calendars and categories published
+    calendars/<ukid>/upcoming.json
+    calendars/<ukid>/month.json
+    categories/<ukid>/upcoming.json
+    categories/<ukid>/month.json
+
+Every file is written to a temporary file next to it and moved into place
+with ``os.replace``, so readers see the old document or the new one, never
+a partial one; unchanged documents are not rewritten, keeping their ETag.
+``events_changed`` republishes the calendars and categories of the events
+written once the transaction commits, and everything when the events are
+unknown; calendar and category writes republish the documents showing them
+(``schedule_related_snapshots``). Every run rewrites the index and removes
+the documents of calendars no longer public and categories deleted.
+``publish_event_snapshots`` does a full run; schedule it daily, as
+"upcoming" and "this month" move with the date. Publishing is off while
+``CALENDAR_SNAPSHOT_ROOT`` is unset.
+"""
+import calendar as calendar_module
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime, time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models.calendar import Calendar
+from ..models.category import Category
+from ..models.event import DAY_FIELDS, Event, EventStatus
+from ..serializers.event import OccurrenceCompactSerializer
+from .recurrence import expand_window
+from .upcoming import compute_upcoming
+
+SNAPSHOT_ROOT = getattr(settings, 'CALENDAR_SNAPSHOT_ROOT', None)
+SNAPSHOT_UPCOMING_LIMIT = getattr(settings, 'CALENDAR_SNAPSHOT_UPCOMING_LIMIT', 20)
+# Cache-Control max-age of the snapshots, see ``api.snapshots``
+SNAPSHOT_MAX_AGE = getattr(settings, 'CALENDAR_SNAPSHOT_MAX_AGE', 10 * 60)
+SNAPSHOT_STALE_SECONDS = getattr(settings, 'CALENDAR_SNAPSHOT_STALE_SECONDS', 24 * 60 * 60)
+
+CALENDARS_DIR = 'calendars'
+CATEGORIES_DIR = 'categories'
+
+logger = logging.getLogger(__name__)
+
+
+def _month_bounds(today):
+    return today.replace(day=1), today.replace(day=calendar_module.monthrange(today.year, today.month)[1])
+
+
+def _public_calendars(today):
+    # Calendars non-staff users can list
+    return Calendar.objects.filter(end_date__gte=today)
+
+
+def _public_events(today):
+    # Events outside any calendar, or in one of ``_public_calendars``
+    return Event.objects.filter(Q(calendar__isnull=True) | Q(calendar__end_date__gte=today))
+
+
+def write_atomic(path, data):
+    """
+    Write ``data`` (JSON-serializable) to ``path`` through a temporary file
+    and ``os.replace``. Returns: whether the file changed
+    """
+    content = json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'), sort_keys=True).encode()
+    try:
+        with open(path, 'rb') as current:
+            if current.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file readable by its owner only
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return True
+
+
+def _write_documents(directory, month, last, now, **filters):
+    # Only what anonymous readers may see: published events of public calendars
+    events = _public_events(timezone.localdate(now))
+    upcoming = compute_upcoming(SNAPSHOT_UPCOMING_LIMIT, now=now, events=events, **filters)
+    queryset = events.filter(status=EventStatus.PUBLISHED, **{f'{field}__ukid': ukid for field, ukid in filters.items()})
+    queryset = queryset.select_related('category', 'calendar')
+    month_events = OccurrenceCompactSerializer(expand_window(queryset, month, last), many=True).data
+    return sum((
+        write_atomic(os.path.join(directory, 'upcoming.json'), {'events': upcoming}),
+        write_atomic(os.path.join(directory, 'month.json'), {'month': f'{month:%Y-%m}', 'events': month_events}),
+    ))
+
+
+def _remove_stale(kind_dir, keep):
+    if not os.path.isdir(kind_dir):
+        return
+    for name in os.listdir(kind_dir):
+        if name not in keep:
+            shutil.rmtree(os.path.join(kind_dir, name), ignore_errors=True)
+
+
+def publish_snapshots(calendar_ids=None, category_ids=None, root=None, today=None):
+    """
+    Regenerate the snapshots of ``calendar_ids`` and ``category_ids`` (all
+    of them when both are None) and the index; those of calendars no longer
+    public (or categories deleted) are removed. Each calendar and category
+    costs about four queries (upcoming plain and recurring events, this
+    month's plain and recurring events), so a full run issues
+    2 + 4 * (public calendars + categories) queries; the runs scheduled by
+    event, calendar and category writes cover only the ones they touch.
+    Returns: number of files changed
+    """
+    root = root or SNAPSHOT_ROOT
+    if not root:
+        return 0
+    # A given date is published as of its start
+    now = timezone.make_aware(datetime.combine(today, time.min)) if today else timezone.now()
+    today = timezone.localdate(now)
+    month, last = _month_bounds(today)
+    full = calendar_ids is None and category_ids is None
+
+    calendars = list(_public_calendars(today).order_by('start_date', 'id'))
+    categories = list(Category.objects.order_by('name', 'id'))
+    changed = 0
+    for calendar in calendars:
+        if full or calendar.pk in (calendar_ids or ()):
+            changed += _write_documents(
+                os.path.join(root, CALENDARS_DIR, str(calendar.ukid)), month, last, now, calendar=calendar.ukid,
+            )
+    for category in categories:
+        if full or category.pk in (category_ids or ()):
+            changed += _write_documents(
+                os.path.join(root, CATEGORIES_DIR, str(category.ukid)), month, last, now, category=category.ukid,
+            )
+    _remove_stale(os.path.join(root, CALENDARS_DIR), {str(calendar.ukid) for calendar in calendars})
+    _remove_stale(os.path.join(root, CATEGORIES_DIR), {str(category.ukid) for category in categories})
+
+    changed += write_atomic(os.path.join(root, 'index.json'), {
+        'date': today,
+        'calendars': [
+            {'ukid': calendar.ukid, 'title': calendar.title, 'path': f'{CALENDARS_DIR}/{calendar.ukid}/'}
+            for calendar in calendars
+        ],
+        'categories': [
+            {'ukid': category.ukid, 'name': category.name, 'color': category.color,
+             'path': f'{CATEGORIES_DIR}/{category.ukid}/'}
+            for category in categories
+        ],
+    })
+    return changed
+
+
+def _publish(calendar_ids, category_ids):
+    try:
+        publish_snapshots(calendar_ids, category_ids)
+    except Exception:
+        # The write that triggered this has committed; the next run catches up
+        logger.exception("Publishing event snapshots failed")
+
+
+def schedule_snapshots(events=None):
+    """
+    Republish the snapshots touched by ``events`` (their calendars and
+    categories, as loaded and as they are now) once the current transaction
+    commits; everything when ``events`` is None.
+    """
+    if not SNAPSHOT_ROOT:
+        return
+    calendar_ids = category_ids = None
+    if events is not None:
+        calendar_ids, category_ids = set(), set()
+        for event in events:
+            # ``_day_state`` still holds the loaded values here
+            loaded = dict(zip(DAY_FIELDS, getattr(event, '_day_state', None) or ()))
+            calendar_ids.update((event.calendar_id, loaded.get('calendar_id')))
+            category_ids.update((event.category_id, loaded.get('category_id')))
+        calendar_ids.discard(None)
+        category_ids.discard(None)
+        if not calendar_ids and not category_ids:
+            return
+    transaction.on_commit(lambda: _publish(calendar_ids, category_ids))
+
+
+def schedule_related_snapshots(calendar=None, category=None):
+    """
+    Republish the snapshots showing ``calendar`` or ``category`` once the
+    current transaction commits: its own and those of the categories (or
+    calendars) of its events, as a calendar's dates decide whether its
+    events are public and a category's colour is shown with its events.
+    The related ids are read now, so a calendar about to be deleted can
+    still be traced to its events' categories.
+    """
+    if not SNAPSHOT_ROOT:
+        return
+    events = Event.objects.order_by()
+    if calendar is not None:
+        calendar_ids = {calendar.pk}
+        category_ids = set(events.filter(calendar_id=calendar.pk).values_list('category_id', flat=True).distinct())
+    else:
+        category_ids = {category.pk}
+        calendar_ids = set(
+            events.filter(category_id=category.pk, calendar__isnull=False)
+            .values_list('calendar_id', flat=True).distinct()
+        )
+    transaction.on_commit(lambda: _publish(calendar_ids, category_ids))
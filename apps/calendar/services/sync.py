@@ -0,0 +1,148 @@
+"""
+Change feed for calendar clients that keep a local store.
+
+A client fetches what changed since its last cursor instead of reloading
+every list: calendars, categories and events updated since then, and the
+ukids of those deleted (``Tombstone`` rows, see ``signals.tombstones``).
+Each kind is read with a keyset query on its ``(updated_at, id)`` index and
+the cursor holds the position reached in each, so a page costs the same
+however large the tables are. Without a cursor the feed starts from the
+beginning, which doubles as the initial load.
+
+Rows younger than ``CALENDAR_SYNC_SETTLE_SECONDS`` are left for the next
+call: ``updated_at`` is stamped before its transaction commits, so an older
+row may still become visible after a younger one has been handed out.
+Tombstones are kept for ``CALENDAR_SYNC_TOMBSTONE_DAYS``; cursors older than
+that have to start over (``prune_sync_tombstones`` drops expired ones).
+"""
+import base64
+import json
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.utils import timezone
+
+from ..models.calendar import Calendar
+from ..models.category import Category
+from ..models.event import Event
+from ..models.tombstone import SyncKind, Tombstone
+
+SYNC_PAGE_SIZE = getattr(settings, 'CALENDAR_SYNC_PAGE_SIZE', 500)
+SYNC_SETTLE_SECONDS = getattr(settings, 'CALENDAR_SYNC_SETTLE_SECONDS', 5)
+SYNC_TOMBSTONE_DAYS = getattr(settings, 'CALENDAR_SYNC_TOMBSTONE_DAYS', 90)
+
+SYNC_QUERYSETS = {
+    SyncKind.CALENDARS: lambda: Calendar.objects.all(),
+    SyncKind.CATEGORIES: lambda: Category.objects.all(),
+    SyncKind.EVENTS: lambda: Event.objects.select_related('category', 'calendar'),
+}
+TOMBSTONES = 'deleted'
+
+
+class CursorExpired(ValueError):
+    """The cursor predates the tombstones still kept; the client must reload."""
+
+
+def encode_cursor(positions):
+    payload = {key: [moment.isoformat(), pk] for key, (moment, pk) in positions.items()}
+    token = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+    return token.rstrip('=')
+
+
+def decode_cursor(token):
+    """Positions ``{kind: (updated_at, id)}`` of a cursor; ``{}`` for none."""
+    if not token:
+        return {}
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+        positions = {
+            key: (datetime.fromisoformat(moment), int(pk)) for key, (moment, pk) in payload.items()
+            if key in SYNC_QUERYSETS or key == TOMBSTONES
+        }
+    except (TypeError, ValueError, AttributeError):
+        raise ValueError('Invalid cursor')
+    if any(timezone.is_naive(moment) for moment, _ in positions.values()):
+        raise ValueError('Invalid cursor')
+    return positions
+
+
+def _after(queryset, position, horizon):
+    queryset = queryset.filter(updated_at__lte=horizon)
+    if position:
+        moment, pk = position
+        queryset = queryset.filter(Q(updated_at__gt=moment) | Q(updated_at=moment, id__gt=pk))
+    return queryset.order_by('updated_at', 'id')
+
+
+def _advance(page, position, horizon, page_size):
+    """Position after ``page``; a drained kind moves up to the horizon so
+    its next query starts from there."""
+    if len(page) > page_size:
+        last = page[page_size - 1]
+        return (last.updated_at, last.pk), True
+    candidates = [(horizon, 0)]
+    if position:
+        candidates.append(position)
+    if page:
+        candidates.append((page[-1].updated_at, page[-1].pk))
+    return max(candidates), False
+
+
+def read_changes(cursor=None, visible=None, page_size=SYNC_PAGE_SIZE, now=None):
+    """
+    One page of changes after ``cursor``.
+
+    visible: optional ``{kind: Q}`` limiting what the client may see; changed
+        rows outside it are reported as deleted, so a record that gets hidden
+        (e.g. an event unpublished) leaves the client's store too.
+    Returns: dict with ``changed`` ({kind: [instances]}), ``deleted``
+        ({kind: [ukids]}), the next ``cursor`` and ``has_more``
+    Raises: ValueError for a malformed cursor, CursorExpired for a stale one
+    """
+    now = now or timezone.now()
+    horizon = now - timedelta(seconds=SYNC_SETTLE_SECONDS)
+    positions = decode_cursor(cursor)
+    if not positions:
+        # A fresh client holds nothing that earlier deletes could remove
+        positions[TOMBSTONES] = (horizon, 0)
+    elif TOMBSTONES not in positions or positions[TOMBSTONES][0] < now - timedelta(days=SYNC_TOMBSTONE_DAYS):
+        raise CursorExpired('Cursor expired; reload everything without a cursor')
+
+    visible = visible or {}
+    changed = {kind: [] for kind in SYNC_QUERYSETS}
+    deleted = {kind: [] for kind in SYNC_QUERYSETS}
+    next_positions, has_more = {}, False
+
+    for kind, queryset in SYNC_QUERYSETS.items():
+        queryset = _after(queryset(), positions.get(kind), horizon)
+        if kind in visible:
+            queryset = queryset.annotate(visible=ExpressionWrapper(visible[kind], output_field=BooleanField()))
+        page = list(queryset[:page_size + 1])
+        next_positions[kind], more = _advance(page, positions.get(kind), horizon, page_size)
+        has_more |= more
+        for row in page[:page_size]:
+            if getattr(row, 'visible', True):
+                changed[kind].append(row)
+            else:
+                deleted[kind].append(row.ukid)
+
+    tombstones = list(_after(Tombstone.objects.all(), positions.get(TOMBSTONES), horizon)[:page_size + 1])
+    next_positions[TOMBSTONES], more = _advance(tombstones, positions.get(TOMBSTONES), horizon, page_size)
+    has_more |= more
+    for tombstone in tombstones[:page_size]:
+        deleted[tombstone.kind].append(tombstone.object_ukid)
+
+    return {
+        'changed': changed,
+        'deleted': deleted,
+        'cursor': encode_cursor(next_positions),
+        'has_more': has_more,
+    }
+
+
+def prune_tombstones(now=None):
+    """Delete tombstones past their retention. Returns the number deleted."""
+    now = now or timezone.now()
+    deleted, _ = Tombstone.objects.filter(updated_at__lt=now - timedelta(days=SYNC_TOMBSTONE_DAYS)).delete()
+    return deleted
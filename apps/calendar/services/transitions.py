@@ -0,0 +1,66 @@
+"""
+Bulk status transitions of events.
+
+Publishing, postponing or cancelling many events is one set-based UPDATE
+that stamps the status, ``published_*``/``cancelled_*`` and ``updated_*``
+columns, instead of a save (and its signals) per event. As no signals are
+sent, the derived data is brought up to date once for the whole set:
+per-day rows by another UPDATE, then reminders and caches.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ..models.event import Event, EventStatus
+from ..models.event_day import EventDay
+from .invalidation import events_changed
+from .reminders import schedule_reminders
+
+TRANSITIONS = {
+    'publish': EventStatus.PUBLISHED,
+    'postpone': EventStatus.POSTPONED,
+    'cancel': EventStatus.CANCELLED,
+}
+TRANSITION_MAX_EVENTS = getattr(settings, 'CALENDAR_TRANSITION_MAX_EVENTS', 5000)
+
+
+def transition_events(queryset, action, user_id=None, postponed_to=None):
+    """
+    Move the events of ``queryset`` to the status of ``action`` (a key of
+    TRANSITIONS); events already in it are left alone, except postponed
+    events being postponed to another ``postponed_to``.
+    Returns: list of the events changed, as updated
+    Raises: ValueError when more than TRANSITION_MAX_EVENTS events would change
+    """
+    status = TRANSITIONS[action]
+    now = timezone.now()
+    changes = {'status': status, 'updated_at': now, 'updated_by': user_id}
+    if status == EventStatus.PUBLISHED:
+        changes.update(published_at=now, published_by=user_id)
+    elif status == EventStatus.CANCELLED:
+        changes.update(cancelled_at=now, cancelled_by=user_id)
+    elif postponed_to:
+        changes['postponed_to'] = postponed_to
+
+    # Rows that would not change
+    unchanged = {'status': status}
+    if 'postponed_to' in changes:
+        unchanged['postponed_to'] = postponed_to
+
+    with transaction.atomic():
+        # Lock the rows so the set updated is the set reported
+        ids = list(
+            queryset.exclude(**unchanged).order_by().select_for_update(of=('self',))
+            .values_list('id', flat=True)[:TRANSITION_MAX_EVENTS + 1]
+        )
+        if len(ids) > TRANSITION_MAX_EVENTS:
+            raise ValueError(f'At most {TRANSITION_MAX_EVENTS} events can be changed at once.')
+        if not ids:
+            return []
+        Event.objects.filter(pk__in=ids).update(**changes)
+        EventDay.objects.filter(event_id__in=ids).update(status=status)
+        events = list(Event.objects.filter(pk__in=ids).select_related('category', 'calendar'))
+
+    schedule_reminders(events)
+    events_changed(events)
+    return events
@@ -0,0 +1,80 @@
+"""
+Next published events, for the home page.
+
+Plain events are read from a partial ``(start_date, start_time)`` index over
+published events and merged with the upcoming occurrences of recurring
+series. The compact result is
+cached for ``CALENDAR_UPCOMING_TTL`` seconds per calendar, category and
+limit, under a namespace ``events_changed`` bumps on every event write.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from ..models.event import Event, EventStatus, RecurrenceFrequency
+from ..serializers.event import OccurrenceCompactSerializer
+from .cache import bump_cache_version, cache_version
+from .recurrence import Occurrence, occurrences, recurring_in_window
+
+UPCOMING_NAMESPACE = 'upcoming'
+UPCOMING_TTL = getattr(settings, 'CALENDAR_UPCOMING_TTL', 60)
+# How far ahead recurring series are looked at when few plain events are coming
+UPCOMING_HORIZON_DAYS = 366
+
+
+def compute_upcoming(limit, calendar=None, category=None, now=None, events=None):
+    """
+    The next ``limit`` published occurrences starting after ``now``,
+    optionally within a calendar and/or category (ukids), among ``events``
+    (a queryset, all events by default). Returns: compact dicts
+    """
+    now = timezone.localtime(now or timezone.now())
+    today, current = now.date(), now.time()
+    queryset = (Event.objects.all() if events is None else events).filter(status=EventStatus.PUBLISHED).select_related('category', 'calendar')
+    if calendar:
+        queryset = queryset.filter(calendar__ukid=calendar)
+    if category:
+        queryset = queryset.filter(category__ukid=category)
+
+    # (start_date, start_time) > now, kept as a range on start_date so the
+    # upcoming index is walked in order
+    plain = list(
+        queryset.filter(recurrence_frequency=RecurrenceFrequency.NONE, start_date__gte=today)
+        .exclude(start_date=today, start_time__lte=current)
+        .order_by('start_date', 'start_time', 'id')[:limit]
+    )
+    result = [(event.start_date, event.start_time, event.pk, event, event.end_date) for event in plain]
+
+    # Recurring occurrences only matter up to the last plain event kept
+    horizon = plain[-1].start_date if len(plain) == limit else today + timedelta(days=UPCOMING_HORIZON_DAYS)
+    for event in recurring_in_window(queryset, today, horizon):
+        coming = [
+            occurrence for occurrence in occurrences(event, today, horizon)
+            if (occurrence.start_date, event.start_time) > (today, current)
+        ]
+        result.extend(
+            (occurrence.start_date, event.start_time, event.pk, event, occurrence.end_date)
+            for occurrence in coming[:limit]
+        )
+
+    result.sort(key=lambda item: item[:3])
+    return OccurrenceCompactSerializer([
+        Occurrence(event, start, end) for start, _, _, event, end in result[:limit]
+    ], many=True).data
+
+
+def get_upcoming(limit, calendar=None, category=None):
+    """Cached :func:`compute_upcoming`."""
+    today = timezone.localdate()
+    key = f'calendar:{UPCOMING_NAMESPACE}:{calendar}:{category}:{limit}:{today}:{cache_version(UPCOMING_NAMESPACE)}'
+    result = cache.get(key)
+    if result is None:
+        result = compute_upcoming(limit, calendar, category)
+        cache.set(key, result, UPCOMING_TTL)
+    return result
+
+
+def invalidate_upcoming():
+    bump_cache_version(UPCOMING_NAMESPACE)
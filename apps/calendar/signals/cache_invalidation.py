@@ -0,0 +1,28 @@
+from django.db.models.signals import pre_save, pre_delete, post_save, post_delete
+from django.dispatch import receiver
+from apps.calendar.models.category import Category
+from apps.calendar.models.event import Event
+from apps.calendar.services.invalidation import events_changed
+from apps.calendar.services.search import drop_from_search_index
+
+@receiver(pre_save, sender=Event)
+@receiver(pre_delete, sender=Event)
+def unindex_event(sender, instance, **kwargs):
+    """Drop the event's search index row while its indexed text is still
+    in the table; ``events_changed`` indexes it again after the write."""
+    if instance.pk and not instance._state.adding:
+        drop_from_search_index([instance.pk])
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Category)
+def invalidate_event_caches(sender, instance, **kwargs):
+    """Drop cached data derived from events (a category rename shows up in
+    analytics and grids too) and refresh the event's search index row.
+    Bulk writes, which send no signals, call ``events_changed`` themselves.
+    Category snapshots are republished by ``signals.snapshots``."""
+    if sender is Event:
+        events_changed([instance])
+        instance._window_state = instance.window_state()
+    else:
+        events_changed(snapshots=False)
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.calendar.models.event import Event
+from apps.calendar.services.event_counts import count_events, move_event_count
+
+@receiver(post_save, sender=Event)
+def update_event_counts(sender, instance, created, raw=False, **kwargs):
+    """Count a new event, or move its count when its calendar or category
+    changed. Bulk inserts call ``count_events`` themselves."""
+    if raw:
+        return
+    if created:
+        count_events([instance])
+    elif hasattr(instance, '_count_state'):
+        move_event_count(instance._count_state, instance.count_state())
+    instance._count_state = instance.count_state()
+
+@receiver(post_delete, sender=Event)
+def uncount_event(sender, instance, **kwargs):
+    """Deleting a calendar detaches its events (SET_NULL) without signals;
+    the calendar row goes with its count."""
+    count_events([instance], delta=-1)
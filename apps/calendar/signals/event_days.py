@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from apps.calendar.models.event import Event
+from apps.calendar.services.event_days import refresh_event_days
+
+@receiver(post_save, sender=Event)
+def refresh_days(sender, instance, raw=False, **kwargs):
+    """Rewrite the event's EventDay rows when its dates, calendar, category
+    or status changed. Deletes cascade to the rows."""
+    if raw or not instance.days_changed:
+        return
+    refresh_event_days([instance])
@@ -0,0 +1,9 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.calendar.models.layout import CalendarLayout
+from apps.calendar.services.layouts import invalidate_active_layout
+
+@receiver(post_save, sender=CalendarLayout)
+@receiver(post_delete, sender=CalendarLayout)
+def invalidate_layout_cache(sender, instance, **kwargs):
+    invalidate_active_layout(instance.user_id)
@@ -0,0 +1,9 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.calendar.models.event import Event
+from apps.calendar.services.recurrence import occurrence_cache
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_occurrences(sender, instance, **kwargs):
+    occurrence_cache.invalidate(instance.pk)
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from apps.calendar.models.calendar import Calendar
+from apps.calendar.models.category import Category
+from apps.calendar.services.snapshots import schedule_related_snapshots
+
+@receiver(post_save, sender=Calendar)
+@receiver(pre_delete, sender=Calendar)
+def republish_calendar_snapshots(sender, instance, **kwargs):
+    """Republish the calendar's snapshots, its events' categories and the
+    index. Before a delete, while its events still point at it. Event
+    writes go through ``events_changed``."""
+    schedule_related_snapshots(calendar=instance)
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def republish_category_snapshots(sender, instance, **kwargs):
+    """Republish the category's snapshots, its events' calendars and the
+    index, which lists category names and colours."""
+    schedule_related_snapshots(category=instance)
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from apps.calendar.models.calendar import Calendar
+from apps.calendar.models.category import Category
+from apps.calendar.models.event import Event
+from apps.calendar.models.tombstone import SyncKind, Tombstone
+
+SYNC_KINDS = {Calendar: SyncKind.CALENDARS, Category: SyncKind.CATEGORIES, Event: SyncKind.EVENTS}
+
+@receiver(post_delete, sender=Calendar)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Event)
+def record_tombstone(sender, instance, **kwargs):
+    """Leave a tombstone so sync clients drop the record from their store."""
+    Tombstone.objects.create(kind=SYNC_KINDS[sender], object_ukid=instance.ukid)
+
+@receiver(pre_delete, sender=Calendar)
+def touch_calendar_events(sender, instance, **kwargs):
+    """Deleting a calendar detaches its events with a plain UPDATE; bump
+    their ``updated_at`` so sync clients pick up the detachment."""
+    instance.events.update(updated_at=timezone.now())
@@ -0,0 +1,90 @@
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.calendar.models import Category, Event
+from apps.calendar.models.event import EventStatus, RecurrenceFrequency
+
+User = get_user_model()
+
+
+class EventConflictTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pass', is_staff=True)
+        cls.category = Category.objects.create(name='Exams')
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def create_event(self, title, day, start, end, end_date=None, status=EventStatus.PUBLISHED, **fields):
+        return Event.objects.create(
+            category=self.category, title=title, start_date=day, end_date=end_date or day,
+            start_time=start, end_time=end, status=status, **fields,
+        )
+
+    def report(self, start='2025-03-01', end='2025-03-31'):
+        response = self.client.get(reverse('event-conflicts'), {'from': start, 'to': end})
+        self.assertEqual(response.status_code, 200)
+        return sorted(tuple(sorted(item['title'] for item in conflict['events'])) for conflict in response.data)
+
+    def test_sweep_pairs_only_overlapping_occurrences(self):
+        self.create_event('Physics', date(2025, 3, 3), time(9, 0), time(11, 0), location='Hall A')
+        self.create_event('Chemistry', date(2025, 3, 3), time(10, 0), time(12, 0), location=' Hall A ')
+        # Back to back, another day, another room, cancelled: no clash
+        self.create_event('Biology', date(2025, 3, 3), time(12, 0), time(13, 0), location='Hall A')
+        self.create_event('History', date(2025, 3, 4), time(9, 0), time(11, 0), location='Hall A')
+        self.create_event('Geography', date(2025, 3, 3), time(9, 0), time(11, 0), location='Hall B')
+        self.create_event('Art', date(2025, 3, 3), time(9, 0), time(11, 0), location='Hall A',
+                          status=EventStatus.CANCELLED)
+        # Multi-day event holding the organizer every day
+        self.create_event('Exam week', date(2025, 3, 1), time(8, 0), time(9, 30), end_date=date(2025, 3, 7),
+                          organizer='Dr. Rao')
+        self.create_event('Open day', date(2025, 3, 6), time(9, 0), time(10, 0), organizer='Dr. Rao')
+
+        self.assertEqual(self.report(), [('Chemistry', 'Physics'), ('Exam week', 'Open day')])
+
+    def test_recurring_occurrences_clash(self):
+        self.create_event('Assembly', date(2025, 3, 3), time(9, 0), time(10, 0), location='Hall A',
+                          recurrence_frequency=RecurrenceFrequency.WEEKLY, recurrence_count=4)
+        self.create_event('Guest talk', date(2025, 3, 17), time(9, 30), time(10, 30), location='Hall A')
+        self.assertEqual(self.report(), [('Assembly', 'Guest talk')])
+        self.assertEqual(self.report('2025-03-01', '2025-03-16'), [])
+
+    def test_clashing_create_needs_allow_conflicts(self):
+        self.create_event('Physics', date(2025, 3, 3), time(9, 0), time(11, 0), location='Hall A')
+        data = {
+            'category': str(self.category.ukid), 'title': 'Chemistry', 'type': 'single',
+            'start_date': '2025-03-03', 'end_date': '2025-03-03', 'start_time': '10:00', 'end_time': '12:00',
+            'location': 'Hall A',
+        }
+        response = self.client.post(reverse('event-list'), data, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('"Physics"', response.data['conflicts'][0])
+
+        response = self.client.post(reverse('event-list'), {**data, 'allow_conflicts': True}, format='json')
+        self.assertEqual(response.status_code, 201)
+
+    def test_hidden_events_are_not_named_in_conflicts(self):
+        self.create_event('Secret board meeting', date(2025, 3, 3), time(9, 0), time(11, 0), location='Hall A',
+                          status=EventStatus.DRAFT)
+        self.client.force_authenticate(User.objects.create_user(username='student', password='pass'))
+        data = {
+            'category': str(self.category.ukid), 'title': 'Chemistry', 'type': 'single',
+            'start_date': '2025-03-03', 'end_date': '2025-03-03', 'start_time': '10:00', 'end_time': '12:00',
+            'location': 'Hall A',
+        }
+        response = self.client.post(reverse('event-list'), data, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['conflicts'][0],
+                         'Location "Hall A" is already booked on 2025-03-03 (09:00-11:00).')
+
+    def test_edit_outside_conflict_fields_is_not_checked(self):
+        self.create_event('Physics', date(2025, 3, 3), time(9, 0), time(11, 0), location='Hall A')
+        chemistry = self.create_event('Chemistry', date(2025, 3, 3), time(10, 0), time(12, 0), location='Hall A')
+        url = reverse('event-detail', kwargs={'ukid': chemistry.ukid})
+
+        self.assertEqual(self.client.patch(url, {'title': 'Organic chemistry'}, format='json').status_code, 200)
+        response = self.client.patch(url, {'start_time': '09:30'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('conflicts', response.data)
@@ -0,0 +1,111 @@
+from datetime import date, time, timedelta
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.calendar.models import Calendar, Category, Event
+from apps.calendar.models.event import EventStatus
+
+User = get_user_model()
+
+
+class EventListQueryTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pass', is_staff=True)
+        cls.categories = [Category.objects.create(name=f'Category {i}') for i in range(3)]
+        cls.calendars = [
+            Calendar.objects.create(title=f'Calendar {i}', start_date=date(2025, 1, 1), end_date=date(2025, 12, 31))
+            for i in range(2)
+        ]
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def create_events(self, count):
+        for i in range(count):
+            Event.objects.create(
+                category=self.categories[i % len(self.categories)],
+                calendar=self.calendars[i % len(self.calendars)] if i % 5 else None,
+                title=f'Event {i}',
+                start_date=date(2025, 3, 1) + timedelta(days=i),
+                end_date=date(2025, 3, 1) + timedelta(days=i),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+                status=EventStatus.PUBLISHED,
+            )
+
+    def test_list_runs_fixed_number_of_queries(self):
+        self.create_events(5)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('event-list') + '?page_size=50')
+        self.assertEqual(len(response.data['results']), 5)
+
+        self.create_events(40)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('event-list') + '?page_size=50')
+        self.assertEqual(len(response.data['results']), 45)
+
+    def test_list_without_paging_params_is_a_bare_array(self):
+        self.create_events(3)
+        response = self.client.get(reverse('event-list'))
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 3)
+
+    def test_nested_event_counts(self):
+        self.create_events(6)
+        response = self.client.get(reverse('event-list'))
+        counts = {item['category']['ukid']: item['category']['event_count'] for item in response.data}
+        for category in self.categories:
+            self.assertEqual(counts[str(category.ukid)], category.events.count())
+        for item in response.data:
+            if item['calendar']:
+                calendar = Calendar.objects.get(ukid=item['calendar']['ukid'])
+                self.assertEqual(item['calendar']['event_count'], calendar.events.count())
+
+    def test_cursor_pagination_walks_both_directions(self):
+        self.create_events(12)
+        # Events sharing a start date and time are ordered by id
+        for event in Event.objects.filter(title__in=['Event 3', 'Event 4']):
+            event.start_date = event.end_date = date(2025, 3, 1)
+            event.save()
+        expected = list(Event.objects.order_by('start_date', 'start_time', 'id').values_list('title', flat=True))
+
+        titles, url = [], reverse('event-list') + '?page_size=5'
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            titles += [item['title'] for item in response.data['results']]
+            last_page, url = response.data, response.data['next']
+        self.assertEqual(titles, expected)
+
+        backwards, url = [], last_page['previous']
+        while url:
+            response = self.client.get(url)
+            backwards = [item['title'] for item in response.data['results']] + backwards
+            url = response.data['previous']
+        self.assertEqual(backwards, expected[:len(backwards)])
+        self.assertEqual(len(backwards), 10)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(reverse('event-list') + '?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+
+    def test_event_counts_follow_writes(self):
+        self.create_events(6)
+        event = Event.objects.filter(calendar=self.calendars[0]).first()
+        event.calendar, event.category = self.calendars[1], self.categories[2]
+        event.save()
+        Event.objects.filter(category=self.categories[0]).first().delete()
+        # A stale instance must not write its count back
+        self.calendars[0].title = 'Renamed'
+        self.calendars[0].save()
+        for obj in self.calendars + self.categories:
+            obj.refresh_from_db()
+            self.assertEqual(obj.event_count, obj.events.count())
+
+        Category.objects.filter(pk=self.categories[1].pk).update(event_count=42)
+        call_command('reconcile_event_counts', stdout=StringIO())
+        self.categories[1].refresh_from_db()
+        self.assertEqual(self.categories[1].event_count, self.categories[1].events.count())
@@ -0,0 +1,61 @@
+from datetime import date, time
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.calendar.models import Category, Event, EventDay
+from apps.calendar.models.event import EventStatus, RecurrenceFrequency
+
+User = get_user_model()
+
+
+class EventDayTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = User.objects.create_user(username='student', password='pass')
+        cls.category = Category.objects.create(name='Exams')
+        cls.other_category = Category.objects.create(name='Sports')
+
+    def create_event(self, title, start, end, status=EventStatus.PUBLISHED):
+        return Event.objects.create(
+            category=self.category, title=title, start_date=start, end_date=end,
+            start_time=time(9, 0), end_time=time(10, 0), status=status,
+        )
+
+    def days(self, event):
+        return list(EventDay.objects.filter(event=event).order_by('day').values_list('day', 'category_id', 'status'))
+
+    def test_rows_follow_day_field_changes(self):
+        event = self.create_event('Exam week', date(2025, 3, 3), date(2025, 3, 5))
+        self.assertEqual([day for day, _, _ in self.days(event)],
+                         [date(2025, 3, 3), date(2025, 3, 4), date(2025, 3, 5)])
+
+        event = Event.objects.get(pk=event.pk)
+        event.end_date = date(2025, 3, 4)
+        event.category = self.other_category
+        event.status = EventStatus.POSTPONED
+        event.save()
+        self.assertEqual(self.days(event), [
+            (date(2025, 3, 3), self.other_category.pk, EventStatus.POSTPONED),
+            (date(2025, 3, 4), self.other_category.pk, EventStatus.POSTPONED),
+        ])
+
+    def test_other_edits_leave_the_rows_alone(self):
+        event = Event.objects.get(pk=self.create_event('Exam week', date(2025, 3, 3), date(2025, 3, 5)).pk)
+        event.title = 'Exams'
+        event.location = 'Hall A'
+        with mock.patch('apps.calendar.signals.event_days.refresh_event_days') as refresh:
+            event.save()
+        refresh.assert_not_called()
+
+    def test_recurring_events_are_expanded_instead(self):
+        event = self.create_event('Assembly', date(2025, 3, 3), date(2025, 3, 3))
+        event.recurrence_frequency = RecurrenceFrequency.WEEKLY
+        event.save()
+        self.assertEqual(self.days(event), [])
+
+        self.create_event('Draft notice', date(2025, 3, 10), date(2025, 3, 10), status=EventStatus.DRAFT)
+        self.client.force_authenticate(self.student)
+        response = self.client.get(reverse('event-day'), {'date': '2025-03-10'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['title'] for item in response.data], ['Assembly'])
@@ -0,0 +1,58 @@
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.calendar.models import Calendar, Category, Event, FeedToken
+from apps.calendar.models.event import EventStatus
+
+User = get_user_model()
+
+
+class FeedTokenTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='teacher', password='pass')
+        cls.category = Category.objects.create(name='Exams')
+        cls.calendar = Calendar.objects.create(title='Calendar', start_date=date(2025, 1, 1), end_date=date(2099, 12, 31))
+        for title, status in (('Published', EventStatus.PUBLISHED), ('Draft', EventStatus.DRAFT)):
+            Event.objects.create(
+                category=cls.category, calendar=cls.calendar, title=title,
+                start_date=date(2025, 3, 3), end_date=date(2025, 3, 3),
+                start_time=time(9, 0), end_time=time(10, 0), status=status,
+            )
+
+    def issue_secret(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(reverse('feed-token-list'), {'name': 'Phone'})
+        self.client.force_authenticate(None)
+        self.assertEqual(response.status_code, 201)
+        return response.data['ukid'], response.data['secret']
+
+    def test_feed_url_with_secret_needs_no_header(self):
+        feed_url = reverse('calendar-feed', kwargs={'ukid': self.calendar.ukid})
+        self.assertEqual(self.client.get(feed_url).status_code, 401)
+
+        ukid, secret = self.issue_secret()
+        response = self.client.get(feed_url, {'token': secret})
+        self.assertEqual(response.status_code, 200)
+        body = b''.join(response.streaming_content).decode()
+        self.assertIn('SUMMARY:Published', body)
+        self.assertNotIn('SUMMARY:Draft', body)
+
+        token = FeedToken.objects.get(ukid=ukid)
+        self.assertNotIn(secret, token.key_hash)
+        self.assertIsNotNone(token.last_used_at)
+
+    def test_deleted_token_is_revoked(self):
+        ukid, secret = self.issue_secret()
+        self.client.force_authenticate(self.user)
+        response = self.client.delete(reverse('feed-token-detail', kwargs={'ukid': ukid}))
+        self.assertEqual(response.status_code, 204)
+        self.client.force_authenticate(None)
+
+        feed_url = reverse('category-feed', kwargs={'ukid': self.category.ukid})
+        self.assertEqual(self.client.get(feed_url, {'token': secret}).status_code, 401)
+
+    def test_secret_only_authenticates_feeds(self):
+        _, secret = self.issue_secret()
+        self.assertEqual(self.client.get(reverse('calendar-list'), {'token': secret}).status_code, 401)
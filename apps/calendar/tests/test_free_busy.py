@@ -0,0 +1,55 @@
+from datetime import date, datetime, time
+from django.test import TestCase
+from apps.calendar.models import Category, Event
+from apps.calendar.models.event import EventStatus
+from apps.calendar.services.free_busy import compute_free_busy, free_gaps, merge_intervals
+
+DAY = date(2025, 3, 3)
+
+
+def at(hour, minute=0, day=DAY):
+    return datetime.combine(day, time(hour, minute))
+
+
+class FreeBusyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Meetings')
+
+    def create_event(self, title, start, end, status=EventStatus.PUBLISHED, **fields):
+        return Event.objects.create(
+            category=self.category, title=title, start_date=DAY, end_date=DAY,
+            start_time=start, end_time=end, status=status, **fields,
+        )
+
+    def test_overlapping_and_touching_intervals_merge(self):
+        blocks = merge_intervals([
+            (at(13), at(14), 'c'),
+            (at(9), at(10), 'a'),
+            (at(9, 30), at(11), 'b'),
+            (at(11), at(12), 'a'),
+        ])
+        self.assertEqual(blocks, [(at(9), at(12), ['a', 'b']), (at(13), at(14), ['c'])])
+
+    def test_free_gaps_within_working_hours(self):
+        blocks = [(at(7), at(9, 30), ['a']), (at(12), at(13), ['b']), (at(16), at(10, day=date(2025, 3, 4)), ['c'])]
+        gaps = free_gaps(blocks, DAY, date(2025, 3, 4), time(8, 0), time(17, 0))
+        self.assertEqual(gaps, [
+            (at(9, 30), at(12)),
+            (at(13), at(16)),
+            (at(10, day=date(2025, 3, 4)), at(17, day=date(2025, 3, 4))),
+        ])
+        # Without hours a free day is one whole-day gap
+        self.assertEqual(free_gaps([], DAY, DAY), [(at(0), at(0, day=date(2025, 3, 4)))])
+
+    def test_busy_blocks_skip_cancelled_and_hidden_events(self):
+        meeting = self.create_event('Meeting', time(9, 0), time(10, 0), location='Room 1')
+        self.create_event('Cancelled', time(11, 0), time(12, 0), location='Room 1', status=EventStatus.CANCELLED)
+        draft = self.create_event('Draft', time(14, 0), time(15, 0), location='Room 1', status=EventStatus.DRAFT)
+
+        def busy(**kwargs):
+            result = compute_free_busy([('location', ' Room 1 ')], DAY, DAY, **kwargs)['resources'][0]
+            return [block['events'] for block in result['busy']]
+
+        self.assertEqual(busy(), [[str(meeting.ukid)], [str(draft.ukid)]])
+        self.assertEqual(busy(published_only=True), [[str(meeting.ukid)]])
@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.calendar.models import Category, Event
+
+User = get_user_model()
+
+CSV = (
+    b'title,category,start_date,end_date,start_time,end_time\n'
+    b'Mid-term exams,Exams,2025-03-03,2025-03-07,09:00,12:00\n'
+)
+
+
+class EventImportTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(username='staff', password='pass', is_staff=True)
+        cls.student = User.objects.create_user(username='student', password='pass')
+        Category.objects.create(name='Exams')
+
+    def upload(self):
+        return self.client.post(reverse('event-bulk-import'), {'file': SimpleUploadedFile('events.csv', CSV)})
+
+    def test_staff_can_import_events(self):
+        self.client.force_authenticate(self.staff)
+        response = self.upload()
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(list(Event.objects.values_list('title', flat=True)), ['Mid-term exams'])
+
+    def test_non_staff_users_cannot_import_events(self):
+        self.client.force_authenticate(self.student)
+        self.assertEqual(self.upload().status_code, 403)
+        self.assertFalse(Event.objects.exists())
@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.calendar.models import CalendarLayout
+
+User = get_user_model()
+
+
+class ActiveLayoutTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='teacher', password='pass')
+        cls.other = User.objects.create_user(username='other', password='pass')
+        cls.other_layout = CalendarLayout.objects.create(user=cls.other, name='Theirs', active=True)
+
+    def setUp(self):
+        # The cache outlives each test's transaction
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def active_names(self, user):
+        return list(CalendarLayout.objects.filter(user=user, active=True).values_list('name', flat=True))
+
+    def test_activate_leaves_one_active_layout(self):
+        week = CalendarLayout.objects.create(user=self.user, name='Week', active=True)
+        month = CalendarLayout.objects.create(user=self.user, name='Month')
+        self.assertEqual(self.active_names(self.user), ['Week'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('layout-activate', kwargs={'pk': month.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['active'])
+        self.assertEqual(self.active_names(self.user), ['Month'])
+        # Other users' layouts are untouched
+        self.assertEqual(self.active_names(self.other), ['Theirs'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('layout-list'), {'name': 'Agenda', 'active': True, 'configuration': {}}, format='json')
+        self.assertEqual(self.active_names(self.user), ['Agenda'])
+        week.refresh_from_db()
+        self.assertFalse(week.active)
+
+    def test_active_layout_is_cached_until_activation(self):
+        self.assertEqual(self.client.get(reverse('layout-active')).status_code, 404)
+        week = CalendarLayout.objects.create(user=self.user, name='Week')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('layout-activate', kwargs={'pk': week.pk}))
+
+        response = self.client.get(reverse('layout-active'))
+        self.assertEqual(response.data['name'], 'Week')
+        with self.assertNumQueries(0):
+            cached = self.client.get(reverse('layout-active'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, 304)
+
+        month = CalendarLayout.objects.create(user=self.user, name='Month')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('layout-activate', kwargs={'pk': month.pk}))
+        response = self.client.get(reverse('layout-active'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], 'Month')
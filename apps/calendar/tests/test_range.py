@@ -0,0 +1,58 @@
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.calendar.models import Category, Event
+from apps.calendar.models.event import EventStatus
+
+User = get_user_model()
+
+
+class EventRangeTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(username='staff', password='pass', is_staff=True)
+        cls.student = User.objects.create_user(username='student', password='pass')
+        cls.category = Category.objects.create(name='Exams')
+        for title, start, end in (
+            ('Ends before', date(2025, 2, 20), date(2025, 2, 28)),
+            ('Ends on first day', date(2025, 2, 25), date(2025, 3, 1)),
+            ('Inside', date(2025, 3, 10), date(2025, 3, 10)),
+            ('Spans window', date(2025, 2, 1), date(2025, 4, 30)),
+            ('Starts on last day', date(2025, 3, 31), date(2025, 4, 2)),
+            ('Starts after', date(2025, 4, 1), date(2025, 4, 1)),
+        ):
+            cls.create_event(title, start, end)
+        cls.create_event('Draft', date(2025, 3, 12), date(2025, 3, 12), status=EventStatus.DRAFT)
+
+    @classmethod
+    def create_event(cls, title, start, end, status=EventStatus.PUBLISHED):
+        return Event.objects.create(
+            category=cls.category, title=title, start_date=start, end_date=end,
+            start_time=time(9, 0), end_time=time(10, 0), status=status,
+        )
+
+    def get_range(self, start, end, **params):
+        return self.client.get(reverse('event-in-range'), {'from': start, 'to': end, **params})
+
+    def test_window_edges_are_inclusive(self):
+        self.client.force_authenticate(self.staff)
+        response = self.get_range('2025-03-01', '2025-03-31')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted(item['title'] for item in response.data),
+            ['Draft', 'Ends on first day', 'Inside', 'Spans window', 'Starts on last day'],
+        )
+
+    def test_non_staff_see_published_events_only(self):
+        self.client.force_authenticate(self.student)
+        response = self.get_range('2025-03-12', '2025-03-12', status='draft')
+        self.assertEqual([item['title'] for item in response.data], [])
+        response = self.get_range('2025-03-12', '2025-03-12')
+        self.assertEqual([item['title'] for item in response.data], ['Spans window'])
+
+    def test_range_is_validated(self):
+        self.client.force_authenticate(self.staff)
+        self.assertEqual(self.get_range('2025-03-31', '2025-03-01').status_code, 400)
+        self.assertEqual(self.get_range('2025-01-01', '2026-01-03').status_code, 400)
+        self.assertEqual(self.get_range('2025-01-01', '2026-01-02').status_code, 200)
@@ -0,0 +1,67 @@
+from datetime import date, time
+from django.test import TestCase
+from apps.calendar.models import Category, Event
+from apps.calendar.models.event import EventStatus, RecurrenceFrequency
+from apps.calendar.services.recurrence import expand_window, occurrence_dates, occurrences
+
+
+class RecurrenceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Assemblies')
+
+    def create_series(self, start=date(2025, 3, 3), end=None, **rule):
+        rule.setdefault('recurrence_frequency', RecurrenceFrequency.WEEKLY)
+        return Event.objects.create(
+            category=self.category, title='Assembly', start_date=start, end_date=end or start,
+            start_time=time(9, 0), end_time=time(10, 0), status=EventStatus.PUBLISHED, **rule,
+        )
+
+    def test_count_bounds_the_series(self):
+        event = self.create_series(recurrence_count=3)
+        self.assertEqual(event.recurrence_end_date, date(2025, 3, 17))
+        self.assertEqual(
+            occurrence_dates(event, date(2025, 1, 1), date(2025, 12, 31)),
+            (date(2025, 3, 3), date(2025, 3, 10), date(2025, 3, 17)),
+        )
+
+    def test_until_bounds_the_series_inclusively(self):
+        event = self.create_series(recurrence_until=date(2025, 3, 17), recurrence_byday=['MO', 'TH'])
+        self.assertEqual(event.recurrence_end_date, date(2025, 3, 17))
+        self.assertEqual(
+            occurrence_dates(event, date(2025, 3, 1), date(2025, 3, 31)),
+            (date(2025, 3, 3), date(2025, 3, 6), date(2025, 3, 10), date(2025, 3, 13), date(2025, 3, 17)),
+        )
+
+    def test_open_ended_series_has_no_end_date(self):
+        event = self.create_series(recurrence_interval=2)
+        self.assertIsNone(event.recurrence_end_date)
+        self.assertEqual(
+            occurrence_dates(event, date(2026, 1, 1), date(2026, 1, 31)),
+            (date(2026, 1, 5), date(2026, 1, 19)),
+        )
+
+    def test_multi_day_occurrences_overlapping_the_window_start(self):
+        event = self.create_series(
+            start=date(2025, 3, 3), end=date(2025, 3, 5), recurrence_count=2,
+            recurrence_exdates=['2025-03-03'],
+        )
+        # The span is carried by every occurrence
+        self.assertEqual(event.recurrence_end_date, date(2025, 3, 12))
+        self.assertEqual(
+            [(o.start_date, o.end_date) for o in occurrences(event, date(2025, 3, 12), date(2025, 3, 20))],
+            [(date(2025, 3, 10), date(2025, 3, 12))],
+        )
+
+    def test_expand_window_skips_series_that_ended(self):
+        ended = self.create_series(recurrence_count=2)
+        ongoing = self.create_series(recurrence_until=date(2025, 6, 30))
+        window = expand_window(Event.objects.all(), date(2025, 4, 1), date(2025, 4, 10))
+        self.assertEqual([(o.event.pk, o.start_date) for o in window],
+                         [(ongoing.pk, date(2025, 4, 7))])
+        self.assertNotIn(ended.pk, [o.event.pk for o in window])
+
+    def test_undated_series_has_no_occurrences(self):
+        event = Event(recurrence_frequency=RecurrenceFrequency.DAILY, recurrence_count=5)
+        self.assertIsNone(event.compute_recurrence_end_date())
+        self.assertEqual(occurrences(event, date(2025, 1, 1), date(2025, 1, 31)), [])
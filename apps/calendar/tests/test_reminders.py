@@ -0,0 +1,104 @@
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+from unittest import mock
+from django.test import TestCase
+from django.utils import timezone
+from apps.calendar.models import Category, Event, Reminder, ReminderStatus
+from apps.calendar.models.event import EventStatus, RecurrenceFrequency
+from apps.calendar.services.reminders import ConsoleReminderBackend, claim_due, dispatch_due
+
+START = date(2099, 3, 2)
+
+
+class ReminderSchedulingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Meetings')
+
+    def create_event(self, **fields):
+        fields = {
+            'category': self.category, 'title': 'Staff meeting', 'start_date': START, 'end_date': START,
+            'start_time': time(9, 0), 'end_time': time(10, 0), 'status': EventStatus.PUBLISHED,
+            'reminder_enabled': True, 'remainder_time_before_event': timedelta(hours=1), **fields,
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            return Event.objects.create(**fields)
+
+    def save(self, event):
+        with self.captureOnCommitCallbacks(execute=True):
+            event.save()
+
+    def pending(self, event):
+        return list(Reminder.objects.filter(event=event, status=ReminderStatus.PENDING)
+                    .values_list('event_start', 'due_at'))
+
+    def at(self, day, hour):
+        return timezone.make_aware(datetime.combine(day, time(hour, 0)))
+
+    def test_edit_moves_the_pending_reminder(self):
+        event = self.create_event()
+        self.assertEqual(self.pending(event), [(self.at(START, 9), self.at(START, 8))])
+
+        event.start_time, event.end_time = time(11, 0), time(12, 0)
+        self.save(event)
+        self.assertEqual(self.pending(event), [(self.at(START, 11), self.at(START, 10))])
+        self.assertEqual(Reminder.objects.filter(event=event).count(), 1)
+
+    def test_unrelated_edit_does_not_reschedule(self):
+        event = Event.objects.get(pk=self.create_event().pk)
+        event.title = 'Staff briefing'
+        with mock.patch('apps.calendar.signals.event_remainder.schedule_reminders') as schedule:
+            self.save(event)
+        schedule.assert_not_called()
+
+    def test_unpublishing_or_disabling_drops_the_reminder(self):
+        event = self.create_event()
+        event.status = EventStatus.DRAFT
+        self.save(event)
+        self.assertEqual(self.pending(event), [])
+
+        event.status = EventStatus.PUBLISHED
+        self.save(event)
+        self.assertEqual(len(self.pending(event)), 1)
+        event.reminder_enabled = False
+        self.save(event)
+        self.assertEqual(self.pending(event), [])
+
+    def test_recurring_event_moves_on_after_delivery(self):
+        event = self.create_event(recurrence_frequency=RecurrenceFrequency.WEEKLY, recurrence_count=3)
+        backend = ConsoleReminderBackend()
+        backend.stream = StringIO()
+
+        self.assertEqual(dispatch_due(backend, now=self.at(START, 8)), 1)
+        self.assertIn("Reminder: 'Staff meeting'", backend.stream.getvalue())
+        next_week = START + timedelta(days=7)
+        self.assertEqual(self.pending(event), [(self.at(next_week, 9), self.at(next_week, 8))])
+        self.assertEqual(Reminder.objects.get(event=event, event_start=self.at(START, 9)).status,
+                         ReminderStatus.SENT)
+
+    def test_concurrent_workers_claim_disjoint_batches(self):
+        events = [self.create_event(title=f'Meeting {i}') for i in range(3)]
+        now = self.at(START, 8)
+        first = claim_due(batch_size=2, now=now)
+        second = claim_due(batch_size=2, now=now)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertFalse({r.pk for r in first} & {r.pk for r in second})
+        self.assertEqual(claim_due(now=now), [])
+        self.assertEqual(Reminder.objects.filter(event__in=events, status=ReminderStatus.SENDING).count(), 3)
+
+    def test_stale_claims_are_retried_without_double_marking(self):
+        event = self.create_event()
+        lost = claim_due(now=self.at(START, 8))
+        self.assertEqual(len(lost), 1)
+        now = self.at(START, 8) + timedelta(minutes=10)
+
+        # The first worker's claim ran out: another worker takes and sends it
+        backend = ConsoleReminderBackend()
+        backend.stream = StringIO()
+        self.assertEqual(dispatch_due(backend, now=now), 1)
+        self.assertEqual(backend.stream.getvalue().count('Reminder:'), 1)
+        reminder = Reminder.objects.get(event=event)
+        self.assertEqual(reminder.status, ReminderStatus.SENT)
+        self.assertIsNone(reminder.claim_token)
+        self.assertEqual(claim_due(now=now + timedelta(minutes=30)), [])
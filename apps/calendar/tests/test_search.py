@@ -0,0 +1,54 @@
+from datetime import date, time
+from unittest import mock
+from django.db import DatabaseError, connection
+from django.test import TestCase
+from apps.calendar.models import Category, Event
+from apps.calendar.models.event import EventStatus
+from apps.calendar.services import search
+
+
+class SearchIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Sports')
+
+    def setUp(self):
+        if not search.fts_available():
+            self.skipTest('SQLite FTS5 index not available')
+
+    def create_event(self, title, status=EventStatus.PUBLISHED):
+        return Event.objects.create(
+            category=self.category, title=title, start_date=date(2025, 3, 3), end_date=date(2025, 3, 3),
+            start_time=time(9, 0), end_time=time(10, 0), status=status,
+        )
+
+    def titles(self, queryset, text, limit=50):
+        return [event.title for event in search.search_events(queryset, text, limit)]
+
+    def test_edits_and_deletes_keep_the_index_consistent(self):
+        event = self.create_event('Annual sports day')
+        event.title = 'Science fair'
+        event.save()
+        event.save()
+        self.assertEqual(self.titles(Event.objects.all(), 'sport'), [])
+        self.assertEqual(self.titles(Event.objects.all(), 'scien'), ['Science fair'])
+
+        event.delete()
+        self.assertEqual(self.titles(Event.objects.all(), 'scien'), [])
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {search.FTS_TABLE} ({search.FTS_TABLE}, rank) VALUES ('integrity-check', 1)")
+
+    def test_failed_save_keeps_the_event_searchable(self):
+        event = self.create_event('Annual sports day')
+        event.title = 'Science fair'
+        with mock.patch.object(Event, '_save_table', side_effect=DatabaseError('disk I/O error')):
+            with self.assertRaises(DatabaseError):
+                event.save()
+        self.assertEqual(self.titles(Event.objects.all(), 'sport'), ['Annual sports day'])
+
+    def test_hidden_matches_do_not_crowd_out_visible_ones(self):
+        for i in range(5):
+            self.create_event(f'Sports trial {i}', status=EventStatus.DRAFT)
+        self.create_event('Sports day')
+        published = Event.objects.filter(status=EventStatus.PUBLISHED)
+        self.assertEqual(self.titles(published, 'sport', limit=1), ['Sports day'])
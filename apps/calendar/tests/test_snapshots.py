@@ -0,0 +1,87 @@
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, time
+from unittest import mock
+from django.test import TestCase
+from apps.calendar.models import Calendar, Category, Event
+from apps.calendar.models.event import EventStatus
+from apps.calendar.services import snapshots
+from apps.calendar.services.snapshots import CALENDARS_DIR, CATEGORIES_DIR, publish_snapshots
+
+
+class SnapshotVisibilityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Exams')
+        current = Calendar.objects.create(title='2025', start_date=date(2025, 1, 1), end_date=date(2025, 12, 31))
+        ended = Calendar.objects.create(title='2024', start_date=date(2024, 1, 1), end_date=date(2024, 12, 31))
+        for title, calendar, day in (('Current', current, 5), ('Ended', ended, 6), ('Unfiled', None, 7)):
+            Event.objects.create(
+                category=cls.category, calendar=calendar, title=title,
+                start_date=date(2025, 3, day), end_date=date(2025, 3, day),
+                start_time=time(9, 0), end_time=time(10, 0), status=EventStatus.PUBLISHED,
+            )
+
+    def test_category_documents_skip_ended_calendars(self):
+        with tempfile.TemporaryDirectory() as root:
+            publish_snapshots(root=root, today=date(2025, 3, 1))
+            directory = os.path.join(root, CATEGORIES_DIR, str(self.category.ukid))
+            for name in ('upcoming.json', 'month.json'):
+                with open(os.path.join(directory, name)) as file:
+                    titles = [event['title'] for event in json.load(file)['events']]
+                self.assertEqual(titles, ['Current', 'Unfiled'])
+
+
+class SnapshotSignalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.exams = Category.objects.create(name='Exams', color='#ff0000')
+        cls.sports = Category.objects.create(name='Sports')
+        cls.calendar = Calendar.objects.create(title='2099', start_date=date(2099, 1, 1), end_date=date(2099, 12, 31))
+        cls.other = Calendar.objects.create(title='2098', start_date=date(2098, 1, 1), end_date=date(2098, 12, 31))
+        for category, calendar in ((cls.exams, cls.calendar), (cls.sports, cls.other)):
+            Event.objects.create(
+                category=category, calendar=calendar, title=category.name,
+                start_date=date(2099, 3, 5), end_date=date(2099, 3, 5),
+                start_time=time(9, 0), end_time=time(10, 0), status=EventStatus.PUBLISHED,
+            )
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        patcher = mock.patch.object(snapshots, 'SNAPSHOT_ROOT', self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def save(self, instance):
+        with mock.patch.object(snapshots, 'publish_snapshots', wraps=snapshots.publish_snapshots) as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                instance.save()
+        return publish
+
+    def index(self):
+        with open(os.path.join(self.root, 'index.json')) as file:
+            return json.load(file)
+
+    def test_category_edits_republish_the_index_and_related_calendars(self):
+        self.exams.name, self.exams.color = 'Examinations', '#00ff00'
+        publish = self.save(self.exams)
+        publish.assert_called_once_with({self.calendar.pk}, {self.exams.pk})
+        self.assertIn('Examinations', [category['name'] for category in self.index()['categories']])
+
+    def test_calendar_edits_republish_only_that_calendar(self):
+        self.calendar.title = '2099/00'
+        publish = self.save(self.calendar)
+        publish.assert_called_once_with({self.calendar.pk}, {self.exams.pk})
+        self.assertEqual(os.listdir(os.path.join(self.root, CALENDARS_DIR)), [str(self.calendar.ukid)])
+
+    def test_deleted_calendar_republishes_its_events_categories(self):
+        pk, ukid = self.calendar.pk, str(self.calendar.ukid)
+        self.save(self.calendar)
+        with mock.patch.object(snapshots, 'publish_snapshots', wraps=snapshots.publish_snapshots) as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.calendar.delete()
+        publish.assert_called_once_with({pk}, {self.exams.pk})
+        self.assertNotIn(ukid, os.listdir(os.path.join(self.root, CALENDARS_DIR)))
@@ -0,0 +1,96 @@
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from unittest import mock
+from django.db.models import Q
+from django.test import TestCase
+from apps.calendar.models import Category, Event, SyncKind
+from apps.calendar.models.event import EventStatus
+from apps.calendar.services.sync import SYNC_SETTLE_SECONDS, SYNC_TOMBSTONE_DAYS, CursorExpired, read_changes
+
+
+class SyncFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='Exams')
+
+    def setUp(self):
+        # One clock for updated_at stamps and the feed's settle horizon
+        self.now = datetime(2025, 3, 1, 12, 0, tzinfo=dt_timezone.utc)
+        patcher = mock.patch('django.utils.timezone.now', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tick(self, seconds=1):
+        self.now += timedelta(seconds=seconds)
+
+    def settle(self):
+        self.tick(SYNC_SETTLE_SECONDS + 1)
+
+    def create_event(self, title, status=EventStatus.PUBLISHED):
+        self.tick()
+        return Event.objects.create(
+            category=self.category, title=title, start_date=date(2025, 3, 3), end_date=date(2025, 3, 3),
+            start_time=time(9, 0), end_time=time(10, 0), status=status,
+        )
+
+    def titles(self, changes):
+        return [event.title for event in changes['changed'][SyncKind.EVENTS]]
+
+    def test_pages_hand_out_every_change_once(self):
+        for i in range(5):
+            self.create_event(f'Event {i}')
+        self.settle()
+        titles, cursor, has_more = [], None, True
+        while has_more:
+            changes = read_changes(cursor, page_size=2)
+            titles += self.titles(changes)
+            cursor, has_more = changes['cursor'], changes['has_more']
+        self.assertEqual(titles, [f'Event {i}' for i in range(5)])
+        self.assertEqual(self.titles(read_changes(cursor)), [])
+
+        event = Event.objects.get(title='Event 3')
+        event.title = 'Event 3 (moved)'
+        event.save()
+        self.settle()
+        self.assertEqual(self.titles(read_changes(cursor)), ['Event 3 (moved)'])
+
+    def test_rows_younger_than_the_settle_horizon_wait(self):
+        cursor = read_changes()['cursor']
+        self.create_event('Fresh')
+        changes = read_changes(cursor)
+        self.assertEqual(self.titles(changes), [])
+        self.settle()
+        self.assertEqual(self.titles(read_changes(changes['cursor'])), ['Fresh'])
+
+    def test_deletes_leave_tombstones_for_existing_clients_only(self):
+        event = self.create_event('Cancelled fair')
+        self.settle()
+        cursor = read_changes()['cursor']
+        self.tick()
+        event.delete()
+        self.settle()
+
+        self.assertEqual(read_changes(cursor)['deleted'][SyncKind.EVENTS], [event.ukid])
+        # A fresh client never held the event
+        self.assertEqual(read_changes()['deleted'][SyncKind.EVENTS], [])
+
+    def test_rows_leaving_the_visible_set_are_reported_deleted(self):
+        visible = {SyncKind.EVENTS: Q(status=EventStatus.PUBLISHED)}
+        event = self.create_event('Sports day')
+        self.settle()
+        cursor = read_changes(visible=visible)['cursor']
+        self.tick()
+        event.status = EventStatus.DRAFT
+        event.save()
+        self.settle()
+
+        changes = read_changes(cursor, visible=visible)
+        self.assertEqual(self.titles(changes), [])
+        self.assertEqual(changes['deleted'][SyncKind.EVENTS], [event.ukid])
+
+    def test_stale_and_malformed_cursors(self):
+        cursor = read_changes()['cursor']
+        self.tick(SYNC_TOMBSTONE_DAYS * 24 * 60 * 60 + 1)
+        with self.assertRaises(CursorExpired):
+            read_changes(cursor)
+        with self.assertRaises(ValueError):
+            read_changes('not-a-cursor')
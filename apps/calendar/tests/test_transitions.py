@@ -0,0 +1,54 @@
+from datetime import date, time
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.calendar.models import Category, Event
+from apps.calendar.models.event import EventStatus
+
+User = get_user_model()
+
+
+class EventTransitionTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='staff', password='pass', is_staff=True)
+        cls.student = User.objects.create_user(username='student', password='pass')
+        cls.category = Category.objects.create(name='Sports')
+        cls.event = Event.objects.create(
+            category=cls.category, title='Sports day', start_date=date(2025, 3, 3), end_date=date(2025, 3, 3),
+            start_time=time(9, 0), end_time=time(10, 0), status=EventStatus.PUBLISHED,
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def postpone(self, postponed_to=None):
+        data = {'action': 'postpone', 'events': [str(self.event.ukid)]}
+        if postponed_to:
+            data['postponed_to'] = postponed_to
+        response = self.client.post(reverse('event-transition'), data, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.event.refresh_from_db()
+        return response.data['updated']
+
+    def test_postponed_events_can_be_postponed_again(self):
+        self.assertEqual(self.postpone('2025-03-10'), 1)
+        self.assertEqual(self.event.status, EventStatus.POSTPONED)
+        self.assertEqual(self.event.postponed_to, date(2025, 3, 10))
+
+        self.assertEqual(self.postpone('2025-03-17'), 1)
+        self.assertEqual(self.event.postponed_to, date(2025, 3, 17))
+
+        # Nothing left to change
+        self.assertEqual(self.postpone('2025-03-17'), 0)
+        self.assertEqual(self.postpone(), 0)
+        self.assertEqual(self.event.postponed_to, date(2025, 3, 17))
+
+    def test_non_staff_users_cannot_transition_events(self):
+        self.client.force_authenticate(self.student)
+        response = self.client.post(
+            reverse('event-transition'), {'action': 'cancel', 'events': [str(self.event.ukid)]}, format='json',
+        )
+        self.assertEqual(response.status_code, 403)
+        self.event.refresh_from_db()
+        self.assertEqual(self.event.status, EventStatus.PUBLISHED)
@@ -0,0 +1,72 @@
+from datetime import date, datetime, time
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from apps.calendar.models import Category, Event
+from apps.calendar.models.event import EventStatus, RecurrenceFrequency
+from apps.calendar.services.upcoming import compute_upcoming
+
+User = get_user_model()
+TODAY = date(2025, 3, 3)
+
+
+class UpcomingEventsTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='student', password='pass')
+        cls.category = Category.objects.create(name='Exams')
+
+    def create_event(self, title, day, start=time(9, 0), status=EventStatus.PUBLISHED, **fields):
+        return Event.objects.create(
+            category=self.category, title=title, start_date=day, end_date=day,
+            start_time=start, end_time=time(23, 0), status=status, **fields,
+        )
+
+    def upcoming(self, limit=10, at=time(7, 0)):
+        now = timezone.make_aware(datetime.combine(TODAY, at))
+        return [(item['title'], item['start_date']) for item in compute_upcoming(limit, now=now)]
+
+    def test_plain_and_recurring_events_in_start_order(self):
+        self.create_event('Past', date(2025, 3, 2))
+        self.create_event('Draft', date(2025, 3, 4), status=EventStatus.DRAFT)
+        self.create_event('Undated', None)
+        self.create_event('Afternoon', TODAY, start=time(14, 0))
+        self.create_event('Morning', TODAY, start=time(8, 0))
+        self.create_event('Morning too', TODAY, start=time(8, 0))
+        self.create_event('Assembly', date(2025, 2, 24), start=time(10, 0),
+                          recurrence_frequency=RecurrenceFrequency.WEEKLY, recurrence_count=4,
+                          recurrence_exdates=['2025-03-10'])
+
+        self.assertEqual(self.upcoming(), [
+            ('Morning', '2025-03-03'),
+            ('Morning too', '2025-03-03'),
+            ('Assembly', '2025-03-03'),
+            ('Afternoon', '2025-03-03'),
+            ('Assembly', '2025-03-17'),
+        ])
+
+    def test_events_that_already_started_today_are_left_out(self):
+        self.create_event('Morning', TODAY, start=time(8, 0))
+        self.create_event('Afternoon', TODAY, start=time(14, 0))
+        self.create_event('Assembly', TODAY, start=time(9, 0), recurrence_frequency=RecurrenceFrequency.DAILY)
+        self.assertEqual(self.upcoming(limit=3, at=time(9, 0)), [
+            ('Afternoon', '2025-03-03'), ('Assembly', '2025-03-04'), ('Assembly', '2025-03-05'),
+        ])
+
+    def test_limit_cuts_recurring_occurrences_too(self):
+        self.create_event('Assembly', TODAY, recurrence_frequency=RecurrenceFrequency.DAILY)
+        self.create_event('Exam', date(2025, 3, 4), start=time(8, 0))
+        self.assertEqual(self.upcoming(limit=3), [
+            ('Assembly', '2025-03-03'), ('Exam', '2025-03-04'), ('Assembly', '2025-03-04'),
+        ])
+
+    def test_endpoint_sees_new_events(self):
+        self.client.force_authenticate(self.user)
+        self.create_event('Sports day', date(2099, 3, 3))
+        response = self.client.get(reverse('event-upcoming'))
+        self.assertEqual([item['title'] for item in response.data], ['Sports day'])
+
+        self.create_event('Science fair', date(2099, 3, 2))
+        response = self.client.get(reverse('event-upcoming'))
+        self.assertEqual([item['title'] for item in response.data], ['Science fair', 'Sports day'])
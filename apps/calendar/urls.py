@@ -1,13 +1,17 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .api import CalendarViewSet, EventViewSet, CategoryViewSet, CalendarLayoutViewSet
+from .api import CalendarViewSet, EventViewSet, CategoryViewSet, CalendarLayoutViewSet, SyncViewSet, FeedTokenViewSet
+from .api.snapshots import snapshot_file
 
 router = DefaultRouter()
 router.register(r'calendars', CalendarViewSet)
 router.register(r'events', EventViewSet)
 router.register(r'categories', CategoryViewSet)
 router.register(r'layouts', CalendarLayoutViewSet, basename='layout')
+router.register(r'sync', SyncViewSet, basename='sync')
+router.register(r'feed-tokens', FeedTokenViewSet, basename='feed-token')
 
 urlpatterns = [
+    path('public/<path:path>', snapshot_file, name='calendar-snapshot'),
     path('', include(router.urls)),
 ]
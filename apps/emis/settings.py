@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -92,6 +93,37 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Derived calendar data (analytics, free/busy, upcoming, layouts) is cached
+# under version tokens that writes bump, and an invalidation only reaches
+# the processes reading the same cache. The per-process LocMemCache suits a
+# single runserver process; deployments running several worker processes
+# set REDIS_URL (e.g. redis://localhost:6379/0, needs the redis package) to
+# share Django's RedisCache. The database is deliberately not used as a
+# cache: a cached answer would still cost queries on every read.
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'emis',
+            'OPTIONS': {
+                'MAX_ENTRIES': 50000,
+            },
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -141,3 +173,14 @@ REST_FRAMEWORK = {
 }
 
 REST_SESSION_LOGIN = False
+
+# Seconds the exam portal's dropdown options are cached before re-scraping
+EXAM_PORTAL_CATALOG_TTL = 6 * 60 * 60
+
+# Distributed exam workers (python manage.py run_exam_worker)
+EXAM_WORKER_LEASE_SECONDS = 300
+EXAM_WORKER_BATCH_SIZE = 25
+EXAM_WORKER_MAX_ATTEMPTS = 3
+
+# Seconds before a RUNNING timetable job is considered abandoned (python manage.py run_timetable_worker)
+EXAM_TIMETABLE_JOB_TIMEOUT = 30 * 60
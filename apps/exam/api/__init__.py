@@ -0,0 +1,3 @@
+from .timetable import ExamTimetableViewSet
+from .catalog import PortalCatalogView
+from .result_job import ExamResultJobViewSet
@@ -0,0 +1,21 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from ..services.catalog import get_catalog
+
+class PortalCatalogView(APIView):
+    """Dropdown options offered by the exam portal, served from cache.
+
+    Pass ``?refresh=true`` to re-scrape the portal.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        refresh = request.query_params.get('refresh', '').lower() == 'true'
+        try:
+            catalog = get_catalog(refresh=refresh)
+        except Exception as e:
+            return Response({"error": f"Failed to load exam portal options: {e}"},
+                            status=status.HTTP_502_BAD_GATEWAY)
+        return Response(catalog)
@@ -0,0 +1,83 @@
+from django.db.models import Count, Q
+from django.http import FileResponse
+from rest_framework import viewsets, mixins, status
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..automation import build_workbook, load_student_sheet
+from ..models import ExamResultJob, JobStatus, WorkItemStatus
+from ..serializers.result_job import (
+    ExamResultJobCreateSerializer,
+    ExamResultJobResponseSerializer
+)
+from ..services.workers import create_result_job
+
+class ExamResultJobViewSet(mixins.CreateModelMixin,
+                           mixins.ListModelMixin,
+                           mixins.RetrieveModelMixin,
+                           mixins.DestroyModelMixin,
+                           viewsets.GenericViewSet):
+    """Result sheets queued for the distributed exam workers (``run_exam_worker``)."""
+    permission_classes = [IsAuthenticated]
+    parser_classes = (MultiPartParser, FormParser, JSONParser)
+    lookup_field = 'ukid'
+
+    def get_queryset(self): # type: ignore
+        return ExamResultJob.objects.defer('source').annotate(
+            **{
+                f'{status}_items': Count('items', filter=Q(items__status=status))
+                for status in WorkItemStatus.values
+            }
+        )
+
+    def get_serializer_class(self): # type: ignore
+        if self.action == 'create':
+            return ExamResultJobCreateSerializer
+        return ExamResultJobResponseSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        file_obj = data.pop('file')
+        delay = data.pop('delay')
+        autofill = data.pop('autofill')
+
+        try:
+            job = create_result_job(file_obj.name, file_obj.read(), data,
+                                    delay=delay, autofill=autofill, user_id=request.user.id)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        job = self.get_queryset().get(pk=job.pk)
+        return Response(ExamResultJobResponseSerializer(job).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get'])
+    def results(self, request, ukid=None):
+        """Per-student results collected so far, in sheet order."""
+        job = self.get_object()
+        items = job.items.order_by('row').values('row', 'roll_no', 'status', 'result', 'error')
+        return Response(list(items))
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, ukid=None):
+        """The processed workbook, available once the job has completed."""
+        job = self.get_object()
+        if job.status != JobStatus.COMPLETED:
+            return Response({"error": "Job has not completed yet"}, status=status.HTTP_409_CONFLICT)
+
+        source = ExamResultJob.objects.values_list('source', flat=True).get(pk=job.pk)
+        items = job.items.filter(
+            Q(result__isnull=False) | Q(status=WorkItemStatus.FAILED)
+        ).order_by('row').values_list('row', 'status', 'result', 'error')
+        results = (
+            result if item_status != WorkItemStatus.FAILED else {
+                # Failed rows say why in the Status column rather than being left blank
+                'sgpa': '', 'sgpa_check': '', 'courses': [], **(result or {}),
+                'row': row, 'status': f"Failed: {error or 'unknown error'}",
+            }
+            for row, item_status, result, error in items
+        )
+        output = build_workbook(load_student_sheet(bytes(source)), results, autofill=job.autofill)
+        return FileResponse(output, as_attachment=True, filename=f"processed_{job.file_name}")
@@ -0,0 +1,42 @@
+from rest_framework import viewsets, mixins, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from ..models import ExamTimetable, JobStatus
+from ..serializers.timetable import (
+    ExamTimetableCreateSerializer,
+    ExamTimetableResponseSerializer
+)
+from ..services.scheduler import queue_timetable_job
+
+class ExamTimetableViewSet(mixins.CreateModelMixin,
+                           mixins.ListModelMixin,
+                           mixins.RetrieveModelMixin,
+                           mixins.DestroyModelMixin,
+                           viewsets.GenericViewSet):
+    """Exam timetable jobs: creating one queues the scheduling of the
+    semester's subjects for ``run_timetable_worker``; poll the job until its
+    status is completed or failed."""
+    queryset = ExamTimetable.objects.prefetch_related('entries')
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'ukid'
+
+    def get_serializer_class(self): # type: ignore
+        if self.action == 'create':
+            return ExamTimetableCreateSerializer
+        return ExamTimetableResponseSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        timetable = serializer.save(created_by=request.user.id)
+        return Response(ExamTimetableResponseSerializer(timetable).data, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=True, methods=['post'])
+    def run(self, request, ukid=None):
+        """Queue the scheduler again, e.g. after enrollments changed."""
+        timetable = self.get_object()
+        if timetable.status in (JobStatus.PENDING, JobStatus.RUNNING):
+            return Response({"error": "Timetable is already queued or running"}, status=status.HTTP_409_CONFLICT)
+        timetable = queue_timetable_job(timetable)
+        return Response(ExamTimetableResponseSerializer(timetable).data, status=status.HTTP_202_ACCEPTED)
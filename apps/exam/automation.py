@@ -1,68 +1,123 @@
 import asyncio
 import os
 import io
+import queue
+import threading
 import pandas as pd
-from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 from django.conf import settings
+from apps.student.services.gpa import sgpa_from_grades
+from .services.catalog import (
+    CATALOG_FIELDS, DEPENDENT_FIELDS, PORTAL_URL, aget_catalog, resolve_option, scrape_options
+)
 
-async def process_exam_results(input_file, params, delay=1, autofill=True):
+def load_student_sheet(input_file):
     """
-    Process the exam results using Playwright.
-    input_file: bytes or file-like object containing the Excel file
+    Read the uploaded result template into a DataFrame.
+    input_file: bytes containing the Excel file
+    Returns: DataFrame with 'Exam Roll No.' and a single 'Date of Birth' column
+    """
+    # Load Excel file from memory
+    # The template has headers in row 3 (0-indexed row 3)
+    df = pd.read_excel(io.BytesIO(input_file), header=3)
+    
+    # Ensure required columns exist
+    if 'Exam Roll No.' not in df.columns:
+        raise ValueError("Excel file must contain 'Exam Roll No.' column")
+    
+    # Check if Date of Birth is split into DD/MM/YYYY columns
+    # In the template, these are: 'Date of Birth' (DD), 'Unnamed: 4' (MM), 'Unnamed: 5' (YYYY)
+    if 'Date of Birth' in df.columns and 'Unnamed: 4' in df.columns and 'Unnamed: 5' in df.columns:
+        # Split format - combine them
+        # First, rename for clarity
+        df = df.rename(columns={
+            'Date of Birth': 'DD',
+            'Unnamed: 4': 'MM',
+            'Unnamed: 5': 'YYYY'
+        })
+        
+        # Combine into a single Date of Birth column
+        df['Date of Birth'] = pd.to_datetime(
+            df['YYYY'].astype(str).str.strip() + '-' + 
+            df['MM'].astype(str).str.strip().str.zfill(2) + '-' + 
+            df['DD'].astype(str).str.strip().str.zfill(2),
+            format='%Y-%m-%d',
+            errors='coerce'
+        )
+    elif 'Date of Birth' not in df.columns:
+        raise ValueError("Excel file must contain date columns")
+
+    return df
+
+def iter_student_rows(df):
+    """
+    Validate and normalise the student rows of ``df``.
+    Rows without a roll number or date of birth are skipped; rows whose date
+    of birth cannot be parsed are kept with an error status.
+    Yields: dicts with row, roll_no, date_of_birth (YYYY-MM-DD) and status
+    """
+    for index, row in df.iterrows():
+        # Skip rows where Exam Roll No. is empty or NaN
+        exam_roll = row.get('Exam Roll No.')
+        
+        # More strict validation
+        if pd.isna(exam_roll):
+            continue
+        
+        # Convert to string and validate
+        roll_no = str(exam_roll).strip()
+        
+        # Skip if empty string or contains only whitespace
+        if not roll_no or roll_no == '' or roll_no == 'nan':
+            continue
+        
+        # Skip if it looks like a float representation (e.g., "24032282.0")
+        # We want actual roll numbers without decimal points
+        if '.' in roll_no:
+            # Remove trailing .0 if present
+            roll_no = roll_no.rstrip('0').rstrip('.')
+        
+        # Get date of birth
+        if pd.isna(row['Date of Birth']):
+            continue
+            
+        dob = row['Date of Birth']
+        student = {'row': int(index), 'roll_no': roll_no, 'date_of_birth': None, 'status': ''}
+        try:
+            # Handle date of birth - could be datetime object or string
+            if isinstance(dob, pd.Timestamp):
+                student['date_of_birth'] = dob.strftime('%Y-%m-%d')
+            else:
+                dob_date = pd.to_datetime(dob)
+                student['date_of_birth'] = dob_date.strftime('%Y-%m-%d')
+        except Exception as e:
+            student['status'] = f'Error: Invalid DOB format'
+        yield student
+
+async def iter_exam_results(rows, params, delay=1, autofill=True, headless=False):
+    """
+    Scrape the exam results for each student row using Playwright.
+    rows: iterable of dicts produced by iter_student_rows
     params: dict containing result_type, year, session, semester, program
     delay: float (seconds) - delay between processing each row
-    autofill: bool - if True, extract and fill data automatically; if False, only navigate and wait
-    Returns: io.BytesIO object containing the processed Excel file
+    autofill: bool - if True, extract the result data; if False, only navigate and wait
+    headless: bool - run the browser without a window (background workers)
+    Yields: one dict per processed row with row, roll_no, date_of_birth,
+            status, sgpa, sgpa_check and courses (code, title, credit, grade)
     """
     async with async_playwright() as p:
-        # Launch browser - headed so user can see
-        browser = await p.chromium.launch(headless=False)
+        # Launch browser - headed by default so user can see
+        browser = await p.chromium.launch(headless=headless)
         context = await browser.new_context()
         page = await context.new_page()
 
         try:
-            # Load Excel file from memory
-            # The template has headers in row 3 (0-indexed row 3)
-            df = pd.read_excel(io.BytesIO(input_file), header=3)
-            
-            # Ensure required columns exist
-            if 'Exam Roll No.' not in df.columns:
-                raise ValueError("Excel file must contain 'Exam Roll No.' column")
-            
-            # Check if Date of Birth is split into DD/MM/YYYY columns
-            # In the template, these are: 'Date of Birth' (DD), 'Unnamed: 4' (MM), 'Unnamed: 5' (YYYY)
-            if 'Date of Birth' in df.columns and 'Unnamed: 4' in df.columns and 'Unnamed: 5' in df.columns:
-                # Split format - combine them
-                # First, rename for clarity
-                df = df.rename(columns={
-                    'Date of Birth': 'DD',
-                    'Unnamed: 4': 'MM',
-                    'Unnamed: 5': 'YYYY'
-                })
-                
-                # Combine into a single Date of Birth column
-                df['Date of Birth'] = pd.to_datetime(
-                    df['YYYY'].astype(str).str.strip() + '-' + 
-                    df['MM'].astype(str).str.strip().str.zfill(2) + '-' + 
-                    df['DD'].astype(str).str.strip().str.zfill(2),
-                    format='%Y-%m-%d',
-                    errors='coerce'
-                )
-            elif 'Date of Birth' not in df.columns:
-                raise ValueError("Excel file must contain date columns")
-
-            # Add SGPA column if it doesn't exist (course columns will be added dynamically)
-            if 'SGPA' not in df.columns:
-                df['SGPA'] = ''
-
-            url = "https://exam.pu.edu.np:9094/"
-
             # Navigate to the page once
             max_retries = 3
             retry_delay = 2
             for attempt in range(max_retries):
                 try:
-                    await page.goto(url, timeout=30000)  # 30 second timeout
+                    await page.goto(PORTAL_URL, timeout=30000)  # 30 second timeout
                     break  # Success, exit retry loop
                 except Exception as nav_error:
                     if attempt < max_retries - 1:
@@ -71,105 +126,55 @@ async def process_exam_results(input_file, params, delay=1, autofill=True):
                     else:
                         raise Exception("Failed to connect to exam portal")
 
-            # Helper function to select from Select2 dropdown
-            async def select_select2(selector, value):
-                """Select an option from a Select2 dropdown by clicking and typing"""
-                try:
-                    # Click on the Select2 container to open dropdown
-                    select2_container = f"{selector} + .select2-container"
-                    await page.click(select2_container)
-                    await page.wait_for_timeout(300)  # Wait for dropdown to open
-                    
-                    # Type the value in the search box
-                    search_input = '.select2-search__field'
-                    await page.fill(search_input, value)
-                    await page.wait_for_timeout(300)  # Wait for filtering
-                    
-                    # Click the first result
-                    result = '.select2-results__option--highlighted, .select2-results__option:first-child'
-                    await page.click(result)
-                    await page.wait_for_timeout(300)  # Wait for selection
-                except Exception as e:
-                    # Fallback: try standard select if Select2 fails
-                    await page.select_option(selector, value=value)
-            
-            # Set form values once (they remain the same for all rows)
-            try:
-                # Result Type - standard select
-                if params.get('result_type'):
-                    await page.select_option('#Exam_Type', value=params['result_type'])
-                
-                # Year - Select2
-                if params.get('year'):
-                    await select_select2('#Year', str(params['year']))
-                
-                # Academic Session - standard select
-                if params.get('session'):
-                    await page.select_option('#Academic_System', value=params['session'])
+            # Resolve every parameter to the portal's exact option value up front,
+            # so a typo fails fast instead of silently picking the wrong option.
+            catalog = await aget_catalog(page)
+            wanted = {param: params[param] for param in CATALOG_FIELDS if params.get(param)}
+            selections = {
+                param: resolve_option(catalog['options'].get(param), param, value)
+                for param, value in wanted.items() if param not in DEPENDENT_FIELDS
+            }
 
-                # Wait for Semester dropdown to appear/become enabled after selecting Year and Academic Session
-                if params.get('year') or params.get('session'):
-                    try:
-                        # Wait up to 2 seconds for the Semester dropdown to be enabled/visible
-                        await page.wait_for_timeout(2000)
-                    except Exception:
-                        pass
+            # Set form values once (they remain the same for all rows).
+            # Select2 widgets wrap a native <select>, so selecting on the underlying
+            # element by value fires the change event Select2 and the portal listen to.
+            for param, value in selections.items():
+                await page.select_option(f"#{CATALOG_FIELDS[param]}", value=value)
 
-                # Semester - standard select
-                if params.get('semester'):
-                    await page.select_option('#Semester', value=params['semester'])
-                
-                # Program - Select2
-                if params.get('program'):
-                    await select_select2('#Program', params['program'])
-            except Exception as e:
-                raise e
+            # Dependent options (e.g. Semester) load once the fields above are set;
+            # they are validated against what the page offers for those choices.
+            for param in DEPENDENT_FIELDS:
+                if param not in wanted:
+                    continue
+                selector = f"#{CATALOG_FIELDS[param]}"
+                try:
+                    await page.wait_for_selector(f'{selector} option:not([value=""])', state='attached', timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass  # resolve_option reports the empty list
+                value = resolve_option(await scrape_options(page, param), param, wanted[param])
+                await page.select_option(selector, value=value)
 
             # Process each row - only fill Exam Roll Number and Date of Birth
-            for index, row in df.iterrows():
-                # Skip rows where Exam Roll No. is empty or NaN
-                exam_roll = row.get('Exam Roll No.')
-                
-                # More strict validation
-                if pd.isna(exam_roll):
-                    continue
-                
-                # Convert to string and validate
-                roll_no = str(exam_roll).strip()
-                
-                # Skip if empty string or contains only whitespace
-                if not roll_no or roll_no == '' or roll_no == 'nan':
-                    continue
-                
-                # Skip if it looks like a float representation (e.g., "24032282.0")
-                # We want actual roll numbers without decimal points
-                if '.' in roll_no:
-                    # Remove trailing .0 if present
-                    roll_no = roll_no.rstrip('0').rstrip('.')
-                
-                # Get date of birth
-                if pd.isna(row['Date of Birth']):
+            for student in rows:
+                result = {
+                    **student,
+                    'sgpa': '',
+                    'sgpa_check': '',
+                    'courses': [],
+                }
+
+                # Rows that failed validation are reported without visiting the portal
+                if student['status']:
+                    yield result
                     continue
-                    
-                dob = row['Date of Birth']
 
                 # Clear and fill only Exam Roll Number
                 await page.fill('#Symbol_Number', '')
-                await page.fill('#Symbol_Number', roll_no)
+                await page.fill('#Symbol_Number', student['roll_no'])
 
                 # Clear and fill Date of Birth
-                try:
-                    # Handle date of birth - could be datetime object or string
-                    if isinstance(dob, pd.Timestamp):
-                        dob_formatted = dob.strftime('%Y-%m-%d')
-                    else:
-                        dob_date = pd.to_datetime(dob)
-                        dob_formatted = dob_date.strftime('%Y-%m-%d')
-                    await page.fill('#DOB', '')
-                    await page.fill('#DOB', dob_formatted)
-                except Exception as e:
-                    df.at[index, 'Status'] = f'Error: Invalid DOB format'
-                    continue
+                await page.fill('#DOB', '')
+                await page.fill('#DOB', student['date_of_birth'])
 
                 # Click Submit
                 await page.click('input[type="submit"]')
@@ -183,8 +188,7 @@ async def process_exam_results(input_file, params, delay=1, autofill=True):
                         # Extract SGPA from the table
                         sgpa_elem = await page.locator('td:has-text("SGPA =")').text_content()
                         if sgpa_elem:
-                            sgpa = sgpa_elem.replace('SGPA =', '').replace('SGPA=', '').strip()
-                            df.at[index, 'SGPA'] = sgpa
+                            result['sgpa'] = sgpa_elem.replace('SGPA =', '').replace('SGPA=', '').strip()
                         
                         # Extract course details from table
                         course_rows = await page.locator('table.table tbody tr').all()
@@ -199,30 +203,119 @@ async def process_exam_results(input_file, params, delay=1, autofill=True):
                                 grade = await cells[4].text_content()
                                 
                                 if code and title:
-                                    code = code.strip()
-                                    title = title.strip()
-                                    credit = credit.strip() if credit else ''
-                                    grade = grade.strip() if grade else ''
-                                    
-                                    # Check if this course title exists as a column in the Excel
-                                    # If not, create a new column with the course title
-                                    if title not in df.columns:
-                                        df[title] = ''
-                                    
-                                    # Store the grade in the appropriate course column
-                                    df.at[index, title] = grade
+                                    result['courses'].append({
+                                        'code': code.strip(),
+                                        'title': title.strip(),
+                                        'credit': credit.strip() if credit else '',
+                                        'grade': grade.strip() if grade else '',
+                                    })
+
+                        # Cross-check the portal's SGPA against the scraped grades
+                        computed = sgpa_from_grades(
+                            [course['grade'] for course in result['courses']],
+                            [course['credit'] for course in result['courses']],
+                        )
+                        if result['sgpa'] and computed is not None:
+                            try:
+                                matches = abs(float(result['sgpa']) - computed) < 0.01
+                            except ValueError:
+                                matches = False
+                            result['sgpa_check'] = 'OK' if matches else f'Mismatch (computed {computed:.2f})'
                         
                     except Exception as e:
                         pass
 
-            
-            # Save the updated Excel file to memory
-            output = io.BytesIO()
-            df.to_excel(output, index=False)
-            output.seek(0)
-            return output
+                yield result
 
-        except Exception as e:
-            raise e
         finally:
             await browser.close()
+
+def stream_exam_results(input_file, params, delay=1, autofill=True):
+    """
+    Synchronous iterator over iter_exam_results for streaming responses.
+    The browser runs on its own event loop in a worker thread; results are
+    handed over through a queue as soon as each row is scraped.
+    """
+    df = load_student_sheet(input_file)
+    results = queue.Queue()
+    stop = threading.Event()
+    done = object()
+
+    async def pump():
+        try:
+            rows = iter_student_rows(df)
+            async for result in iter_exam_results(rows, params, delay=delay, autofill=autofill):
+                results.put(result)
+                if stop.is_set():
+                    break
+        except Exception as e:
+            results.put(e)
+        finally:
+            results.put(done)
+
+    threading.Thread(target=lambda: asyncio.run(pump()), daemon=True).start()
+    try:
+        while True:
+            item = results.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # The consumer went away (e.g. client disconnected) - let the browser close
+        stop.set()
+
+def apply_result(df, result):
+    """Write one scraped result into its row of the student sheet."""
+    index = result['row']
+    if result['status']:
+        df.at[index, 'Status'] = result['status']
+    if result['sgpa']:
+        df.at[index, 'SGPA'] = result['sgpa']
+    if result['sgpa_check']:
+        df.at[index, 'SGPA Check'] = result['sgpa_check']
+    for course in result['courses']:
+        # Check if this course title exists as a column in the Excel
+        # If not, create a new column with the course title
+        if course['title'] not in df.columns:
+            df[course['title']] = ''
+        
+        # Store the grade in the appropriate course column
+        df.at[index, course['title']] = course['grade']
+
+def build_workbook(df, results, autofill=True):
+    """
+    Fill the student sheet with scraped results.
+    df: DataFrame returned by load_student_sheet
+    results: iterable of result dicts from iter_exam_results
+    Returns: io.BytesIO object containing the processed Excel file
+    """
+    # Add SGPA column if it doesn't exist (course columns will be added dynamically)
+    if 'SGPA' not in df.columns:
+        df['SGPA'] = ''
+    if autofill and 'SGPA Check' not in df.columns:
+        df['SGPA Check'] = ''
+
+    for result in results:
+        apply_result(df, result)
+
+    # Save the updated Excel file to memory
+    output = io.BytesIO()
+    df.to_excel(output, index=False)
+    output.seek(0)
+    return output
+
+async def process_exam_results(input_file, params, delay=1, autofill=True):
+    """
+    Process the exam results using Playwright.
+    input_file: bytes or file-like object containing the Excel file
+    params: dict containing result_type, year, session, semester, program
+    delay: float (seconds) - delay between processing each row
+    autofill: bool - if True, extract and fill data automatically; if False, only navigate and wait
+    Returns: io.BytesIO object containing the processed Excel file
+    """
+    df = load_student_sheet(input_file)
+    rows = iter_student_rows(df)
+    results = [result async for result in iter_exam_results(rows, params, delay=delay, autofill=autofill)]
+    return build_workbook(df, results, autofill=autofill)
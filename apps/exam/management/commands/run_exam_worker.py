@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from apps.exam.services.workers import BATCH_SIZE, LEASE_SECONDS, run_worker
+
+
+class Command(BaseCommand):
+    help = "Claim and process leased exam result work items. Run one per browser slot, on as many nodes as needed."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--worker', help="Worker name recorded on leases (default: host-pid)")
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--lease', type=int, default=LEASE_SECONDS, help="Lease length in seconds")
+        parser.add_argument('--poll-interval', type=float, default=5, help="Seconds to wait when no work is available")
+        parser.add_argument('--once', action='store_true', help="Exit when there is nothing left to claim")
+        parser.add_argument('--headed', action='store_true', help="Show the browser window")
+
+    def handle(self, *args, **options):
+        processed = run_worker(
+            worker=options['worker'],
+            batch_size=options['batch_size'],
+            lease_seconds=options['lease'],
+            poll_interval=options['poll_interval'],
+            once=options['once'],
+            headless=not options['headed'],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} work items"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from apps.exam.services.scheduler import run_timetable_worker
+
+
+class Command(BaseCommand):
+    help = "Compute queued exam timetables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--poll-interval', type=float, default=5, help="Seconds to wait when nothing is queued")
+        parser.add_argument('--once', action='store_true', help="Exit when no timetable is queued")
+
+    def handle(self, *args, **options):
+        count = run_timetable_worker(poll_interval=options['poll_interval'], once=options['once'])
+        self.stdout.write(self.style.SUCCESS(f"Computed {count} timetables"))
@@ -0,0 +1,135 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:30
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ExamTimetable",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ukid",
+                    models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("created_by", models.IntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("updated_by", models.IntegerField(blank=True, null=True)),
+                ("title", models.CharField(max_length=200)),
+                ("semester", models.CharField(max_length=20)),
+                ("program", models.CharField(blank=True, max_length=100)),
+                ("batch", models.CharField(blank=True, max_length=6)),
+                ("start_date", models.DateField()),
+                (
+                    "days",
+                    models.PositiveIntegerField(
+                        help_text="Number of exam days available"
+                    ),
+                ),
+                ("slots_per_day", models.PositiveIntegerField(default=2)),
+                (
+                    "max_exams_per_day",
+                    models.PositiveIntegerField(
+                        default=1, help_text="Maximum exams a student sits in one day"
+                    ),
+                ),
+                (
+                    "room_capacity",
+                    models.PositiveIntegerField(
+                        help_text="Total seats available across all rooms in one slot"
+                    ),
+                ),
+                (
+                    "excluded_weekdays",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Weekdays (0=Monday) with no exams",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("error", models.TextField(blank=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Exam Timetable",
+                "verbose_name_plural": "Exam Timetables",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ExamTimetableEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ukid",
+                    models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("created_by", models.IntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("updated_by", models.IntegerField(blank=True, null=True)),
+                ("subject_name", models.CharField(max_length=255)),
+                ("date", models.DateField(blank=True, null=True)),
+                ("slot", models.PositiveIntegerField(blank=True, null=True)),
+                ("student_count", models.PositiveIntegerField(default=0)),
+                (
+                    "timetable",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="entries",
+                        to="exam.examtimetable",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Exam Timetable Entry",
+                "verbose_name_plural": "Exam Timetable Entries",
+                "ordering": ["date", "slot", "subject_name"],
+                "indexes": [
+                    models.Index(
+                        fields=["timetable", "date"],
+                        name="exam_examti_timetab_03905b_idx",
+                    )
+                ],
+            },
+        ),
+    ]
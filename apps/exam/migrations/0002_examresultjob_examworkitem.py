@@ -0,0 +1,137 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:35
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exam", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExamResultJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ukid",
+                    models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("created_by", models.IntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("updated_by", models.IntegerField(blank=True, null=True)),
+                ("file_name", models.CharField(max_length=255)),
+                ("source", models.BinaryField(help_text="Uploaded result template")),
+                (
+                    "params",
+                    models.JSONField(default=dict, help_text="Portal form parameters"),
+                ),
+                ("delay", models.FloatField(default=1)),
+                ("autofill", models.BooleanField(default=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("total_items", models.PositiveIntegerField(default=0)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Exam Result Job",
+                "verbose_name_plural": "Exam Result Jobs",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ExamWorkItem",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ukid",
+                    models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("created_by", models.IntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("updated_by", models.IntegerField(blank=True, null=True)),
+                ("row", models.PositiveIntegerField()),
+                ("roll_no", models.CharField(max_length=20)),
+                ("date_of_birth", models.DateField(blank=True, null=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("leased", "Leased"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("lease_token", models.UUIDField(blank=True, null=True)),
+                ("lease_owner", models.CharField(blank=True, max_length=100)),
+                ("lease_expires_at", models.DateTimeField(blank=True, null=True)),
+                ("heartbeat_at", models.DateTimeField(blank=True, null=True)),
+                ("result", models.JSONField(blank=True, null=True)),
+                ("error", models.TextField(blank=True)),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="items",
+                        to="exam.examresultjob",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Exam Work Item",
+                "verbose_name_plural": "Exam Work Items",
+                "ordering": ["job", "row"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "lease_expires_at"],
+                        name="exam_examwo_status_0407b5_idx",
+                    ),
+                    models.Index(
+                        fields=["job", "status"], name="exam_examwo_job_id_e617db_idx"
+                    ),
+                    models.Index(
+                        fields=["lease_token"], name="exam_examwo_lease_t_05bcac_idx"
+                    ),
+                ],
+                "unique_together": {("job", "row")},
+            },
+        ),
+    ]
@@ -0,0 +1,2 @@
+from .timetable import ExamTimetable, ExamTimetableEntry, JobStatus
+from .result_job import ExamResultJob, ExamWorkItem, WorkItemStatus
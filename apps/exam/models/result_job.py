@@ -0,0 +1,65 @@
+from django.db import models
+from .base import BaseModel
+from .timetable import JobStatus
+
+class WorkItemStatus(models.TextChoices):
+    """
+    Lifecycle of a leased work item.
+    """
+    PENDING = 'pending', 'Pending'
+    LEASED = 'leased', 'Leased'
+    DONE = 'done', 'Done'
+    FAILED = 'failed', 'Failed'
+
+class ExamResultJob(BaseModel):
+    """An uploaded result sheet processed by exam workers, one row per work item."""
+    file_name = models.CharField(max_length=255)
+    source = models.BinaryField(help_text="Uploaded result template")
+    params = models.JSONField(default=dict, help_text="Portal form parameters")
+    delay = models.FloatField(default=1)
+    autofill = models.BooleanField(default=True)
+    status = models.CharField(max_length=20,
+                              choices=JobStatus.choices,
+                              default=JobStatus.PENDING)
+    total_items = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.file_name} ({self.get_status_display()})"
+
+    class Meta: # type: ignore
+        verbose_name = "Exam Result Job"
+        verbose_name_plural = "Exam Result Jobs"
+        ordering = ['-created_at']
+
+class ExamWorkItem(BaseModel):
+    """A validated student row waiting to be looked up on the exam portal."""
+    job = models.ForeignKey(ExamResultJob, on_delete=models.CASCADE, related_name='items')
+    row = models.PositiveIntegerField()
+    roll_no = models.CharField(max_length=20)
+    date_of_birth = models.DateField(null=True, blank=True)
+    status = models.CharField(max_length=10,
+                              choices=WorkItemStatus.choices,
+                              default=WorkItemStatus.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    lease_token = models.UUIDField(null=True, blank=True)
+    lease_owner = models.CharField(max_length=100, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.roll_no} ({self.get_status_display()})"
+
+    class Meta: # type: ignore
+        verbose_name = "Exam Work Item"
+        verbose_name_plural = "Exam Work Items"
+        ordering = ['job', 'row']
+        unique_together = [['job', 'row']]
+        indexes = [
+            models.Index(fields=['status', 'lease_expires_at']),
+            models.Index(fields=['job', 'status']),
+            models.Index(fields=['lease_token']),
+        ]
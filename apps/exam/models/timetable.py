@@ -0,0 +1,57 @@
+from django.db import models
+from .base import BaseModel
+
+class JobStatus(models.TextChoices):
+    """
+    Status of a background exam job.
+    """
+    PENDING = 'pending', 'Pending'
+    RUNNING = 'running', 'Running'
+    COMPLETED = 'completed', 'Completed'
+    FAILED = 'failed', 'Failed'
+
+class ExamTimetable(BaseModel):
+    """A scheduling job that assigns the subjects of a semester to exam slots."""
+    title = models.CharField(max_length=200)
+    semester = models.CharField(max_length=20)
+    program = models.CharField(max_length=100, blank=True)
+    batch = models.CharField(max_length=6, blank=True)
+    start_date = models.DateField()
+    days = models.PositiveIntegerField(help_text="Number of exam days available")
+    slots_per_day = models.PositiveIntegerField(default=2)
+    max_exams_per_day = models.PositiveIntegerField(default=1, help_text="Maximum exams a student sits in one day")
+    room_capacity = models.PositiveIntegerField(help_text="Total seats available across all rooms in one slot")
+    excluded_weekdays = models.JSONField(default=list, blank=True, help_text="Weekdays (0=Monday) with no exams")
+    status = models.CharField(max_length=20,
+                              choices=JobStatus.choices,
+                              default=JobStatus.PENDING)
+    error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.title} ({self.get_status_display()})"
+
+    class Meta: # type: ignore
+        verbose_name = "Exam Timetable"
+        verbose_name_plural = "Exam Timetables"
+        ordering = ['-created_at']
+
+class ExamTimetableEntry(BaseModel):
+    """A subject placed in a timetable slot; unscheduled subjects have no date."""
+    timetable = models.ForeignKey(ExamTimetable, on_delete=models.CASCADE, related_name='entries')
+    subject_name = models.CharField(max_length=255)
+    date = models.DateField(null=True, blank=True)
+    slot = models.PositiveIntegerField(null=True, blank=True)
+    student_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.subject_name} on {self.date} (slot {self.slot})"
+
+    class Meta: # type: ignore
+        verbose_name = "Exam Timetable Entry"
+        verbose_name_plural = "Exam Timetable Entries"
+        ordering = ['date', 'slot', 'subject_name']
+        indexes = [
+            models.Index(fields=['timetable', 'date']),
+        ]
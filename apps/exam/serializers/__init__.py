@@ -0,0 +1,9 @@
+from .timetable import (
+    ExamTimetableCreateSerializer,
+    ExamTimetableEntrySerializer,
+    ExamTimetableResponseSerializer
+)
+from .result_job import (
+    ExamResultJobCreateSerializer,
+    ExamResultJobResponseSerializer
+)
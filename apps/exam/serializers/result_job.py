@@ -0,0 +1,33 @@
+from rest_framework import serializers
+from ..models import ExamResultJob
+
+class ExamResultJobCreateSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    result_type = serializers.CharField(required=False, allow_blank=True)
+    year = serializers.CharField(required=False, allow_blank=True)
+    session = serializers.CharField(required=False, allow_blank=True)
+    semester = serializers.CharField(required=False, allow_blank=True)
+    program = serializers.CharField(required=False, allow_blank=True)
+    delay = serializers.FloatField(required=False, default=1, min_value=0)
+    autofill = serializers.BooleanField(required=False, default=True)
+
+class ExamResultJobResponseSerializer(serializers.ModelSerializer):
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExamResultJob
+        fields = [
+            'ukid', 'file_name', 'params', 'delay', 'autofill', 'status', 'status_display',
+            'total_items', 'progress', 'started_at', 'completed_at', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj):
+        # Counts are annotated by the viewset queryset
+        return {
+            'pending': getattr(obj, 'pending_items', None),
+            'leased': getattr(obj, 'leased_items', None),
+            'done': getattr(obj, 'done_items', None),
+            'failed': getattr(obj, 'failed_items', None),
+        }
@@ -0,0 +1,51 @@
+from rest_framework import serializers
+from ..models import ExamTimetable, ExamTimetableEntry
+
+class ExamTimetableCreateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ExamTimetable
+        fields = [
+            'title', 'semester', 'program', 'batch', 'start_date', 'days',
+            'slots_per_day', 'max_exams_per_day', 'room_capacity', 'excluded_weekdays'
+        ]
+
+    def validate_excluded_weekdays(self, value):
+        if not isinstance(value, list) or any(day not in range(7) for day in value):
+            raise serializers.ValidationError("Excluded weekdays must be a list of integers from 0 (Monday) to 6 (Sunday).")
+        if len(set(value)) == 7:
+            raise serializers.ValidationError("At least one weekday must be available.")
+        return value
+
+    def validate(self, attrs):
+        errors = {}
+
+        for field in ['days', 'slots_per_day', 'room_capacity']:
+            if attrs.get(field) is not None and attrs[field] < 1:
+                errors[field] = 'Must be at least 1.'
+
+        if attrs.get('batch') and not attrs.get('program'):
+            errors['program'] = 'Program is required when batch is given.'
+
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return attrs
+
+class ExamTimetableEntrySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ExamTimetableEntry
+        fields = ['subject_name', 'date', 'slot', 'student_count']
+
+class ExamTimetableResponseSerializer(serializers.ModelSerializer):
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    entries = ExamTimetableEntrySerializer(many=True, read_only=True)
+
+    class Meta:
+        model = ExamTimetable
+        fields = [
+            'ukid', 'title', 'semester', 'program', 'batch', 'start_date', 'days',
+            'slots_per_day', 'max_exams_per_day', 'room_capacity', 'excluded_weekdays',
+            'status', 'status_display', 'error', 'started_at', 'completed_at',
+            'entries', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
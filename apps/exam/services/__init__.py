@@ -0,0 +1,30 @@
+from .scheduler import (
+    build_conflict_graph,
+    claim_timetable_job,
+    exam_slots,
+    load_registrations,
+    queue_timetable_job,
+    run_timetable_job,
+    run_timetable_worker,
+    schedule_exams,
+)
+from .catalog import (
+    CATALOG_FIELDS,
+    DEPENDENT_FIELDS,
+    PORTAL_URL,
+    UnknownOptionError,
+    aget_catalog,
+    get_catalog,
+    resolve_option,
+    scrape_options,
+)
+from .workers import (
+    claim_items,
+    complete_item,
+    create_result_job,
+    finalize_job,
+    heartbeat,
+    job_progress,
+    release_items,
+    run_worker,
+)
@@ -0,0 +1,117 @@
+"""
+Cached catalog of the exam portal's dropdown options.
+
+The portal's option lists change a few times a year, so they are scraped
+once and kept in the Django cache for ``EXAM_PORTAL_CATALOG_TTL`` seconds.
+The automation resolves user-supplied parameters against the catalog and
+selects options by their exact value instead of typing into Select2.
+
+Dependent dropdowns (``DEPENDENT_FIELDS``) only fill in once the fields they
+depend on are selected, so they are not part of the cached catalog: the
+automation reads their options from the page after making those selections.
+A catalog with an empty option list is never cached.
+"""
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from playwright.async_api import async_playwright
+
+PORTAL_URL = "https://exam.pu.edu.np:9094/"
+
+CATALOG_CACHE_KEY = 'exam:portal-catalog'
+CATALOG_TTL = getattr(settings, 'EXAM_PORTAL_CATALOG_TTL', 6 * 60 * 60)
+
+# Request parameter -> id of the portal's <select> element
+CATALOG_FIELDS = {
+    'result_type': 'Exam_Type',
+    'year': 'Year',
+    'session': 'Academic_System',
+    'semester': 'Semester',
+    'program': 'Program',
+}
+# Fields whose options the portal loads after the other fields are selected
+DEPENDENT_FIELDS = ('semester',)
+
+
+class UnknownOptionError(ValueError):
+    """Raised when a parameter does not match any option on the portal."""
+
+
+async def scrape_options(page, param):
+    """Read the current options of ``param``'s <select> on ``page``."""
+    return await page.locator(f'#{CATALOG_FIELDS[param]} option').evaluate_all(
+        """nodes => nodes
+            .filter(node => node.value)
+            .map(node => ({value: node.value, label: node.textContent.trim()}))"""
+    )
+
+
+async def scrape_catalog(page):
+    """Read the option lists of the independent fields from an already loaded portal page."""
+    options = {}
+    for param in CATALOG_FIELDS:
+        if param not in DEPENDENT_FIELDS:
+            options[param] = await scrape_options(page, param)
+    return {'fetched_at': timezone.now().isoformat(), 'options': options}
+
+
+def _cacheable(catalog):
+    # An empty list means the page was not fully loaded; scrape again next time
+    return all(catalog['options'].values())
+
+
+async def fetch_catalog():
+    """Open the portal headless and scrape its option lists."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            page = await browser.new_page()
+            await page.goto(PORTAL_URL, timeout=30000)
+            return await scrape_catalog(page)
+        finally:
+            await browser.close()
+
+
+def get_catalog(refresh=False):
+    """Return the cached catalog, scraping the portal when missing or forced."""
+    catalog = None if refresh else cache.get(CATALOG_CACHE_KEY)
+    if catalog is None:
+        catalog = async_to_sync(fetch_catalog)()
+        if _cacheable(catalog):
+            cache.set(CATALOG_CACHE_KEY, catalog, CATALOG_TTL)
+    return catalog
+
+
+async def aget_catalog(page):
+    """
+    Async variant used inside the automation: reuses the cached catalog, or
+    scrapes ``page`` (already on the portal) and caches the result.
+    """
+    catalog = await cache.aget(CATALOG_CACHE_KEY)
+    if catalog is None:
+        catalog = await scrape_catalog(page)
+        if _cacheable(catalog):
+            await cache.aset(CATALOG_CACHE_KEY, catalog, CATALOG_TTL)
+    return catalog
+
+
+def resolve_option(options, param, wanted):
+    """
+    Map ``wanted`` to the exact value among ``options`` (as scraped) for
+    ``param``. Matches the option value first and then the visible label
+    (ignoring case). Raises UnknownOptionError when none matches, including
+    when the portal listed no options at all.
+    """
+    wanted = str(wanted).strip()
+    if not options:
+        raise UnknownOptionError(
+            f"The exam portal offered no {param.replace('_', ' ')} options to check '{wanted}' against"
+        )
+    for option in options:
+        if option['value'] == wanted:
+            return option['value']
+    for option in options:
+        if option['label'].casefold() == wanted.casefold():
+            return option['value']
+    raise UnknownOptionError(f"'{wanted}' is not a valid {param.replace('_', ' ')} on the exam portal")
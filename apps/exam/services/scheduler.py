@@ -0,0 +1,234 @@
+"""
+Exam timetable scheduling.
+
+Two subjects conflict when they share a student and must not share a slot.
+The conflict graph is built from the inverted student -> subjects index, so
+the work is proportional to the subject pairs that actually share students
+rather than to every pair of subjects. Slots are then assigned with a
+DSatur-style greedy colouring that also respects room capacity and the
+per-student daily exam limit.
+
+Timetables are computed off-request: creating one queues it as PENDING and
+``run_timetable_worker`` (``manage.py run_timetable_worker``) claims queued
+jobs with a conditional UPDATE, so any number of workers can poll safely.
+A job left RUNNING past ``EXAM_TIMETABLE_JOB_TIMEOUT`` (its worker died) is
+claimable again.
+"""
+import logging
+import time
+from collections import defaultdict
+from datetime import timedelta
+from itertools import combinations
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.student.models import Enrollment, SubjectResult
+from ..models import ExamTimetable, ExamTimetableEntry, JobStatus
+
+logger = logging.getLogger(__name__)
+
+TIMETABLE_JOB_TIMEOUT = getattr(settings, 'EXAM_TIMETABLE_JOB_TIMEOUT', 30 * 60)
+
+
+def load_registrations(semester, program='', batch=''):
+    """Map each subject of ``semester`` to the set of student ids sitting it."""
+    results = SubjectResult.objects.filter(semester=semester)
+    if program:
+        enrollments = Enrollment.objects.filter(program=program, semester=semester)
+        if batch:
+            enrollments = enrollments.filter(batch=batch)
+        results = results.filter(student__in=enrollments.values('student'))
+
+    registrations = defaultdict(set)
+    rows = results.order_by().values_list('subject_name', 'student_id')
+    for subject, student in rows.iterator(chunk_size=5000):
+        registrations[subject].add(student)
+    return dict(registrations)
+
+
+def build_conflict_graph(registrations):
+    """
+    Return ``{subject: {neighbour: shared_students}}`` for subjects that
+    share at least one student.
+    """
+    by_student = defaultdict(list)
+    for subject, students in registrations.items():
+        for student in students:
+            by_student[student].append(subject)
+
+    graph = {subject: defaultdict(int) for subject in registrations}
+    for subjects in by_student.values():
+        for a, b in combinations(subjects, 2):
+            graph[a][b] += 1
+            graph[b][a] += 1
+    return graph
+
+
+def exam_slots(start_date, days, slots_per_day, excluded_weekdays=()):
+    """List the ``(date, slot)`` pairs available, skipping excluded weekdays."""
+    slots = []
+    current = start_date
+    while days > 0:
+        if current.weekday() not in excluded_weekdays:
+            slots.extend((current, slot) for slot in range(1, slots_per_day + 1))
+            days -= 1
+        current += timedelta(days=1)
+    return slots
+
+
+def schedule_exams(registrations, slots, room_capacity, max_exams_per_day=1):
+    """
+    Assign subjects to slots.
+
+    Returns ``(assignment, unscheduled)`` where ``assignment`` maps a subject
+    to an index into ``slots`` and ``unscheduled`` lists subjects for which
+    no slot satisfied the constraints.
+    """
+    graph = build_conflict_graph(registrations)
+    neighbour_slots = {subject: set() for subject in registrations}
+    slot_load = [0] * len(slots)
+    day_counts = defaultdict(lambda: defaultdict(int))
+    day_full = defaultdict(set)  # students already at the daily limit
+
+    assignment = {}
+    unscheduled = []
+    pending = set(registrations)
+    while pending:
+        # Most constrained first: saturation, then degree, then size.
+        subject = max(pending, key=lambda s: (
+            len(neighbour_slots[s]), len(graph[s]), len(registrations[s]), s
+        ))
+        pending.remove(subject)
+        students = registrations[subject]
+        blocked = neighbour_slots[subject]
+
+        chosen = None
+        for index, (date, _) in enumerate(slots):
+            if index in blocked or slot_load[index] + len(students) > room_capacity:
+                continue
+            if max_exams_per_day and not students.isdisjoint(day_full[date]):
+                continue
+            chosen = index
+            break
+
+        if chosen is None:
+            unscheduled.append(subject)
+            continue
+
+        assignment[subject] = chosen
+        slot_load[chosen] += len(students)
+        date = slots[chosen][0]
+        counts = day_counts[date]
+        for student in students:
+            counts[student] += 1
+            if max_exams_per_day and counts[student] >= max_exams_per_day:
+                day_full[date].add(student)
+        for neighbour in graph[subject]:
+            neighbour_slots[neighbour].add(chosen)
+
+    return assignment, sorted(unscheduled)
+
+
+def run_timetable_job(timetable: ExamTimetable):
+    """Compute ``timetable`` and replace its entries, recording the job status."""
+    timetable.status = JobStatus.RUNNING
+    timetable.started_at = timezone.now()
+    timetable.error = ''
+    timetable.save(update_fields=['status', 'started_at', 'error', 'updated_at'])
+
+    try:
+        registrations = load_registrations(timetable.semester, timetable.program, timetable.batch)
+        slots = exam_slots(
+            timetable.start_date,
+            timetable.days,
+            timetable.slots_per_day,
+            set(timetable.excluded_weekdays or []),
+        )
+        assignment, unscheduled = schedule_exams(
+            registrations, slots, timetable.room_capacity, timetable.max_exams_per_day
+        )
+
+        entries = [
+            ExamTimetableEntry(
+                timetable=timetable,
+                subject_name=subject,
+                date=slots[index][0],
+                slot=slots[index][1],
+                student_count=len(registrations[subject]),
+            )
+            for subject, index in assignment.items()
+        ]
+        entries.extend(
+            ExamTimetableEntry(
+                timetable=timetable,
+                subject_name=subject,
+                student_count=len(registrations[subject]),
+            )
+            for subject in unscheduled
+        )
+
+        with transaction.atomic():
+            timetable.entries.all().delete()
+            ExamTimetableEntry.objects.bulk_create(entries, batch_size=500)
+            timetable.status = JobStatus.COMPLETED
+            timetable.completed_at = timezone.now()
+            timetable.save(update_fields=['status', 'completed_at', 'updated_at'])
+    except Exception as e:
+        timetable.status = JobStatus.FAILED
+        timetable.error = str(e)
+        timetable.completed_at = timezone.now()
+        timetable.save(update_fields=['status', 'error', 'completed_at', 'updated_at'])
+    return timetable
+
+
+def queue_timetable_job(timetable: ExamTimetable):
+    """Queue ``timetable`` for the worker; its current entries stay until the new run completes."""
+    now = timezone.now()
+    ExamTimetable.objects.filter(pk=timetable.pk).update(
+        status=JobStatus.PENDING, error='', started_at=None, completed_at=None, updated_at=now
+    )
+    timetable.refresh_from_db()
+    return timetable
+
+
+def _claimable(now):
+    return Q(status=JobStatus.PENDING) | Q(
+        status=JobStatus.RUNNING, started_at__lt=now - timedelta(seconds=TIMETABLE_JOB_TIMEOUT)
+    )
+
+
+def claim_timetable_job(now=None):
+    """
+    Take the oldest queued (or abandoned) timetable job, marking it RUNNING.
+    Returns the timetable, or None when nothing is queued.
+    """
+    now = now or timezone.now()
+    candidates = ExamTimetable.objects.filter(_claimable(now)).order_by('created_at', 'id')
+    for pk in candidates.values_list('id', flat=True)[:10]:
+        # The conditional UPDATE is the claim: only one worker moves the row
+        if ExamTimetable.objects.filter(_claimable(now), pk=pk).update(
+            status=JobStatus.RUNNING, started_at=now, updated_at=now
+        ):
+            return ExamTimetable.objects.get(pk=pk)
+    return None
+
+
+def run_timetable_worker(poll_interval=5, once=False):
+    """
+    Claim and compute timetable jobs until interrupted (or, with ``once``,
+    until none is queued). Returns the number of jobs run.
+    """
+    count = 0
+    while True:
+        timetable = claim_timetable_job()
+        if timetable is None:
+            if once:
+                return count
+            time.sleep(poll_interval)
+            continue
+        logger.info("Computing timetable %s", timetable.ukid)
+        run_timetable_job(timetable)
+        count += 1
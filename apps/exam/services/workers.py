@@ -0,0 +1,264 @@
+"""
+Leased work items for distributed exam result processing.
+
+An uploaded sheet is validated once and stored as one ``ExamWorkItem`` per
+student. Any number of worker processes, on any node sharing the database,
+claim small batches of items under a time-limited lease, heartbeat while
+the browser works through them and mark each item done as it finishes.
+Items whose lease expires (a worker crashed or lost its node) become
+claimable again, and the job is finalized once no item is outstanding.
+
+A claim is a single conditional UPDATE, stamped with a fresh lease token,
+whose WHERE clause selects the batch and re-checks that each row is still
+claimable, so an item can only be moved out of the claimable state by one
+worker. Being one statement, it never upgrades a read lock to a write
+lock inside a transaction, which on SQLite fails at once with "database is
+locked" when two workers do it together. Lock errors and lost races are
+retried with backoff.
+"""
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.db import OperationalError, transaction
+from django.db.models import Count, F, Q, Subquery
+from django.utils import timezone
+
+from .. import automation
+from ..models import ExamResultJob, ExamWorkItem, JobStatus, WorkItemStatus
+
+logger = logging.getLogger(__name__)
+
+LEASE_SECONDS = getattr(settings, 'EXAM_WORKER_LEASE_SECONDS', 300)
+BATCH_SIZE = getattr(settings, 'EXAM_WORKER_BATCH_SIZE', 25)
+MAX_ATTEMPTS = getattr(settings, 'EXAM_WORKER_MAX_ATTEMPTS', 3)
+# Claims retried on lock contention, backing off from CLAIM_BACKOFF seconds
+CLAIM_RETRIES = getattr(settings, 'EXAM_WORKER_CLAIM_RETRIES', 5)
+CLAIM_BACKOFF = getattr(settings, 'EXAM_WORKER_CLAIM_BACKOFF', 0.1)
+
+
+def create_result_job(file_name, content, params, delay=1, autofill=True, user_id=None):
+    """Validate an uploaded sheet and store its rows as pending work items."""
+    df = automation.load_student_sheet(content)
+    rows = list(automation.iter_student_rows(df))
+
+    with transaction.atomic():
+        job = ExamResultJob.objects.create(
+            file_name=file_name,
+            source=content,
+            params=params,
+            delay=delay,
+            autofill=autofill,
+            total_items=len(rows),
+            created_by=user_id,
+        )
+        items = []
+        for row in rows:
+            item = ExamWorkItem(
+                job=job,
+                row=row['row'],
+                roll_no=row['roll_no'],
+                date_of_birth=row['date_of_birth'],
+            )
+            if row['status']:
+                # Failed validation: nothing to look up, report it as is
+                item.status = WorkItemStatus.DONE
+                item.result = {**row, 'sgpa': '', 'sgpa_check': '', 'courses': []}
+            items.append(item)
+        ExamWorkItem.objects.bulk_create(items, batch_size=500)
+
+    finalize_job(job.pk)
+    return job
+
+
+def _claimable(now):
+    return Q(status=WorkItemStatus.PENDING) | Q(status=WorkItemStatus.LEASED, lease_expires_at__lt=now)
+
+
+def reap_expired_leases(now=None):
+    """Fail expired items that already used up their attempts."""
+    now = now or timezone.now()
+    exhausted = ExamWorkItem.objects.filter(
+        status=WorkItemStatus.LEASED, lease_expires_at__lt=now, attempts__gte=MAX_ATTEMPTS
+    )
+    job_ids = set(exhausted.values_list('job_id', flat=True))
+    exhausted.update(
+        status=WorkItemStatus.FAILED,
+        error='Lease expired after the maximum number of attempts',
+        lease_token=None,
+        lease_expires_at=None,
+        updated_at=now,
+    )
+    for job_id in job_ids:
+        finalize_job(job_id)
+
+
+def _claim(worker, batch_size, lease_seconds):
+    now = timezone.now()
+    reap_expired_leases(now)
+    token = uuid.uuid4()
+
+    # One UPDATE takes the batch: the oldest job's first claimable rows,
+    # re-checked as the rows are written
+    claimable = ExamWorkItem.objects.filter(_claimable(now))
+    first_job = claimable.order_by('job_id', 'row').values('job_id')[:1]
+    ids = claimable.filter(job_id=Subquery(first_job)).order_by('row').values('id')[:batch_size]
+    claimed = ExamWorkItem.objects.filter(id__in=Subquery(ids)).filter(_claimable(now)).update(
+        status=WorkItemStatus.LEASED,
+        lease_token=token,
+        lease_owner=worker,
+        lease_expires_at=now + timedelta(seconds=lease_seconds),
+        heartbeat_at=now,
+        attempts=F('attempts') + 1,
+        updated_at=now,
+    )
+    if not claimed:
+        return []
+
+    items = list(ExamWorkItem.objects.filter(lease_token=token).select_related('job').order_by('row'))
+    ExamResultJob.objects.filter(pk=items[0].job_id, status=JobStatus.PENDING).update(
+        status=JobStatus.RUNNING, started_at=now, updated_at=now
+    )
+    return items
+
+
+def claim_items(worker, batch_size=BATCH_SIZE, lease_seconds=LEASE_SECONDS):
+    """
+    Lease up to ``batch_size`` claimable items of a single job for ``worker``.
+    A claim that loses a race (nothing taken while claimable items remain)
+    or finds the database locked is retried with backoff.
+    Returns the claimed items (with their job) ordered by row; empty only
+    when nothing is claimable.
+    """
+    for attempt in range(CLAIM_RETRIES):
+        try:
+            items = _claim(worker, batch_size, lease_seconds)
+        except OperationalError:
+            if attempt == CLAIM_RETRIES - 1:
+                raise
+            logger.warning("Claim by worker %s hit a locked database, retrying", worker)
+        else:
+            if items or not ExamWorkItem.objects.filter(_claimable(timezone.now())).exists():
+                return items
+        time.sleep(CLAIM_BACKOFF * 2 ** attempt * random.uniform(0.5, 1.5))
+    return []
+
+
+def heartbeat(token, lease_seconds=LEASE_SECONDS):
+    """Extend the lease on the items still held under ``token``."""
+    now = timezone.now()
+    return ExamWorkItem.objects.filter(lease_token=token, status=WorkItemStatus.LEASED).update(
+        heartbeat_at=now, lease_expires_at=now + timedelta(seconds=lease_seconds)
+    )
+
+
+def complete_item(item, result):
+    """Store ``result`` for ``item`` unless its lease was lost to another worker."""
+    return ExamWorkItem.objects.filter(
+        pk=item.pk, lease_token=item.lease_token, status=WorkItemStatus.LEASED
+    ).update(
+        status=WorkItemStatus.DONE,
+        result=result,
+        error='',
+        lease_token=None,
+        lease_expires_at=None,
+        updated_at=timezone.now(),
+    )
+
+
+def release_items(items, error=''):
+    """Give unfinished items back for another attempt, or fail them when exhausted."""
+    now = timezone.now()
+    for item_ids, status in (
+        ([i.pk for i in items if i.attempts < MAX_ATTEMPTS], WorkItemStatus.PENDING),
+        ([i.pk for i in items if i.attempts >= MAX_ATTEMPTS], WorkItemStatus.FAILED),
+    ):
+        if item_ids:
+            ExamWorkItem.objects.filter(
+                pk__in=item_ids, lease_token=items[0].lease_token, status=WorkItemStatus.LEASED
+            ).update(
+                status=status,
+                error=error,
+                lease_token=None,
+                lease_expires_at=None,
+                updated_at=now,
+            )
+
+
+def finalize_job(job_id):
+    """Mark the job completed once none of its items is pending or leased."""
+    outstanding = ExamWorkItem.objects.filter(
+        job_id=job_id, status__in=[WorkItemStatus.PENDING, WorkItemStatus.LEASED]
+    )
+    if outstanding.exists():
+        return False
+    now = timezone.now()
+    ExamResultJob.objects.filter(pk=job_id).exclude(status=JobStatus.COMPLETED).update(
+        status=JobStatus.COMPLETED, completed_at=now, updated_at=now
+    )
+    return True
+
+
+def job_progress(job):
+    """Item counts by status for ``job``."""
+    counts = dict(job.items.order_by().values_list('status').annotate(count=Count('id')))
+    return {status: counts.get(status, 0) for status in WorkItemStatus.values}
+
+
+async def process_batch(items, lease_seconds=LEASE_SECONDS, headless=True):
+    """Run one browser session over a claimed batch, recording each result."""
+    job = items[0].job
+    token = items[0].lease_token
+    by_row = {item.row: item for item in items}
+    rows = [
+        {
+            'row': item.row,
+            'roll_no': item.roll_no,
+            'date_of_birth': item.date_of_birth.isoformat() if item.date_of_birth else None,
+            'status': '',
+        }
+        for item in items
+    ]
+
+    try:
+        async for result in automation.iter_exam_results(
+            rows, job.params, delay=job.delay, autofill=job.autofill, headless=headless
+        ):
+            await sync_to_async(complete_item)(by_row.pop(result['row']), result)
+            await sync_to_async(heartbeat)(token, lease_seconds)
+    except Exception as e:
+        logger.exception("Exam worker batch for job %s failed", job.ukid)
+        await sync_to_async(release_items)(list(by_row.values()), str(e))
+    finally:
+        await sync_to_async(finalize_job)(job.pk)
+
+
+def run_worker(worker=None, batch_size=BATCH_SIZE, lease_seconds=LEASE_SECONDS,
+               poll_interval=5, once=False, headless=True):
+    """
+    Claim and process batches until interrupted (or, with ``once``, until
+    nothing is left to claim). Returns the number of items processed.
+    """
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    processed = 0
+    while True:
+        try:
+            items = claim_items(worker, batch_size, lease_seconds)
+        except OperationalError:
+            logger.exception("Worker %s could not claim items", worker)
+            time.sleep(poll_interval)
+            continue
+        if not items:
+            if once:
+                return processed
+            time.sleep(poll_interval)
+            continue
+        logger.info("Worker %s claimed %d items of job %s", worker, len(items), items[0].job.ukid)
+        async_to_sync(process_batch)(items, lease_seconds, headless)
+        processed += len(items)
@@ -0,0 +1,95 @@
+import io
+import json
+from unittest import mock
+import pandas as pd
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+def student_sheet(*students):
+    """An upload shaped like the portal template: headers on the fourth row."""
+    frame = pd.DataFrame(
+        [[roll, dd, mm, yyyy] for roll, dd, mm, yyyy in students],
+        columns=['Exam Roll No.', 'Date of Birth', 'Unnamed: 4', 'Unnamed: 5'],
+    )
+    output = io.BytesIO()
+    with pd.ExcelWriter(output) as writer:
+        frame.to_excel(writer, index=False, startrow=3)
+    return output.getvalue()
+
+
+def fake_results(fail_after=None):
+    """Stand-in for the browser scrape: one result per student row."""
+    async def iter_exam_results(rows, params, delay=1, autofill=True, headless=False):
+        for count, student in enumerate(rows):
+            if count == fail_after:
+                raise RuntimeError('Portal went away')
+            yield {**student, 'sgpa': '3.60', 'sgpa_check': '', 'courses': []}
+    return iter_exam_results
+
+
+class ExamResultsStreamTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='examiner', password='pass')
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def post(self, sheet, headers=None, **data):
+        upload = SimpleUploadedFile('results.xlsx', sheet)
+        return self.client.post(reverse('exam-results'), {'file': upload, 'program': 'BCA', **data},
+                                headers=headers)
+
+    def lines(self, response):
+        return [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+
+    def test_ndjson_line_per_student(self):
+        sheet = student_sheet((24032282, 1, 5, 2004), (None, 1, 1, 2004), (24032283, 9, 12, 2003))
+        with mock.patch('apps.exam.automation.iter_exam_results', fake_results()):
+            response = self.post(sheet, stream='true')
+            self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+            lines = self.lines(response)
+        self.assertEqual([(line['roll_no'], line['date_of_birth']) for line in lines],
+                         [('24032282', '2004-05-01'), ('24032283', '2003-12-09')])
+
+    def test_failure_mid_stream_ends_with_an_error_line(self):
+        sheet = student_sheet((24032282, 1, 5, 2004), (24032283, 9, 12, 2003))
+        with mock.patch('apps.exam.automation.iter_exam_results', fake_results(fail_after=1)):
+            lines = self.lines(self.post(sheet, headers={'Accept': 'application/x-ndjson'}))
+        self.assertEqual(lines[0]['roll_no'], '24032282')
+        self.assertEqual(lines[-1], {'error': 'Portal went away'})
+
+    def test_json_document_without_stream(self):
+        sheet = student_sheet((24032282, 1, 5, 2004))
+        with mock.patch('apps.exam.automation.iter_exam_results', fake_results()):
+            response = self.post(sheet)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['sgpa'], '3.60')
+
+    def test_setup_errors_keep_their_status_code(self):
+        self.assertEqual(self.client.post(reverse('exam-results'), {}).status_code, 400)
+
+        frame = pd.DataFrame([[1]], columns=['Name'])
+        output = io.BytesIO()
+        frame.to_excel(output, index=False, startrow=3)
+        response = self.post(output.getvalue(), stream='true')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Exam Roll No.', response.data['error'])
+
+        response = self.post(output.getvalue(), headers={'Accept': 'application/x-ndjson'})
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response['Content-Type'].startswith('application/x-ndjson'))
+        self.assertIn('Exam Roll No.', json.loads(response.content)['error'])
+
+    def test_anonymous_users_cannot_start_a_scrape(self):
+        self.client.force_authenticate(None)
+        with mock.patch('apps.exam.automation.iter_exam_results') as scrape:
+            response = self.post(student_sheet((24032282, 1, 5, 2004)), stream='true')
+        self.assertEqual(response.status_code, 401)
+        scrape.assert_not_called()
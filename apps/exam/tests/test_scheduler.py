@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+from django.test import TestCase
+from django.utils import timezone
+from apps.exam.models import ExamTimetable, JobStatus
+from apps.exam.services.scheduler import (
+    TIMETABLE_JOB_TIMEOUT,
+    claim_timetable_job,
+    exam_slots,
+    queue_timetable_job,
+    schedule_exams,
+)
+
+MONDAY = date(2025, 3, 3)
+
+
+class TimetableSchedulingTests(TestCase):
+    def slots_by_subject(self, registrations, slots, room_capacity, max_exams_per_day=1):
+        assignment, unscheduled = schedule_exams(registrations, slots, room_capacity, max_exams_per_day)
+        return {subject: slots[index] for subject, index in assignment.items()}, unscheduled
+
+    def test_exam_slots_skip_excluded_weekdays(self):
+        slots = exam_slots(date(2025, 3, 7), 2, 2, excluded_weekdays={5, 6})
+        self.assertEqual(slots, [(date(2025, 3, 7), 1), (date(2025, 3, 7), 2),
+                                 (date(2025, 3, 10), 1), (date(2025, 3, 10), 2)])
+
+    def test_shared_students_sit_one_exam_per_day(self):
+        registrations = {'Physics': {1, 2}, 'Maths': {2, 3}, 'Art': {4}}
+        placed, unscheduled = self.slots_by_subject(registrations, exam_slots(MONDAY, 2, 2), room_capacity=10)
+        self.assertEqual(unscheduled, [])
+        self.assertNotEqual(placed['Physics'][0], placed['Maths'][0])
+
+        # With two exams a day allowed, only the slot itself must differ
+        placed, _ = self.slots_by_subject(registrations, exam_slots(MONDAY, 1, 2), room_capacity=10,
+                                          max_exams_per_day=2)
+        self.assertEqual(placed['Physics'][0], placed['Maths'][0])
+        self.assertNotEqual(placed['Physics'], placed['Maths'])
+
+    def test_room_capacity_splits_slots_and_reports_misfits(self):
+        registrations = {'Physics': {1, 2, 3}, 'Maths': {4, 5}, 'Chemistry': {6, 7, 8, 9, 10}}
+        placed, unscheduled = self.slots_by_subject(registrations, exam_slots(MONDAY, 1, 2), room_capacity=4)
+        # Chemistry fits no slot; the other two cannot share one
+        self.assertEqual(unscheduled, ['Chemistry'])
+        self.assertEqual(sorted(placed.values()), [(MONDAY, 1), (MONDAY, 2)])
+
+    def test_workers_claim_queued_and_abandoned_jobs_once(self):
+        timetable = ExamTimetable.objects.create(
+            title='Finals', semester='1', start_date=MONDAY, days=5, room_capacity=100,
+        )
+        claimed = claim_timetable_job()
+        self.assertEqual((claimed.pk, claimed.status), (timetable.pk, JobStatus.RUNNING))
+        self.assertIsNone(claim_timetable_job())
+
+        # A worker that died leaves the job RUNNING until the timeout
+        later = timezone.now() + timedelta(seconds=TIMETABLE_JOB_TIMEOUT + 1)
+        self.assertEqual(claim_timetable_job(later).pk, timetable.pk)
+
+        queue_timetable_job(timetable)
+        self.assertEqual(timetable.status, JobStatus.PENDING)
+        self.assertEqual(claim_timetable_job().pk, timetable.pk)
@@ -0,0 +1,114 @@
+import io
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+import pandas as pd
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from django.db import OperationalError
+from apps.exam.models import ExamWorkItem, JobStatus, WorkItemStatus
+from apps.exam.services import workers
+from apps.exam.services.workers import (
+    LEASE_SECONDS,
+    MAX_ATTEMPTS,
+    claim_items,
+    complete_item,
+    create_result_job,
+    heartbeat,
+)
+from .test_results_stream import student_sheet
+
+User = get_user_model()
+
+
+class WorkItemLeaseTests(APITestCase):
+    def setUp(self):
+        # One clock for lease stamps and expiry checks
+        self.now = datetime(2025, 3, 1, 12, 0, tzinfo=dt_timezone.utc)
+        patcher = mock.patch('django.utils.timezone.now', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sheet = student_sheet((24032281, 1, 5, 2004), (24032282, 2, 5, 2004), (24032283, 3, 5, 2004))
+        self.job = create_result_job('results.xlsx', sheet, {'program': 'BCA'})
+
+    def expire_leases(self):
+        self.now += timedelta(seconds=LEASE_SECONDS + 1)
+
+    def result(self, item):
+        return {'row': item.row, 'roll_no': item.roll_no, 'status': '', 'sgpa': '3.60',
+                'sgpa_check': '', 'courses': []}
+
+    def test_claims_are_disjoint_and_heartbeats_extend_the_lease(self):
+        first = claim_items('worker-1', batch_size=2)
+        second = claim_items('worker-2', batch_size=2)
+        self.assertEqual([item.roll_no for item in first], ['24032281', '24032282'])
+        self.assertEqual([item.roll_no for item in second], ['24032283'])
+        self.assertEqual(claim_items('worker-3'), [])
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, JobStatus.RUNNING)
+
+        self.now += timedelta(seconds=LEASE_SECONDS - 1)
+        self.assertEqual(heartbeat(first[0].lease_token), 2)
+        self.now += timedelta(seconds=2)
+        # Only the batch that missed its heartbeat is up for grabs
+        self.assertEqual([item.roll_no for item in claim_items('worker-3')], ['24032283'])
+
+    def test_expired_lease_is_reclaimed_and_late_results_are_dropped(self):
+        lost = claim_items('worker-1')
+        self.expire_leases()
+        reclaimed = claim_items('worker-2')
+        self.assertEqual([item.pk for item in reclaimed], [item.pk for item in lost])
+        self.assertEqual(reclaimed[0].attempts, 2)
+
+        # The first worker's lease is gone: its result is not stored
+        self.assertEqual(complete_item(lost[0], self.result(lost[0])), 0)
+        self.assertEqual(complete_item(reclaimed[0], self.result(reclaimed[0])), 1)
+        self.assertEqual(ExamWorkItem.objects.get(pk=lost[0].pk).status, WorkItemStatus.DONE)
+
+    def test_exhausted_items_fail_and_are_reported_in_the_workbook(self):
+        items = claim_items('worker-1')
+        complete_item(items[0], self.result(items[0]))
+        # The first claim was attempt one; the rest go to other workers
+        for attempt in range(2, MAX_ATTEMPTS + 1):
+            self.expire_leases()
+            claimed = claim_items(f'worker-{attempt}')
+            self.assertEqual([item.attempts for item in claimed], [attempt, attempt])
+        self.expire_leases()
+        self.assertEqual(claim_items('worker-9'), [])
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.status, JobStatus.COMPLETED)
+        self.client.force_authenticate(User.objects.create_user(username='staff', password='pass'))
+        response = self.client.get(reverse('exam-result-job-download', kwargs={'ukid': self.job.ukid}))
+        self.assertEqual(response.status_code, 200)
+        sheet = pd.read_excel(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(sheet['SGPA'].fillna('').astype(str).tolist(), ['3.6', '', ''])
+        self.assertEqual(
+            sheet['Status'].fillna('').tolist(),
+            ['', *['Failed: Lease expired after the maximum number of attempts'] * 2],
+        )
+
+    def test_locked_database_and_lost_races_are_retried(self):
+        claim = workers._claim
+        outcomes = [OperationalError('database is locked'), []]
+
+        def contended(*args):
+            # A locked database, then a race lost to another worker
+            if outcomes:
+                outcome = outcomes.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+            return claim(*args)
+
+        with mock.patch.object(workers, '_claim', side_effect=contended), \
+                mock.patch.object(workers.time, 'sleep') as sleep:
+            items = claim_items('worker-1')
+        self.assertEqual(len(items), 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_claim_is_empty_only_when_nothing_is_claimable(self):
+        claim_items('worker-1')
+        with mock.patch.object(workers.time, 'sleep') as sleep:
+            self.assertEqual(claim_items('worker-2'), [])
+        sleep.assert_not_called()
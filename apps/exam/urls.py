@@ -1,6 +1,15 @@
-from django.urls import path
-from .views import ExamAutomationView
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .api import ExamTimetableViewSet, ExamResultJobViewSet, PortalCatalogView
+from .views import ExamAutomationView, ExamResultsView
+
+router = DefaultRouter()
+router.register(r'timetables', ExamTimetableViewSet, basename='exam-timetable')
+router.register(r'jobs', ExamResultJobViewSet, basename='exam-result-job')
 
 urlpatterns = [
     path('process/', ExamAutomationView.as_view(), name='process-exam'),
+    path('results/', ExamResultsView.as_view(), name='exam-results'),
+    path('catalog/', PortalCatalogView.as_view(), name='exam-portal-catalog'),
+    path('', include(router.urls)),
 ]
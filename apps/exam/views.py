@@ -1,14 +1,30 @@
 import os
+import json
 import asyncio
-from django.http import FileResponse, JsonResponse
+from itertools import chain
+from django.http import FileResponse, JsonResponse, StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
 from rest_framework.response import Response
 from rest_framework import status
 from django.conf import settings
-from .automation import process_exam_results
+from .automation import process_exam_results, stream_exam_results
+from .services.catalog import UnknownOptionError
 from asgiref.sync import async_to_sync
 
+def extract_exam_params(request):
+    """Portal form parameters shared by the exam processing endpoints."""
+    return {
+        'result_type': request.data.get('result_type'),
+        'year': request.data.get('year'),
+        'session': request.data.get('session'),
+        'semester': request.data.get('semester'),
+        'program': request.data.get('program'),
+    }
+
 class ExamAutomationView(APIView):
     parser_classes = (MultiPartParser, FormParser)
 
@@ -18,13 +34,7 @@ class ExamAutomationView(APIView):
             return Response({"error": "No file provided"}, status=status.HTTP_400_BAD_REQUEST)
 
         # Extract parameters
-        params = {
-            'result_type': request.data.get('result_type'),
-            'year': request.data.get('year'),
-            'session': request.data.get('session'),
-            'semester': request.data.get('semester'),
-            'program': request.data.get('program'),
-        }
+        params = extract_exam_params(request)
         
         delay = float(request.data.get('delay', 1))
 
@@ -41,5 +51,69 @@ class ExamAutomationView(APIView):
             response = FileResponse(output_buffer, as_attachment=True, filename=filename)
             return response
 
+        except UnknownOptionError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+class NDJSONRenderer(BaseRenderer):
+    """Renders a response as one NDJSON line, so errors reach clients that
+    only accept ``application/x-ndjson`` in the shape of the stream's own
+    error line."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return (json.dumps(data) + '\n').encode()
+
+class ExamResultsView(APIView):
+    """
+    Same processing as ExamAutomationView, returned as structured JSON
+    instead of a workbook.
+
+    With ``stream=true`` (or ``Accept: application/x-ndjson``) each student's
+    result is written as one NDJSON line as soon as it is scraped, so clients
+    can render incrementally. Otherwise a single JSON document is returned
+    once all rows are processed.
+    """
+    parser_classes = (MultiPartParser, FormParser)
+    renderer_classes = (*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer)
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        file_obj = request.FILES.get('file')
+        if not file_obj:
+            return Response({"error": "No file provided"}, status=status.HTTP_400_BAD_REQUEST)
+
+        params = extract_exam_params(request)
+        delay = float(request.data.get('delay', 1))
+        stream = (str(request.data.get('stream', '')).lower() == 'true'
+                  or 'application/x-ndjson' in request.headers.get('Accept', ''))
+
+        try:
+            results = stream_exam_results(file_obj.read(), params, delay=delay)
+            # Pull the first row eagerly so setup errors (bad file, unknown
+            # program, portal down) still produce a proper status code.
+            first = next(results, None)
+        except (UnknownOptionError, ValueError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        results = chain([first], results) if first is not None else iter(())
+
+        if not stream:
+            try:
+                rows = list(results)
+            except Exception as e:
+                return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return Response({'count': len(rows), 'results': rows})
+
+        def ndjson():
+            try:
+                for result in results:
+                    yield json.dumps(result) + '\n'
+            except Exception as e:
+                yield json.dumps({'error': str(e)}) + '\n'
+
+        return StreamingHttpResponse(ndjson(), content_type='application/x-ndjson')
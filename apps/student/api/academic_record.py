@@ -1,10 +1,14 @@
-from rest_framework import viewsets
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from ..models.academic_record import AcademicRecord
+from ..models.student import Student
 from ..serializers.academic_record import (
     AcademicRecordCreateSerializer,
     AcademicRecordUpdateSerializer,
     AcademicRecordResponseSerializer
 )
+from ..services.gpa import recompute_academic_records
 
 class AcademicRecordViewSet(viewsets.ModelViewSet):
     queryset = AcademicRecord.objects.all()
@@ -16,3 +20,35 @@ class AcademicRecordViewSet(viewsets.ModelViewSet):
         elif self.action in ['update', 'partial_update']:
             return AcademicRecordUpdateSerializer
         return AcademicRecordResponseSerializer
+
+    @action(detail=False, methods=['post'])
+    def recompute(self, request):
+        """Recompute SGPA/CGPA from subject results for a cohort.
+
+        Accepts ``program`` and optional ``batch`` to select a cohort through
+        enrollments, and/or a list of ``students`` ukids. With no filters the
+        whole institution is recomputed.
+        """
+        program = request.data.get('program')
+        batch = request.data.get('batch')
+        student_ukids = request.data.get('students')
+
+        if batch and not program:
+            return Response(
+                {'error': 'program is required when batch is given'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        students = None
+        if program or student_ukids:
+            students = Student.objects.all()
+            if program:
+                students = students.filter(enrollments__program=program)
+                if batch:
+                    students = students.filter(enrollments__batch=batch)
+            if student_ukids:
+                students = students.filter(ukid__in=student_ukids)
+            students = students.values('pk')
+
+        updated = recompute_academic_records(students)
+        return Response({'records_updated': updated})
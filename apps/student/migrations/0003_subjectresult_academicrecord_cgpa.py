@@ -0,0 +1,128 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:28
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def drop_duplicate_academic_records(apps, schema_editor):
+    """Keep the latest record of each (student, semester) so the uniqueness
+    below can be added to databases that already hold duplicates."""
+    AcademicRecord = apps.get_model("student", "AcademicRecord")
+    seen = set()
+    duplicates = []
+    for pk, student_id, semester in AcademicRecord.objects.order_by(
+        "student_id", "semester", "-updated_at", "-id"
+    ).values_list("id", "student_id", "semester"):
+        if (student_id, semester) in seen:
+            duplicates.append(pk)
+        else:
+            seen.add((student_id, semester))
+    for i in range(0, len(duplicates), 500):
+        AcademicRecord.objects.filter(pk__in=duplicates[i : i + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("student", "0002_alter_student_registration_number_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="academicrecord",
+            name="cgpa",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=4, null=True
+            ),
+        ),
+        migrations.RunPython(
+            drop_duplicate_academic_records, migrations.RunPython.noop
+        ),
+        migrations.AlterUniqueTogether(
+            name="academicrecord",
+            unique_together={("student", "semester")},
+        ),
+        migrations.CreateModel(
+            name="SubjectResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ukid",
+                    models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("created_by", models.IntegerField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("updated_by", models.IntegerField(blank=True, null=True)),
+                ("subject_name", models.CharField(max_length=255)),
+                (
+                    "marks_obtained",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=5, null=True
+                    ),
+                ),
+                (
+                    "maximum_marks",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=5, null=True
+                    ),
+                ),
+                (
+                    "grade",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("A+", "A+"),
+                            ("A", "A"),
+                            ("B+", "B+"),
+                            ("B", "B"),
+                            ("C+", "C+"),
+                            ("C", "C"),
+                            ("D", "D"),
+                            ("F", "F"),
+                            ("I", "Incomplete"),
+                        ],
+                        max_length=2,
+                        null=True,
+                    ),
+                ),
+                ("credit_hours", models.IntegerField(default=3)),
+                ("semester", models.CharField(max_length=20)),
+                (
+                    "attempt_type",
+                    models.CharField(
+                        choices=[("regular", "Regular"), ("re_exam", "Re-examination")],
+                        default="regular",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "student",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="subject_results",
+                        to="student.student",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "subject_results",
+                "ordering": ["-semester", "subject_name"],
+                "indexes": [
+                    models.Index(
+                        fields=["student", "semester"],
+                        name="subject_res_student_ef3ee3_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -4,4 +4,5 @@ from .guardian import Guardian
 from .enrollment import Enrollment, EnrollmentStatus
 from .enrollment_history import EnrollmentHistory
 from .academic_record import AcademicRecord
-from .document import Document, DocumentType
\ No newline at end of file
+from .document import Document, DocumentType
+from .subject_result import SubjectResult, AttemptType, GradeChoices
@@ -8,6 +8,7 @@ class AcademicRecord(BaseModel):
     student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name='academic_records')
     semester = models.CharField(max_length=20)
     gpa = models.DecimalField(max_digits=4, decimal_places=2)
+    cgpa = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
     total_credits = models.IntegerField()
     remarks = models.TextField(blank=True, null=True)
 
@@ -16,6 +17,10 @@ class AcademicRecord(BaseModel):
             if self.gpa < 0 or self.gpa > 4.00:
                 raise ValidationError('GPA must be between 0.00 and 4.00.')
         
+        if self.cgpa is not None:
+            if self.cgpa < 0 or self.cgpa > 4.00:
+                raise ValidationError('CGPA must be between 0.00 and 4.00.')
+
         if self.total_credits is not None and self.total_credits < 0:
             raise ValidationError('Total credits cannot be negative.')
 
@@ -26,3 +31,4 @@ class AcademicRecord(BaseModel):
     class Meta(): # type: ignore
         db_table = 'academic_records'
         ordering = ['-semester']
+        unique_together = [['student', 'semester']]
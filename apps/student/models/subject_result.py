@@ -48,4 +48,7 @@ class SubjectResult(BaseModel):
 
     class Meta: # type: ignore
         db_table = 'subject_results'
-        ordering = ['-semester', 'subject_name']
\ No newline at end of file
+        ordering = ['-semester', 'subject_name']
+        indexes = [
+            models.Index(fields=['student', 'semester']),
+        ]
\ No newline at end of file
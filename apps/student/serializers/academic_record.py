@@ -54,7 +54,7 @@ class AcademicRecordResponseSerializer(serializers.ModelSerializer):
     class Meta:
         model = AcademicRecord
         fields = [
-            'ukid', 'student', 'semester', 'gpa', 'total_credits', 'remarks', 
+            'ukid', 'student', 'semester', 'gpa', 'cgpa', 'total_credits', 'remarks', 
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['ukid', 'created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['ukid', 'cgpa', 'created_at', 'updated_at']
\ No newline at end of file
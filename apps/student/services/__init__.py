@@ -0,0 +1,7 @@
+from .gpa import (
+    GRADE_POINTS,
+    compute_gpa,
+    load_results,
+    recompute_academic_records,
+    sgpa_from_grades,
+)
@@ -0,0 +1,143 @@
+"""
+SGPA/CGPA computation over ``SubjectResult`` rows.
+
+Results for a whole cohort are loaded with a single query into a DataFrame,
+grades are mapped to grade points column-wise and the per-semester and
+cumulative averages are produced with grouped sums, so recomputing a
+faculty never touches rows one at a time.
+"""
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from django.db import transaction
+
+from ..models import AcademicRecord, AttemptType, GradeChoices, SubjectResult
+
+GRADE_POINTS = {
+    GradeChoices.A_PLUS: 4.0,
+    GradeChoices.A: 3.6,
+    GradeChoices.B_PLUS: 3.2,
+    GradeChoices.B: 2.8,
+    GradeChoices.C_PLUS: 2.4,
+    GradeChoices.C: 2.0,
+    GradeChoices.D: 1.6,
+    GradeChoices.F: 0.0,
+}
+
+# Grades that carry no grade points and are left out of the average.
+NON_GPA_GRADES = {GradeChoices.I}
+
+RESULT_COLUMNS = [
+    'student_id', 'semester', 'subject_name', 'grade',
+    'credit_hours', 'attempt_type', 'created_at',
+]
+GPA_COLUMNS = ['student_id', 'semester', 'sgpa', 'cgpa', 'credit_hours']
+
+_POINTS = pd.Series({str(grade.value): points for grade, points in GRADE_POINTS.items()})
+
+
+def grade_points(grades):
+    """Map an array of grade letters to grade points (NaN when unknown)."""
+    return pd.Series(grades, dtype=object).map(_POINTS).to_numpy(dtype=float)
+
+
+def sgpa_from_grades(grades, credits):
+    """
+    SGPA for one semester given parallel sequences of grades and credits.
+
+    Returns None when a grade or credit cannot be interpreted or nothing is
+    gradable, so callers can tell "no answer" apart from a 0.00 SGPA.
+    """
+    grades = pd.Series(list(grades), dtype=object).astype(str).str.strip()
+    credits = pd.to_numeric(pd.Series(list(credits), dtype=object), errors='coerce')
+    counted = ~grades.isin([str(grade.value) for grade in NON_GPA_GRADES])
+
+    points = grade_points(grades[counted])
+    weights = credits[counted].to_numpy(dtype=float)
+    if np.isnan(points).any() or np.isnan(weights).any() or weights.sum() <= 0:
+        return None
+    return round(float(points @ weights / weights.sum()), 2)
+
+
+def load_results(students=None):
+    """Load the subject results of ``students`` (all when None) in one query."""
+    queryset = SubjectResult.objects.order_by()
+    if students is not None:
+        queryset = queryset.filter(student__in=students)
+    return pd.DataFrame.from_records(
+        queryset.values_list(*RESULT_COLUMNS), columns=RESULT_COLUMNS
+    )
+
+
+def _semester_order(semesters):
+    """Numeric sort key for free-text semester labels such as "3" or "Semester 3"."""
+    return semesters.astype(str).str.extract(r'(\d+)', expand=False).astype(float)
+
+
+def compute_gpa(results):
+    """
+    Compute SGPA and cumulative CGPA per student and semester.
+
+    ``results`` is a frame shaped like :func:`load_results`. A re-examination
+    supersedes the regular attempt (and earlier re-exams) of the same
+    subject in the same semester once it is graded. Ungraded and incomplete
+    subjects are ignored; semesters with no graded credits produce no row.
+    """
+    if results.empty:
+        return pd.DataFrame(columns=GPA_COLUMNS)
+
+    # An attempt not yet graded (e.g. a pending re-exam) supersedes nothing
+    results = results[results['grade'].fillna('').astype(str).str.strip() != '']
+    df = results.assign(
+        _attempt=(results['attempt_type'] == AttemptType.RE_EXAM).astype(int)
+    )
+    df = df.sort_values(['_attempt', 'created_at'], kind='stable').drop_duplicates(
+        ['student_id', 'semester', 'subject_name'], keep='last'
+    )
+
+    df = df.assign(points=grade_points(df['grade']), credit_hours=df['credit_hours'].astype(float))
+    df = df[df['points'].notna() & (df['credit_hours'] > 0)]
+    if df.empty:
+        return pd.DataFrame(columns=GPA_COLUMNS)
+    df = df.assign(quality=df['points'] * df['credit_hours'])
+
+    semesters = (
+        df.groupby(['student_id', 'semester'], sort=False)[['quality', 'credit_hours']]
+        .sum()
+        .reset_index()
+    )
+    semesters['_order'] = _semester_order(semesters['semester'])
+    semesters = semesters.sort_values(['student_id', '_order', 'semester'], na_position='last')
+
+    cumulative = semesters.groupby('student_id')[['quality', 'credit_hours']].cumsum()
+    semesters['sgpa'] = (semesters['quality'] / semesters['credit_hours']).round(2)
+    semesters['cgpa'] = (cumulative['quality'] / cumulative['credit_hours']).round(2)
+    return semesters[GPA_COLUMNS].reset_index(drop=True)
+
+
+def recompute_academic_records(students=None, batch_size=1000):
+    """
+    Recompute SGPA/CGPA for ``students`` (all when None) and upsert their
+    ``AcademicRecord`` rows. Returns the number of records written.
+    """
+    gpa = compute_gpa(load_results(students))
+    records = [
+        AcademicRecord(
+            student_id=row.student_id,
+            semester=row.semester,
+            gpa=Decimal(f'{row.sgpa:.2f}'),
+            cgpa=Decimal(f'{row.cgpa:.2f}'),
+            total_credits=int(row.credit_hours),
+        )
+        for row in gpa.itertuples(index=False)
+    ]
+    with transaction.atomic():
+        AcademicRecord.objects.bulk_create(
+            records,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['student', 'semester'],
+            update_fields=['gpa', 'cgpa', 'total_credits', 'updated_at'],
+        )
+    return len(records)
@@ -0,0 +1,75 @@
+from datetime import date
+from django.test import TestCase
+from apps.student.models import AcademicRecord, AttemptType, Student, SubjectResult
+from apps.student.services.gpa import compute_gpa, load_results, recompute_academic_records, sgpa_from_grades
+
+
+class GpaTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = Student.objects.create(
+            first_name='Asha', last_name='Rai', date_of_birth=date(2004, 5, 1), gender='female',
+            email='asha@example.com', phone_number='9800000000', address='Ward 1', city='Dharan',
+            state='Koshi', postal_code='56700', country='Nepal', enrollment_date=date(2022, 9, 1),
+        )
+
+    def add_result(self, semester, subject, grade, credits=3, attempt=AttemptType.REGULAR):
+        return SubjectResult.objects.create(
+            student=self.student, semester=semester, subject_name=subject, grade=grade,
+            credit_hours=credits, attempt_type=attempt,
+        )
+
+    def gpa(self):
+        return [
+            (row.semester, row.sgpa, row.cgpa, row.credit_hours)
+            for row in compute_gpa(load_results([self.student])).itertuples(index=False)
+        ]
+
+    def test_re_exam_supersedes_the_regular_attempt(self):
+        # Entered out of order: the re-exam wins over the regular attempt regardless
+        self.add_result('Semester 1', 'Physics', 'B', attempt=AttemptType.RE_EXAM)
+        self.add_result('Semester 1', 'Physics', 'F')
+        self.add_result('Semester 1', 'Maths', 'A+')
+        self.assertEqual(self.gpa(), [('Semester 1', 3.4, 3.4, 6.0)])
+
+        # A later re-exam supersedes the earlier one
+        self.add_result('Semester 1', 'Physics', 'A', attempt=AttemptType.RE_EXAM)
+        self.assertEqual(self.gpa(), [('Semester 1', 3.8, 3.8, 6.0)])
+
+    def test_pending_re_exam_keeps_the_graded_attempt(self):
+        self.add_result('Semester 1', 'Physics', 'C')
+        self.add_result('Semester 1', 'Maths', 'A+')
+        # Registered for a re-exam, not graded yet
+        self.add_result('Semester 1', 'Physics', None, attempt=AttemptType.RE_EXAM)
+        self.assertEqual(self.gpa(), [('Semester 1', 3.0, 3.0, 6.0)])
+
+        self.add_result('Semester 1', 'Physics', 'B+', attempt=AttemptType.RE_EXAM)
+        self.assertEqual(self.gpa(), [('Semester 1', 3.6, 3.6, 6.0)])
+
+    def test_cgpa_accumulates_in_semester_order(self):
+        self.add_result('Semester 10', 'Thesis', 'A+', credits=6)
+        self.add_result('Semester 2', 'Chemistry', 'C', credits=2)
+        self.add_result('Semester 1', 'Maths', 'A', credits=4)
+        # Incomplete subjects carry no grade points; a semester of them has no row
+        self.add_result('Semester 2', 'Biology', 'I')
+        self.add_result('Semester 3', 'Ethics', 'I')
+
+        self.assertEqual(self.gpa(), [
+            ('Semester 1', 3.6, 3.6, 4.0),
+            ('Semester 2', 2.0, 3.07, 2.0),
+            ('Semester 10', 4.0, 3.53, 6.0),
+        ])
+
+    def test_recompute_upserts_one_record_per_semester(self):
+        self.add_result('Semester 1', 'Physics', 'F')
+        self.assertEqual(recompute_academic_records([self.student]), 1)
+        self.add_result('Semester 1', 'Physics', 'A+', attempt=AttemptType.RE_EXAM)
+        recompute_academic_records([self.student])
+
+        record = AcademicRecord.objects.get(student=self.student)
+        self.assertEqual((str(record.gpa), str(record.cgpa), record.total_credits), ('4.00', '4.00', 3))
+
+    def test_sgpa_from_grades(self):
+        self.assertEqual(sgpa_from_grades(['A+', 'C', 'I'], [3, 1, 3]), 3.5)
+        self.assertIsNone(sgpa_from_grades(['A+', 'Z'], [3, 3]))
+        self.assertIsNone(sgpa_from_grades(['I'], [3]))